@@ -0,0 +1,72 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import dates
+import render
+
+
+BATCH_DIR = './Calendar/archive'
+DEFAULT_FORMATS = ['png@100', 'png@300', 'svg', 'webp@150']
+
+
+def parse_format(spec):
+    """Split a format spec like 'png@300' into ('png', 300); vector formats ignore the DPI"""
+    ext, _, dpi = spec.partition('@')
+    return ext.lower(), int(dpi) if dpi else 100
+
+
+def output_path(out_dir, year, spec):
+    """Where the calendar for a season year and format is written"""
+    ext, dpi = parse_format(spec)
+    suffix = '' if ext in ('svg', 'pdf') else f'_{dpi}dpi'
+    return os.path.join(out_dir, str(year), f'sports_leagues_{year}{suffix}.{ext}')
+
+
+def _warm_worker():
+    """Load fonts, glyph outlines and the Agg renderer once per worker process"""
+    import io
+    data = dates.get_calendar_data()
+    for phases in data['Phases']:
+        for phase_name, _, _ in phases:
+            render.label_path(phase_name)
+    render.render_fast(data, datetime.now(), io.BytesIO(), dpi=10)
+
+
+def _render_job(job):
+    """Render one (year, format) calendar and return its path"""
+    year, spec, out_dir = job
+    ext, dpi = parse_format(spec)
+    path = output_path(out_dir, year, spec)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    today = datetime.now()
+    # Past and future seasons are drawn without a today marker
+    now = today if year == today.year else datetime(year, 7, 1)
+    dates.render_calendar(path, now=now, dpi=dpi, show_today=year == today.year)
+    return path
+
+
+def render_batch(years, formats=DEFAULT_FORMATS, out_dir=BATCH_DIR, max_workers=None):
+    """Render every year in formats across a process pool, returning (paths, images per second)"""
+    jobs = [(year, spec, out_dir) for year in years for spec in formats]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_worker) as pool:
+        paths = list(pool.map(_render_job, jobs))
+    elapsed = time.perf_counter() - start
+    return paths, len(paths) / elapsed if elapsed else float('inf')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render the static calendar for a range of seasons')
+    parser.add_argument('start_year', type=int)
+    parser.add_argument('end_year', type=int, help='inclusive')
+    parser.add_argument('--formats', nargs='+', default=DEFAULT_FORMATS,
+                        help="e.g. png@100 png@300 svg webp@150")
+    parser.add_argument('--out', default=BATCH_DIR)
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    paths, rate = render_batch(range(args.start_year, args.end_year + 1), args.formats, args.out, args.jobs)
+    print(f"✓ Rendered {len(paths)} calendars into {args.out} at {rate:.1f} images/s")
@@ -1,120 +1,99 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from datetime import datetime
-import calendar
-
-# Clear terminal 
+import argparse
+import glob
+import hashlib
 import os
-os.system('cls' if os.name == 'nt' else 'clear')
-
-now = datetime.now()
-current_year = now.year
-current_month = now.month
-current_month_str = calendar.month_name[current_month]
-
-year = 12
-data = {
-    'League': ['NBA', 'NHL', 'NFL', 'MLB'],
-    'Phases': [
-        [ # NBA
-            # Early September to Mid September
-            ('Pre\nSeason', 10.0, 10.5), 
-            # Mid September to Early April
-            ('Regular Season', 10.5, 4.25 + year), 
-            # Early April to Mid June
-            ('The Finals', 4.5 + year, 6.5 + year)
+import shutil
+import time
+
+OUTPUT_PATH = './Calendar/sports_leagues_dual_timeline.png'
+
+CALENDAR_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(CALENDAR_DIR, '.cache')
+
+
+def get_calendar_data():
+    """Season phases for each league, in months from January of last year"""
+    year = 12
+    return {
+        'League': ['NBA', 'NHL', 'NFL', 'MLB'],
+        'Phases': [
+            [ # NBA
+                # Early September to Mid September
+                ('Pre\nSeason', 10.0, 10.5),
+                # Mid September to Early April
+                ('Regular Season', 10.5, 4.25 + year),
+                # Early April to Mid June
+                ('The Finals', 4.5 + year, 6.5 + year)
+                ],
+            [ # NHL
+                ('Pre\nSeason', 9.75, 10.2),
+                ('Regular Season', 10.2, 4.5 + year),
+                ('Stanley Cup', 4.5 + year, 6.5 + year)
             ],
-        [ # NHL
-            ('Pre\nSeason', 9.75, 10.2), 
-            ('Regular Season', 10.2, 4.5 + year), 
-            ('Stanley Cup', 4.5 + year, 6.5 + year)
-        ],
-        [ # NFL
-            ('Pre\nSeason', 8.0, 9.0), 
-            ('Regular Season', 9.0, 1.2 + year), 
-            ('Super\nBowl', 1.5 + year, 2.5 + year)
-        ],
-        [ # MLB
-            ('Spring\nTraining', 2.75, 4.0), 
-            ('Regular Season', 4.0, 10.25), 
-            ('World\nSeries', 10.0, 11.25)
+            [ # NFL
+                ('Pre\nSeason', 8.0, 9.0),
+                ('Regular Season', 9.0, 1.2 + year),
+                ('Super\nBowl', 1.5 + year, 2.5 + year)
+            ],
+            [ # MLB
+                ('Spring\nTraining', 2.75, 4.0),
+                ('Regular Season', 4.0, 10.25),
+                ('World\nSeries', 10.0, 11.25)
+            ]
         ]
-    ]
-}
-
-# --- Plotting ---
-fig, ax = plt.subplots(figsize=(16, 5.5))
-colors = {'NBA': "#C98613", 'NHL': "#A2AAAD", 'NFL': "#82CD32", 'MLB': "#217EE1A0"}
-bar_height = 1
-
-# Main loop to draw two seasons for each league
-for i, league in enumerate(data['League']):
-    phases = data['Phases'][i]
-    y_center = i * 2  # Calculate a central y-position for the league group
-
-    # --- Plot Previous Season ---
-    for phase_name, start, end in phases:
-        ax.barh(y=y_center, width=end - start, left=start, height=bar_height,
-                color=colors[league], edgecolor='black', alpha=0.3)
-        ax.text(start + (end - start) / 2, y_center, phase_name,
-                ha='center', va='center', color='black', fontweight='bold', fontsize=9)
-
-    # --- Plot Current Season ---
-    for phase_name, start, end in phases:
-        start_next, end_next = start + 12, end + 12
-        ax.barh(y=y_center, width=end_next - start_next, left=start_next, height=bar_height,
-                color=colors[league], edgecolor='black', alpha=0.5)
-        ax.text(start_next + (end_next - start_next) / 2, y_center, phase_name,
-                ha='center', va='center', color='black', fontweight='bold', fontsize=9)
-
-
-# --- Formatting the Chart ---
-ax.set_yticks([i * 2 for i in range(len(data['League']))])
-ax.set_yticklabels(data['League'], fontsize=16, weight='bold')
-ax.invert_yaxis()
-
-tick_positions = range(1, 37)
-tick_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'] * 3
-ax.set_xticks(tick_positions)
-ax.set_xticklabels(tick_labels)
-ax.set_xlim(2, 31)
-ax.set_ylim(len(data['League']) * 2 - 1, -2.5) # (down,up)
-
-# Add annotations for calendar years
-y = -0.5  # Position for year annotations
-y_offset = 0.1  # Offset for the next year label
-x=13
-ax.axvline(x=x, color='brown', linestyle='-', linewidth=2)
-ax.text(x + 0.15, y-y_offset, f'Start of {current_year} →', color='grey', ha='left', fontsize=12, style='italic')
-ax.text(x - 0.15, y-y_offset, f'← End of {current_year - 1}', color='grey', ha='right', fontsize=12, style='italic')
-
-x=25
-ax.axvline(x=x, color='brown', linestyle='-', linewidth=2)
-ax.text(x + 0.15, y-y_offset, f'Start of {current_year+1} →', color='grey', ha='left', fontsize=12, style='italic')
-ax.text(x - 0.15, y-y_offset, f'← End of {current_year}', color='grey', ha='right', fontsize=12, style='italic')
-
-x = now.month + (now.day - 1) / 30 + 12
-ax.axvline(x=x, color='red', linestyle='--', linewidth=2)
-ax.text(x - 0.15, y-1, 'Today:', color='black', ha='right', fontsize=12, style='italic')
-ax.text(x + 0.15, y-1, f'{current_month_str} {now.day}, {current_year}', color='black', ha='left', fontsize=12, style='italic')
-
-# --- Final Touches ---
-plt.xlabel(f'Years {current_year-1}, {current_year}, {current_year + 1}', fontsize=12)
-plt.ylabel('League', fontsize=14, weight='bold')
-plt.title('Timeline of Major Sports Leagues', fontsize=18, pad=10)
-plt.grid(axis='x', linestyle='--', alpha=0.7)
-
-# Create a custom legend
-legend_elements = [mpatches.Patch(facecolor=colors[league], edgecolor='black', label=league) for league in data['League']]
-plt.legend(handles=legend_elements, loc='center', bbox_to_anchor=(0.131, 0.94),
-          ncol=len(data['League']), fancybox=True, shadow=True, title="Leagues")
-
-plt.tight_layout(rect=[0.05, 0, 1, 0.95])
-
-# --- Save and Show the plot ---
-plt.savefig('./Calendar/sports_leagues_dual_timeline.png', dpi=300, bbox_inches='tight')
-
-print("Plot saved as sports_leagues_dual_timeline.png")
-# To display the plot in an interactive window, uncomment the following line:
-# plt.show()
\ No newline at end of file
+    }
+
+
+def cache_key(data, now, dpi, fast, show_today, ext):
+    """Hash everything that affects the rendered image, including the renderer's source"""
+    h = hashlib.sha256()
+    with open(os.path.join(CALENDAR_DIR, 'render.py'), 'rb') as f:
+        h.update(f.read())
+    # Year labels depend on the year; the today marker on its x position and label
+    today = (now.month + (now.day - 1) / 30 + 12, now.month, now.day) if show_today else None
+    h.update(repr((data, now.year, today, dpi, fast, ext)).encode())
+    return h.hexdigest()[:20]
+
+
+def render_calendar(path=OUTPUT_PATH, now=None, dpi=300, fast=True, show_today=True, use_cache=True):
+    """Render the dual-season calendar to path; the format follows the file extension
+
+    Returns (path, cached). A cached image with the same key is copied to path
+    without importing or running matplotlib. Cached images are named after the
+    year and render options, and a new one replaces older renders with the
+    same options, so the daily today marker does not grow the cache.
+    """
+    now = now or datetime.now()
+    data = get_calendar_data()
+    ext = os.path.splitext(path)[1].lstrip('.').lower() or 'png'
+    options = f"{now.year}-{dpi}dpi-{'fast' if fast else 'legacy'}-{'today' if show_today else 'static'}"
+    cached_path = os.path.join(CACHE_DIR, f'{options}-{cache_key(data, now, dpi, fast, show_today, ext)}.{ext}')
+    if use_cache and os.path.exists(cached_path):
+        if os.path.abspath(path) != cached_path:
+            shutil.copyfile(cached_path, path)
+        return path, True
+
+    import render  # matplotlib is only imported on a cache miss
+    (render.render_fast if fast else render.render_legacy)(data, now, path, dpi, show_today)
+    if use_cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for stale in glob.glob(os.path.join(CACHE_DIR, f'{options}-*.{ext}')):
+            os.remove(stale)
+        shutil.copyfile(path, cached_path)
+    return path, False
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render the static sports league calendar')
+    parser.add_argument('--legacy', action='store_true', help='per-phase artists and a tight bounding box')
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    parser.add_argument('--no-cache', action='store_true', help='always re-render')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    path, cached = render_calendar(args.output, dpi=args.dpi, fast=not args.legacy, use_cache=not args.no_cache)
+    status = 'from cache' if cached else 'rendered'
+    print(f"Plot saved as {os.path.basename(path)} ({status} in {time.perf_counter() - start:.3f}s)")
+    # To display the plot in an interactive window, use plt.show() with an interactive backend
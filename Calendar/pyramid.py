@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import time
+
+from PIL import Image
+
+import dates
+
+
+PYRAMID_DIR = os.path.join(dates.CALENDAR_DIR, 'pyramid')
+# Image URLs in the manifest are relative to the site root, the repository root
+SITE_ROOT = os.path.dirname(dates.CALENDAR_DIR)
+MANIFEST_NAME = 'manifest.json'
+PRINT_DPI = 300
+
+# Target widths in pixels; 'print' keeps the full-resolution rasterization
+VARIANTS = [
+    ('thumb', 400),
+    ('mobile', 800),
+    ('desktop', 1600),
+    ('print', None),
+]
+
+
+def render_pyramid(out_dir=PYRAMID_DIR, now=None, fmt='png', base=None):
+    """Rasterize the calendar once at print DPI and derive smaller variants by downsampling
+
+    Writes one image per variant plus a manifest with the srcset, and returns the
+    manifest. base is the URL the images are published under, relative to the
+    site root; by default, out_dir's own path relative to SITE_ROOT.
+    """
+    if base is None:
+        base = os.path.relpath(os.path.abspath(out_dir), SITE_ROOT)
+        if base.startswith('..'):
+            raise ValueError(f"{out_dir} is outside the site; pass the URL it is published under as base")
+    os.makedirs(out_dir, exist_ok=True)
+    master_path = os.path.join(out_dir, 'sports_leagues_timeline-master.png')
+    dates.render_calendar(master_path, now=now, dpi=PRINT_DPI)
+
+    variants = []
+    with Image.open(master_path) as master:
+        master.load()
+        for name, width in VARIANTS:
+            if width is None or width >= master.width:
+                image = master
+            else:
+                height = round(master.height * width / master.width)
+                # reducing_gap does a fast integer reduce first, then Lanczos for the last step
+                image = master.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+            file_name = f'sports_leagues_timeline-{image.width}w.{fmt}'
+            variants.append({'name': name, 'file': file_name, 'width': image.width, 'height': image.height})
+            if image is master and fmt == 'png':
+                continue
+            image.save(os.path.join(out_dir, file_name))
+    full_size = next(v['file'] for v in variants if v['width'] == master.width)
+    if fmt == 'png':
+        os.replace(master_path, os.path.join(out_dir, full_size))
+    else:
+        os.remove(master_path)
+
+    manifest = {
+        'base': base.replace(os.sep, '/').strip('/'),
+        'variants': variants,
+        'default': next(v['file'] for v in variants if v['name'] == 'desktop'),
+        'srcset': ', '.join(f"{v['file']} {v['width']}w" for v in variants),
+    }
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render the calendar at thumbnail, mobile, desktop and print sizes')
+    parser.add_argument('--out', default=PYRAMID_DIR)
+    parser.add_argument('--format', default='png', choices=['png', 'webp'])
+    parser.add_argument('--base', default=None, help='URL of --out relative to the site root')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = render_pyramid(args.out, fmt=args.format, base=args.base)
+    print(f"✓ Wrote {len(manifest['variants'])} variants and {MANIFEST_NAME} to {args.out} "
+          f"in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,148 @@
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; the calendar is only ever saved to a file
+import matplotlib.pyplot as plt
+import matplotlib.patches as mpatches
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_rgba
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+from functools import lru_cache
+import calendar
+
+FIGSIZE = (16, 5.5)
+# The page size and axes margins that tight_layout(rect=[0.05, 0, 1, 0.95]) followed by
+# bbox_inches='tight' settle on for FIGSIZE, so the fast renderer skips both layout passes
+FAST_FIGSIZE = (15.1, 5.125)
+SUBPLOT_MARGINS = dict(left=0.0647, right=0.9877, bottom=0.1098, top=0.9163)
+
+colors = {'NBA': "#C98613", 'NHL': "#A2AAAD", 'NFL': "#82CD32", 'MLB': "#217EE1A0"}
+bar_height = 1
+# Bar opacity for the previous and current season
+season_alpha = [(0, 0.3), (12, 0.5)]
+
+
+def format_axes(fig, ax, data, now, show_today=True):
+    """Ticks, year markers, today marker, titles and legend shared by both renderers"""
+    current_year = now.year
+    current_month_str = calendar.month_name[now.month]
+
+    ax.set_yticks([i * 2 for i in range(len(data['League']))])
+    ax.set_yticklabels(data['League'], fontsize=16, weight='bold')
+    ax.invert_yaxis()
+
+    tick_positions = range(1, 37)
+    tick_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'] * 3
+    ax.set_xticks(tick_positions)
+    ax.set_xticklabels(tick_labels)
+    ax.set_xlim(2, 31)
+    ax.set_ylim(len(data['League']) * 2 - 1, -2.5) # (down,up)
+
+    # Add annotations for calendar years
+    y = -0.5  # Position for year annotations
+    y_offset = 0.1  # Offset for the next year label
+    x=13
+    ax.axvline(x=x, color='brown', linestyle='-', linewidth=2)
+    ax.text(x + 0.15, y-y_offset, f'Start of {current_year} →', color='grey', ha='left', fontsize=12, style='italic')
+    ax.text(x - 0.15, y-y_offset, f'← End of {current_year - 1}', color='grey', ha='right', fontsize=12, style='italic')
+
+    x=25
+    ax.axvline(x=x, color='brown', linestyle='-', linewidth=2)
+    ax.text(x + 0.15, y-y_offset, f'Start of {current_year+1} →', color='grey', ha='left', fontsize=12, style='italic')
+    ax.text(x - 0.15, y-y_offset, f'← End of {current_year}', color='grey', ha='right', fontsize=12, style='italic')
+
+    if show_today:
+        x = now.month + (now.day - 1) / 30 + 12
+        ax.axvline(x=x, color='red', linestyle='--', linewidth=2)
+        ax.text(x - 0.15, y-1, 'Today:', color='black', ha='right', fontsize=12, style='italic')
+        ax.text(x + 0.15, y-1, f'{current_month_str} {now.day}, {current_year}', color='black', ha='left', fontsize=12, style='italic')
+
+    # --- Final Touches ---
+    ax.set_xlabel(f'Years {current_year-1}, {current_year}, {current_year + 1}', fontsize=12)
+    ax.set_ylabel('League', fontsize=14, weight='bold')
+    ax.set_title('Timeline of Major Sports Leagues', fontsize=18, pad=10)
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+
+    # Create a custom legend
+    legend_elements = [mpatches.Patch(facecolor=colors[league], edgecolor='black', label=league) for league in data['League']]
+    ax.legend(handles=legend_elements, loc='center', bbox_to_anchor=(0.131, 0.94),
+              ncol=len(data['League']), fancybox=True, shadow=True, title="Leagues")
+
+
+def render_legacy(data, now, path, dpi=300, show_today=True):
+    """Draw one bar and one text artist per phase, then save with a tight bounding box"""
+    fig, ax = plt.subplots(figsize=FIGSIZE)
+
+    # Main loop to draw two seasons for each league
+    for i, league in enumerate(data['League']):
+        phases = data['Phases'][i]
+        y_center = i * 2  # Calculate a central y-position for the league group
+
+        for offset, alpha in season_alpha:
+            for phase_name, start, end in phases:
+                start_next, end_next = start + offset, end + offset
+                ax.barh(y=y_center, width=end_next - start_next, left=start_next, height=bar_height,
+                        color=colors[league], edgecolor='black', alpha=alpha)
+                ax.text(start_next + (end_next - start_next) / 2, y_center, phase_name,
+                        ha='center', va='center', color='black', fontweight='bold', fontsize=9)
+
+    format_axes(fig, ax, data, now, show_today)
+    plt.tight_layout(rect=[0.05, 0, 1, 0.95])
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+
+@lru_cache(maxsize=None)
+def label_path(text, size=9):
+    """Glyph outlines for a (possibly multi-line) bar label, centred on the origin, in points"""
+    prop = FontProperties(weight='bold')
+    lines = text.split('\n')
+    line_height = size * 1.2
+    vertices = []
+    codes = []
+    for n, line in enumerate(lines):
+        line_path = TextPath((0, 0), line, size=size, prop=prop)
+        extents = line_path.get_extents()
+        # Centre each line horizontally and stack lines around the bar's centre line
+        dy = (len(lines) - 1) / 2 * line_height - n * line_height - size * 0.35
+        shifted = line_path.transformed(Affine2D().translate(-(extents.x0 + extents.x1) / 2, dy))
+        vertices.append(shifted.vertices)
+        codes.append(shifted.codes)
+    return Path.make_compound_path(*(Path(v, c) for v, c in zip(vertices, codes)))
+
+
+def render_fast(data, now, path, dpi=300, show_today=True):
+    """Draw each league as one broken_barh collection and all bar labels as one path collection"""
+    fig = plt.figure(figsize=FAST_FIGSIZE)
+    fig.subplots_adjust(**SUBPLOT_MARGINS)
+    ax = fig.add_subplot()
+
+    label_paths = []
+    label_offsets = []
+    for i, league in enumerate(data['League']):
+        y_center = i * 2
+        spans = []
+        facecolors = []
+        edgecolors = []
+        for offset, alpha in season_alpha:
+            for phase_name, start, end in data['Phases'][i]:
+                spans.append((start + offset, end - start))
+                facecolors.append(to_rgba(colors[league], alpha))
+                edgecolors.append(to_rgba('black', alpha))
+                label_paths.append(label_path(phase_name))
+                label_offsets.append((start + offset + (end - start) / 2, y_center))
+        ax.broken_barh(spans, (y_center - bar_height / 2, bar_height),
+                       facecolors=facecolors, edgecolors=edgecolors)
+
+    # Label glyphs are sized in points and placed at data coordinates
+    labels = PathCollection(
+        label_paths, facecolors='black', edgecolors='none',
+        offsets=label_offsets, offset_transform=ax.transData,
+        transform=Affine2D().scale(1 / 72) + fig.dpi_scale_trans, zorder=3,
+    )
+    ax.add_collection(labels, autolim=False)
+
+    format_axes(fig, ax, data, now, show_today)
+    fig.savefig(path, dpi=dpi)
+    plt.close(fig)
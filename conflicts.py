@@ -0,0 +1,136 @@
+import time
+from collections import defaultdict
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+
+import games as game_store
+from ingest import file_hash
+from stadiums import EARTH_RADIUS_MILES, STADIUMS_CSV, haversine, load_stadiums, unit_vectors
+
+
+# Venues closer than this belong to the same metro, e.g. Anaheim joins Los Angeles and San Jose the Bay Area
+METRO_RADIUS_MILES = 30.0
+
+
+def metro_ids(radius_miles=METRO_RADIUS_MILES, path=STADIUMS_CSV):
+    """Metro number of every venue, merging venues within radius_miles of each other
+
+    Venues are hashed into cubic cells on the unit sphere one radius wide, so
+    only venues in neighbouring cells are compared; pairs in range are joined
+    with union-find, which also chains suburbs to their city. Recomputed when
+    the CSV changes.
+    """
+    return _metro_ids(radius_miles, path, file_hash(path))
+
+
+@lru_cache(maxsize=8)
+def _metro_ids(radius_miles, path, csv_hash):
+    stadiums = load_stadiums(path)
+    lat, lon = stadiums['Latitude'], stadiums['Longitude']
+    cell = 2 * np.sin(radius_miles / (2 * EARTH_RADIUS_MILES))
+    keys = [tuple(key) for key in np.floor(unit_vectors(lat, lon) / cell).astype(int)]
+    buckets = defaultdict(list)
+    for venue, key in enumerate(keys):
+        buckets[key].append(venue)
+
+    parent = list(range(len(keys)))
+
+    def find(venue):
+        while parent[venue] != venue:
+            parent[venue] = parent[parent[venue]]
+            venue = parent[venue]
+        return venue
+
+    for venue, key in enumerate(keys):
+        for offset in product((-1, 0, 1), repeat=3):
+            for other in buckets.get(tuple(k + o for k, o in zip(key, offset)), ()):
+                if other > venue and haversine(lat[venue], lon[venue], lat[other], lon[other]) <= radius_miles:
+                    parent[find(other)] = find(venue)
+
+    _, metro = np.unique([find(venue) for venue in range(len(keys))], return_inverse=True)
+    return metro
+
+
+def venue_ids(path=STADIUMS_CSV):
+    """Building number of every team's venue; teams sharing an arena share a number"""
+    return _venue_ids(path, file_hash(path))
+
+
+@lru_cache(maxsize=8)
+def _venue_ids(path, csv_hash):
+    stadiums = load_stadiums(path)
+    coords = np.round(np.stack([stadiums['Latitude'], stadiums['Longitude']], axis=1), 3)
+    _, venue = np.unique(coords, axis=0, return_inverse=True)
+    return venue.ravel()
+
+
+def find_conflicts(games, radius_miles=METRO_RADIUS_MILES):
+    """Every date on which two or more teams play home games in one metro
+
+    A single linear pass: games are bucketed by (date, metro) and by (date,
+    venue), and a bucket holds more than one team when its smallest and
+    largest home team differ, so a doubleheader alone is not a conflict. Only
+    the conflicting games are then sorted into their groups. Returns
+    (conflicts, members): conflicts has columns 'Date', 'Metro', 'Count',
+    'SharedVenue' (two of the teams play in the same building) and 'Start',
+    the offset of the conflict's games in members, which holds indices into
+    the game store.
+    """
+    home = games['Home'].astype(np.int64)
+    metros, venues = metro_ids(radius_miles), venue_ids()
+    n_metros, n_venues = metros.max() + 1, venues.max() + 1
+    first = games['Date'].min() if len(home) else np.datetime64('today', 'D')
+    day = (games['Date'] - first).astype(np.int64)
+    n_days = day.max() + 1 if len(home) else 0
+
+    def several_teams(key, size):
+        """Per bucket, whether it holds home games of more than one team"""
+        low = np.full(size, len(metros), dtype=np.int64)
+        high = np.full(size, -1, dtype=np.int64)
+        np.minimum.at(low, key, home)
+        np.maximum.at(high, key, home)
+        return low < high
+
+    metro_key = day * n_metros + metros[home]
+    venue_key = day * n_venues + venues[home]
+    clash = several_teams(metro_key, n_days * n_metros)
+    shared_game = several_teams(venue_key, n_days * n_venues)[venue_key]
+    shared = np.bincount(metro_key, weights=shared_game, minlength=len(clash)) > 0
+    counts = np.bincount(metro_key, minlength=len(clash))
+
+    keys = np.flatnonzero(clash)
+    candidates = np.flatnonzero(clash[metro_key])
+    members = candidates[np.argsort(metro_key[candidates], kind='stable')]
+    conflicts = {
+        'Date': first + keys // n_metros,
+        'Metro': keys % n_metros,
+        'Count': counts[keys],
+        'SharedVenue': shared[keys],
+        'Start': np.cumsum(counts[keys]) - counts[keys],
+    }
+    return conflicts, members
+
+
+if __name__ == '__main__':
+    archive = game_store.demo_games()
+
+    stadiums = load_stadiums()
+    metro = metro_ids()
+    shared_metros = [np.flatnonzero(metro == m) for m in range(metro.max() + 1)]
+    shared_metros = [rows for rows in shared_metros if len(rows) > 1]
+    print(f"{metro.max() + 1} metros; {len(shared_metros)} host more than one team")
+
+    start = time.perf_counter()
+    conflicts, members = find_conflicts(archive)
+    elapsed = time.perf_counter() - start
+    print(f"✓ {len(conflicts['Date'])} same-metro conflicts in {len(archive['Date'])} games "
+          f"({conflicts['SharedVenue'].sum()} in a shared building) in {elapsed * 1000:.1f} ms")
+
+    latest = np.flatnonzero(conflicts['Date'] >= np.datetime64('2024-04-01'))[:5]
+    for i in latest:
+        games = members[conflicts['Start'][i]:conflicts['Start'][i] + conflicts['Count'][i]]
+        teams = ', '.join(f"{stadiums['Team'][archive['Home'][g]]} ({archive['League'][g]})" for g in games)
+        note = ' [shared building]' if conflicts['SharedVenue'][i] else ''
+        print(f"  {conflicts['Date'][i]}  {teams}{note}")
@@ -0,0 +1,226 @@
+import argparse
+import glob
+import importlib
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pipeline
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Generator sources and data files to watch, relative to the repository root
+WATCHED = [
+    'test5.py',
+    'minify.py',
+    'templating.py',
+    'ingest.py',
+    'stadiums.py',
+    'stadium_map.py',
+    'pipeline.py',
+    'Calendar/*.py',
+    'templates/*.html',
+    'Data/*.csv',
+]
+
+# Module names, reloaded in dependency order so dependents pick up the new
+# functions; the calendar modules are imported by the pipeline on first use
+MODULES = {
+    'Calendar/render.py': 'render',
+    'Calendar/dates.py': 'dates',
+    'Calendar/pyramid.py': 'pyramid',
+    'ingest.py': 'ingest',
+    'stadiums.py': 'stadiums',
+    'stadium_map.py': 'stadium_map',
+    'minify.py': 'minify',
+    'templating.py': 'templating',
+    'test5.py': 'test5',
+    'pipeline.py': 'pipeline',
+}
+
+LIVERELOAD_PATH = '/__livereload'
+
+# Reloads stylesheets in place when only CSS changed, otherwise reloads the page
+LIVERELOAD_SCRIPT = f'''<script>
+(function() {{
+    const source = new EventSource('{LIVERELOAD_PATH}');
+    source.addEventListener('reload', (e) => {{
+        const files = JSON.parse(e.data);
+        if (files.length && files.every(f => f.endsWith('.css'))) {{
+            document.querySelectorAll('link[href$="styles.css"]').forEach(link => {{
+                link.href = link.href.split('?')[0] + '?t=' + Date.now();
+            }});
+        }} else {{
+            location.reload();
+        }}
+    }});
+}})();
+</script>
+'''
+
+
+class LiveReload:
+    """Fan out reload events to connected browsers"""
+
+    def __init__(self):
+        self.clients = set()
+        self.lock = threading.Lock()
+
+    def connect(self):
+        client = queue.Queue()
+        with self.lock:
+            self.clients.add(client)
+        return client
+
+    def disconnect(self, client):
+        with self.lock:
+            self.clients.discard(client)
+
+    def notify(self, files):
+        with self.lock:
+            for client in self.clients:
+                client.put(files)
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """Serve the built site, inject the live-reload client and stream reload events"""
+
+    livereload = None
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path == LIVERELOAD_PATH:
+            return self.stream_events()
+        if path.endswith('/'):
+            path += 'index.html'
+        if path.endswith('.html'):
+            return self.send_html(path)
+        return super().do_GET()
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def send_html(self, path):
+        file_path = self.translate_path(path)
+        if not os.path.isfile(file_path):
+            return self.send_error(404)
+        with open(file_path, encoding='utf-8') as f:
+            page = f.read()
+        page = page.replace('</body>', LIVERELOAD_SCRIPT + '</body>', 1)
+        body = page.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        client = self.livereload.connect()
+        try:
+            while True:
+                try:
+                    files = client.get(timeout=15)
+                    message = f'event: reload\ndata: {json.dumps(files)}\n\n'
+                except queue.Empty:
+                    message = ': keepalive\n\n'
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.livereload.disconnect(client)
+
+    def log_message(self, format, *args):
+        if LIVERELOAD_PATH not in self.path:
+            super().log_message(format, *args)
+
+
+def snapshot():
+    """Map each watched file to its modification time"""
+    mtimes = {}
+    for pattern in WATCHED:
+        for path in glob.glob(os.path.join(ROOT, pattern)):
+            mtimes[os.path.relpath(path, ROOT)] = os.path.getmtime(path)
+    return mtimes
+
+
+# Modules whose last reload failed; they are retried on the next rebuild
+_failed_reloads = set()
+
+
+def rebuild(changed, livereload, out_dir=ROOT):
+    """Reload edited generator modules, rerun the cached pipeline and notify browsers
+
+    Errors (a syntax error mid-edit, a failing stage) are reported and the
+    watcher keeps running, so fixing the file triggers the next rebuild.
+    """
+    start = time.perf_counter()
+    try:
+        # Modules bind their dependencies' functions at import, so once one module
+        # changes, every module after it in MODULES is reloaded too
+        reloading = False
+        for path, name in MODULES.items():
+            reloading = reloading or path in changed or path in _failed_reloads
+            if reloading and name in sys.modules:
+                _failed_reloads.add(path)
+                importlib.reload(sys.modules[name])
+                _failed_reloads.discard(path)
+        rebuilt, written = pipeline.build(verbose=False, out_dir=out_dir)
+    except Exception as e:
+        print(f"✗ Build failed after {', '.join(changed)} changed: {type(e).__name__}: {e}")
+        return
+    elapsed = time.perf_counter() - start
+    print(f"✓ {', '.join(changed)} → rebuilt {', '.join(rebuilt) or 'nothing'}; "
+          f"{len(written)} file(s) changed in {elapsed * 1000:.0f} ms")
+    if written:
+        livereload.notify(written)
+
+
+def watch(livereload, out_dir=ROOT, interval=0.1):
+    """Poll the watched files and rebuild when any of them change"""
+    previous = snapshot()
+    while True:
+        time.sleep(interval)
+        current = snapshot()
+        changed = sorted(path for path in current.keys() | previous.keys()
+                         if current.get(path) != previous.get(path))
+        if changed:
+            rebuild(changed, livereload, out_dir)
+        previous = current
+
+
+def serve(out_dir=ROOT, port=8000):
+    """Build once, then serve out_dir with live reload while watching the sources"""
+    pipeline.build(out_dir=out_dir)
+
+    livereload = LiveReload()
+    DevRequestHandler.livereload = livereload
+    server = ThreadingHTTPServer(('127.0.0.1', port), partial(DevRequestHandler, directory=out_dir))
+    server.daemon_threads = True
+    threading.Thread(target=watch, args=(livereload, out_dir), daemon=True).start()
+
+    print(f"Serving {out_dir} at http://127.0.0.1:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping dev server")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Sports Hub dev server with live reload')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--out', default=ROOT, help='directory the site is built into and served from')
+    args = parser.parse_args()
+    serve(os.path.abspath(args.out), args.port)
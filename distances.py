@@ -0,0 +1,90 @@
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from ingest import file_hash, save_cache
+from stadiums import STADIUMS_CSV, haversine, load_stadiums
+
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Data', 'cache')
+# Bump when the stored matrices change meaning or layout
+DISTANCE_VERSION = 1
+
+# Roads are longer than great circles; intercity driving averages about 60 mph
+DRIVING_CIRCUITY = 1.25
+DRIVING_MPH = 60.0
+
+
+def compute_distance_matrix(path=STADIUMS_CSV):
+    """All-pairs great-circle distances in miles between venues, in CSV row order"""
+    stadiums = load_stadiums(path)
+    lat, lon = stadiums['Latitude'], stadiums['Longitude']
+    return haversine(lat[:, None], lon[:, None], lat[None, :], lon[None, :]).astype(np.float32)
+
+
+def driving_hours(miles):
+    """Rough driving time in hours for great-circle distances in miles"""
+    return miles * DRIVING_CIRCUITY / DRIVING_MPH
+
+
+def _cache_path(kind, path):
+    return os.path.join(CACHE_DIR, f'{kind}-v{DISTANCE_VERSION}-{file_hash(path)}.npy')
+
+
+def _save(kind, path, matrix):
+    """Write a matrix next to its siblings, removing versions for older CSV contents"""
+    stale = os.path.join(CACHE_DIR, f'{kind}-v*.npy')
+    return save_cache(_cache_path(kind, path), stale, lambda f: np.save(f, matrix))
+
+
+@lru_cache(maxsize=None)
+def _load(kind, path, csv_hash):
+    target = _cache_path(kind, path)
+    if not os.path.exists(target):
+        miles = compute_distance_matrix(path)
+        _save('miles', path, miles)
+        _save('driving', path, driving_hours(miles).astype(np.float32))
+    return np.load(target, mmap_mode='r')
+
+
+def load_distance_matrix(kind='miles', path=STADIUMS_CSV):
+    """Memory-mapped all-pairs matrix: 'miles' (great circle) or 'driving' (hours)
+
+    The matrices are cached as .npy files keyed by the CSV's content hash, so
+    editing the CSV recomputes them on the next load.
+    """
+    if kind not in ('miles', 'driving'):
+        raise ValueError(f"Unknown distance kind '{kind}'")
+    return _load(kind, path, file_hash(path))
+
+
+def league_rows(sport, path=STADIUMS_CSV):
+    """Index of a league's venues in the matrix: a slice when its rows are contiguous"""
+    rows = np.flatnonzero(load_stadiums(path)['Sport'] == sport)
+    if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+        return slice(rows[0], rows[-1] + 1)
+    return rows
+
+
+def league_matrix(sport, kind='miles', path=STADIUMS_CSV):
+    """A league's submatrix; a view into the memory map when its rows are contiguous"""
+    rows = league_rows(sport, path)
+    matrix = load_distance_matrix(kind, path)
+    if isinstance(rows, slice):
+        return matrix[rows, rows]
+    return matrix[np.ix_(rows, rows)]
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    miles = load_distance_matrix()
+    print(f"✓ {miles.shape[0]}x{miles.shape[1]} distance matrix ready in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    stadiums = load_stadiums()
+    for sport in np.unique(stadiums['Sport']):
+        sub = league_matrix(sport)
+        upper = sub[np.triu_indices(len(sub), k=1)]
+        print(f"  {sport}: {len(sub)} venues, mean {upper.mean():.0f} mi, max {upper.max():.0f} mi "
+              f"({driving_hours(upper.max()):.0f} h driving)")
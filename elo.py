@@ -0,0 +1,152 @@
+import time
+from collections import namedtuple
+
+import numpy as np
+
+import games as game_store
+from hierarchy import get_hierarchy
+
+
+# k: update speed; home_advantage: rating points added to the home side;
+# margin: scale updates by margin of victory; revert: share of the distance to
+# the mean rating given back between seasons; initial: rating of a new team
+EloParams = namedtuple('EloParams', ['k', 'home_advantage', 'margin', 'revert', 'initial'])
+
+DEFAULT_PARAMS = {
+    'MLB': EloParams(k=4, home_advantage=24, margin=True, revert=1 / 3, initial=1500),
+    'MLS': EloParams(k=20, home_advantage=60, margin=True, revert=1 / 3, initial=1500),
+    'NBA': EloParams(k=20, home_advantage=100, margin=True, revert=1 / 4, initial=1500),
+    'NFL': EloParams(k=20, home_advantage=48, margin=True, revert=1 / 3, initial=1500),
+    'NHL': EloParams(k=6, home_advantage=50, margin=True, revert=1 / 3, initial=1500),
+}
+
+
+def win_probability(rating_diff):
+    """Expected score for a side rated rating_diff points above its opponent"""
+    return 1 / (1 + 10 ** (-rating_diff / 400))
+
+
+def margin_multiplier(margin, winner_diff):
+    """Margin-of-victory scaling, damped when the favourite wins (autocorrelation correction)"""
+    return np.log(np.abs(margin) + 1) * 2.2 / (winner_diff * 0.001 + 2.2)
+
+
+def independent_layers(home, away, n_teams):
+    """Split games, in date order, into layers in which no team plays twice
+
+    A game's layer is one past the latest layer of either team's previous game,
+    so every layer depends only on earlier ones and updates as one vector step.
+    """
+    last = [-1] * n_teams
+    layers = np.empty(len(home), dtype=np.int64)
+    for i, (h, a) in enumerate(zip(home.tolist(), away.tolist())):
+        layer = max(last[h], last[a]) + 1
+        last[h] = last[a] = layers[i] = layer
+    return layers
+
+
+class EloEngine:
+    """Elo ratings for every team under one or more parameter sets at once
+
+    params is one {league: EloParams} mapping or a list of them; ratings has one
+    row per parameter set, so a parameter sweep costs little more than one run.
+    Games can be fed in any number of date-ordered batches.
+    """
+
+    def __init__(self, params=None):
+        params = DEFAULT_PARAMS if params is None else params
+        self.single = isinstance(params, dict)
+        self.params = [params] if self.single else list(params)
+        hierarchy = get_hierarchy()
+        leagues = hierarchy.names['league'][hierarchy.codes['league']]
+
+        def table(field):
+            return np.array([[float(getattr(p[league], field)) for league in leagues] for p in self.params])
+
+        self.k = table('k')
+        self.home_advantage = table('home_advantage')
+        self.margin = table('margin').astype(bool)
+        self.revert = table('revert')
+        self.initial = table('initial')
+        self.ratings = self.initial.copy()
+        self.last_season = np.full(len(leagues), -1, dtype=np.int64)
+
+    def predict(self, home, away):
+        """Home win probabilities for matchups under the current ratings"""
+        diff = self.ratings[:, home] + self.home_advantage[:, home] - self.ratings[:, away]
+        probability = win_probability(diff)
+        return probability[0] if self.single else probability
+
+    def process(self, games):
+        """Rate a date-sorted batch of games, returning each game's pre-game home win probability
+
+        Unplayed games get a probability but do not change the ratings.
+        """
+        n = len(games['Date'])
+        home, away = games['Home'], games['Away']
+        played = (games['HomeScore'] >= 0) & (games['AwayScore'] >= 0)
+        margin = games['HomeScore'].astype(np.int64) - games['AwayScore']
+        result = np.where(margin > 0, 1.0, np.where(margin < 0, 0.0, 0.5))
+        probability = np.empty((len(self.params), n))
+
+        layers = independent_layers(home, away, len(self.last_season))
+        order = np.argsort(layers, kind='stable')
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(layers))]) if n else [0]
+        season = games['Season'].astype(np.int64)
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            idx = order[lo:hi]
+            h, a = home[idx], away[idx]
+            self._start_seasons(np.concatenate([h, a]), np.concatenate([season[idx], season[idx]]))
+
+            diff = self.ratings[:, h] + self.home_advantage[:, h] - self.ratings[:, a]
+            expected = win_probability(diff)
+            probability[:, idx] = expected
+
+            m = margin[idx]
+            winner_diff = np.where(m >= 0, diff, -diff)
+            scale = np.where(self.margin[:, h] & (m != 0), margin_multiplier(m, winner_diff), 1.0)
+            delta = self.k[:, h] * scale * (result[idx] - expected) * played[idx]
+            self.ratings[:, h] += delta
+            self.ratings[:, a] -= delta
+        return probability[0] if self.single else probability
+
+    def _start_seasons(self, teams, seasons):
+        """Regress teams playing their first game of a new season toward the initial rating"""
+        new = seasons != self.last_season[teams]
+        if new.any():
+            teams = teams[new]
+            started = self.last_season[teams] >= 0
+            self.last_season[teams] = seasons[new]
+            teams = teams[started]
+            self.ratings[:, teams] -= self.revert[:, teams] * (self.ratings[:, teams] - self.initial[:, teams])
+
+
+def brier_score(probability, games):
+    """Mean squared error of home win probabilities over decided games"""
+    decided = (games['HomeScore'] >= 0) & (games['HomeScore'] != games['AwayScore'])
+    outcome = (games['HomeScore'] > games['AwayScore'])[decided]
+    return ((probability[..., decided] - outcome) ** 2).mean(axis=-1)
+
+
+if __name__ == '__main__':
+    archive = game_store.demo_games(['MLB'], range(1925, 2025))
+
+    start = time.perf_counter()
+    engine = EloEngine()
+    probability = engine.process(archive)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Rated {len(archive['Date'])} games in {elapsed:.2f}s; Brier score {brier_score(probability, archive):.4f}")
+
+    sweep = [{**DEFAULT_PARAMS, 'MLB': DEFAULT_PARAMS['MLB']._replace(k=k)} for k in (2, 4, 6, 8, 12, 16)]
+    start = time.perf_counter()
+    scores = brier_score(EloEngine(sweep).process(archive), archive)
+    print(f"✓ Swept {len(sweep)} K values in {time.perf_counter() - start:.2f}s")
+    for params, score in zip(sweep, scores):
+        print(f"  K={params['MLB'].k:<3} Brier {score:.4f}")
+
+    teams = get_hierarchy().teams
+    mlb = np.flatnonzero(engine.last_season >= 0)
+    best = mlb[np.argsort(-engine.ratings[0, mlb])[:5]]
+    print("\nTop current ratings:")
+    for team in best:
+        print(f"  {teams[team]:<24} {engine.ratings[0, team]:.0f}")
@@ -0,0 +1,128 @@
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+import games as game_store
+from hierarchy import get_hierarchy
+
+
+# Rolling windows, in games, for win percentage and goal differential
+WINDOWS = (5, 10, 20)
+
+# Games in the recent-results strip; codes 1 win, 2 tie, 3 loss, 0 no game yet
+RECENT_GAMES = 5
+RESULT_LETTERS = np.array(['', 'W', 'T', 'L'])
+
+
+def rolling_form(games, windows=WINDOWS):
+    """Rolling form for every team's every played game, all teams and seasons in one pass
+
+    Returns one row per team per game, sorted by team, season and date. Windows
+    restart each season and are shorter for a season's first games:
+    'WinPct<N>' (ties count half) and 'GoalDiff<N>' over the last N games,
+    'Streak' (+n after n straight wins, -n after losses, 0 after a tie),
+    'PointStreak' (straight games with a win or tie, 0 after a loss) and
+    'Recent', the last RECENT_GAMES result codes, oldest first.
+    """
+    played = (games['HomeScore'] >= 0) & (games['AwayScore'] >= 0)
+    rows = game_store.team_game_rows({column: values[played] for column, values in games.items()})
+    n = len(rows['Team'])
+    index = np.arange(n)
+    _, is_start = game_store.group_starts(rows['Team'], rows['Season'])
+    season_start = np.maximum.accumulate(np.where(is_start, index, 0))
+    differential = rows['For'].astype(np.int64) - rows['Against']
+    result = np.sign(differential)
+
+    def rolling_sum(values, window):
+        total = np.concatenate([[0], np.cumsum(values)])
+        return total[index + 1] - total[np.maximum(index + 1 - window, season_start)]
+
+    def run_length(change):
+        run_start = np.maximum.accumulate(np.where(is_start | change, index, 0))
+        return index - run_start + 1
+
+    form = {
+        'Team': rows['Team'],
+        'Season': rows['Season'],
+        'Date': rows['Date'],
+        'Game': rows['Game'],
+        'Result': result,
+    }
+    played_in_season = index - season_start + 1
+    for window in windows:
+        count = np.minimum(played_in_season, window)
+        form[f'WinPct{window}'] = rolling_sum((result + 1) / 2, window) / np.maximum(count, 1)
+        form[f'GoalDiff{window}'] = rolling_sum(differential, window)
+
+    changed = np.concatenate([[True], result[1:] != result[:-1]])
+    form['Streak'] = result * run_length(changed)
+    point = result >= 0
+    form['PointStreak'] = np.where(point, run_length(np.concatenate([[True], point[1:] != point[:-1]])), 0)
+
+    # Window i holds codes for rows i-RECENT_GAMES+1 .. i; blank out rows from earlier seasons
+    codes = np.where(result > 0, 1, np.where(result < 0, 3, 2)).astype(np.int8)
+    padded = np.concatenate([np.zeros(RECENT_GAMES - 1, dtype=np.int8), codes])
+    recent = sliding_window_view(padded, RECENT_GAMES)[:n]
+    source = index[:, None] - (RECENT_GAMES - 1) + np.arange(RECENT_GAMES)
+    form['Recent'] = np.where(source >= season_start[:, None], recent, 0)
+    return form
+
+
+def form_guide(recent):
+    """A 'Recent' row as letters, oldest first, e.g. 'WWLTW'"""
+    return ''.join(RESULT_LETTERS[recent])
+
+
+class FormIndex:
+    """Precomputed rolling form with constant-time lookup of any team's form curve"""
+
+    def __init__(self, games, windows=WINDOWS):
+        self.form = rolling_form(games, windows)
+        starts, _ = game_store.group_starts(self.form['Team'], self.form['Season'])
+        ends = np.append(starts[1:], len(self.form['Team']))
+        self.spans = {
+            (int(team), int(season)): (lo, hi)
+            for team, season, lo, hi in zip(self.form['Team'][starts], self.form['Season'][starts], starts, ends)
+        }
+        # Rows are sorted by team, so a team's whole history is one slice as well
+        team_starts, _ = game_store.group_starts(self.form['Team'])
+        team_ends = np.append(team_starts[1:], len(self.form['Team']))
+        self.team_spans = {int(self.form['Team'][lo]): (lo, hi) for lo, hi in zip(team_starts, team_ends)}
+
+    def curve(self, team, season=None):
+        """A team's form, one row per game, for one season or every season; slices, not copies"""
+        lo, hi = self.team_spans.get(team, (0, 0)) if season is None else self.spans.get((team, season), (0, 0))
+        return {column: values[lo:hi] for column, values in self.form.items()}
+
+    def as_of(self, team, season, date):
+        """Index into curve(team, season) of the team's latest game on or before date, -1 if none"""
+        lo, hi = self.spans.get((team, season), (0, 0))
+        return np.searchsorted(self.form['Date'][lo:hi], np.datetime64(date, 'D'), 'right') - 1
+
+
+if __name__ == '__main__':
+    archive = game_store.demo_games()
+
+    start = time.perf_counter()
+    index = FormIndex(archive)
+    print(f"✓ Rolling form for {len(index.form['Team'])} team-games over {len(index.spans)} team-seasons "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    keys = list(index.spans)
+    picks = np.random.default_rng(0).integers(0, len(keys), 10000)
+    start = time.perf_counter()
+    for i in picks:
+        index.curve(*keys[i])
+    print(f"✓ Form curves fetched in {(time.perf_counter() - start) / len(picks) * 1e6:.1f} µs each")
+
+    hierarchy = get_hierarchy()
+    season = int(archive['Season'].max())
+    nhl = hierarchy.members('league', hierarchy.group('league', 'NHL'))
+    latest = [(team, index.curve(int(team), season)) for team in nhl]
+    latest = [(team, {column: values[-1] for column, values in curve.items()}) for team, curve in latest
+              if len(curve['Team'])]
+    print(f"\nNHL {season}, hottest teams at season's end:")
+    for team, last in sorted(latest, key=lambda item: -item[1]['WinPct10'])[:8]:
+        print(f"  {hierarchy.teams[team]:<24} last 10 {last['WinPct10']:.0%}  goal diff {last['GoalDiff10']:+d}  "
+              f"point streak {last['PointStreak']}  {form_guide(last['Recent'])}")
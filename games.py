@@ -0,0 +1,223 @@
+import glob
+import os
+import re
+from datetime import date
+
+import numpy as np
+
+from ingest import GAMES, load_table
+from stadiums import load_stadiums
+
+
+GAMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Data', 'games')
+
+LEAGUES = ['MLB', 'MLS', 'NBA', 'NFL', 'NHL']
+
+# Regular-season games per team and the (month, day, length in days) of the season window
+GAMES_PER_TEAM = {'MLB': 162, 'MLS': 34, 'NBA': 82, 'NFL': 17, 'NHL': 82}
+SEASON_WINDOWS = {
+    'MLB': (3, 27, 186),
+    'MLS': (2, 22, 245),
+    'NBA': (10, 22, 175),
+    'NFL': (9, 5, 126),
+    'NHL': (10, 8, 185),
+}
+
+# Columns of the game store; every array has one entry per game
+COLUMNS = ['League', 'Season', 'Date', 'Home', 'Away', 'HomeScore', 'AwayScore']
+
+
+def empty_games():
+    """A game store with no games"""
+    return {
+        'League': np.array([], dtype='<U3'),
+        'Season': np.array([], dtype=np.int16),
+        'Date': np.array([], dtype='datetime64[D]'),
+        'Home': np.array([], dtype=np.int32),
+        'Away': np.array([], dtype=np.int32),
+        'HomeScore': np.array([], dtype=np.int16),
+        'AwayScore': np.array([], dtype=np.int16),
+    }
+
+
+def team_rows():
+    """Map team names to their row in the stadium table, which is the team id used everywhere"""
+    return {team: row for row, team in enumerate(load_stadiums()['Team'])}
+
+
+def sort_games(games):
+    """Order games by date, then league, keeping file order for same-day games"""
+    order = np.lexsort((games['League'], games['Date']))
+    return {column: values[order] for column, values in games.items()}
+
+
+def concat_games(parts):
+    """Concatenate game stores and sort the result by date"""
+    parts = list(parts)
+    if not parts:
+        return empty_games()
+    return sort_games({column: np.concatenate([part[column] for part in parts]) for column in COLUMNS})
+
+
+def available_seasons(league=None):
+    """(league, season) pairs with a schedule file in Data/games"""
+    seasons = []
+    for path in glob.glob(os.path.join(GAMES_DIR, '*_*.csv')):
+        match = re.fullmatch(r'([A-Z]+)_(\d{4})\.csv', os.path.basename(path))
+        if match and (league is None or match.group(1) == league):
+            seasons.append((match.group(1), int(match.group(2))))
+    return sorted(seasons)
+
+
+def load_season(league, season):
+    """Read Data/games/<LEAGUE>_<season>.csv (Date,Home,Away,HomeScore,AwayScore)
+
+    Unplayed games leave the scores blank and are stored as -1.
+    """
+    path = os.path.join(GAMES_DIR, f'{league}_{season}.csv')
+    table = load_table(path, GAMES)
+    rows = team_rows()
+    unknown = sorted(set(table['Home'].tolist() + table['Away'].tolist()) - rows.keys())
+    if unknown:
+        raise ValueError(f"{os.path.basename(path)}: unknown team(s) {', '.join(unknown)}")
+    n = len(table['Date'])
+    return sort_games({
+        'League': np.full(n, league, dtype='<U3'),
+        'Season': np.full(n, season, dtype=np.int16),
+        'Date': table['Date'],
+        'Home': np.array([rows[team] for team in table['Home']], dtype=np.int32),
+        'Away': np.array([rows[team] for team in table['Away']], dtype=np.int32),
+        'HomeScore': table['HomeScore'].astype(np.int16),
+        'AwayScore': table['AwayScore'].astype(np.int16),
+    })
+
+
+def load_games(leagues=None, seasons=None):
+    """Load every archived season for the given leagues and seasons into one store"""
+    return concat_games(
+        load_season(league, season)
+        for league, season in available_seasons()
+        if (leagues is None or league in leagues) and (seasons is None or season in seasons)
+    )
+
+
+def _synthetic_scores(league, rng, strength_home, strength_away):
+    """Scores drawn from rough per-league scoring distributions, tilted by team strength"""
+    n = len(strength_home)
+    if league in ('NBA', 'NFL'):
+        mean, spread = (112, 12) if league == 'NBA' else (22, 9)
+        home = rng.normal(mean + spread * 0.25 + spread * strength_home, spread, n)
+        away = rng.normal(mean + spread * strength_away, spread, n)
+        home, away = np.maximum(np.rint(home), 0), np.maximum(np.rint(away), 0)
+    else:
+        mean = {'MLB': 4.5, 'MLS': 1.4, 'NHL': 3.1}[league]
+        home = rng.poisson(mean * np.exp(0.05 + 0.2 * strength_home))
+        away = rng.poisson(mean * np.exp(0.2 * strength_away))
+    home = home.astype(np.int16)
+    away = away.astype(np.int16)
+    if league in ('MLB', 'NBA', 'NHL'):
+        # No ties: extra innings, overtime or a shootout decide it
+        tied = home == away
+        home_wins = rng.random(n) < 0.5
+        home[tied & home_wins] += 1
+        away[tied & ~home_wins] += 1
+    return home, away
+
+
+def synthetic_season(league, season, seed=0, played=True):
+    """A plausible random schedule (and results) for benchmarks and demos
+
+    Teams meet in circle-method round-robin rounds, one game per team per round,
+    and each round's games are spread over the days before the next round, so
+    no team plays twice on one day.
+    """
+    rng = np.random.default_rng([seed, season, LEAGUES.index(league)])
+    teams = np.flatnonzero(load_stadiums()['Sport'] == league).astype(np.int32)
+    n_rounds = GAMES_PER_TEAM[league]
+    slots = len(teams) + len(teams) % 2  # -1 marks the bye when the count is odd
+    circle = np.concatenate([rng.permutation(teams), np.full(slots - len(teams), -1, dtype=np.int32)])
+
+    month, day, length = SEASON_WINDOWS[league]
+    round_starts = np.floor(np.arange(n_rounds + 1) * length / n_rounds).astype(int)
+
+    home, away, offsets = [], [], []
+    for r in range(n_rounds):
+        left, right = circle[:slots // 2], circle[slots // 2:][::-1]
+        real = (left >= 0) & (right >= 0)
+        flip = rng.random(slots // 2) < 0.5
+        home.append(np.where(flip, right, left)[real])
+        away.append(np.where(flip, left, right)[real])
+        span = max(round_starts[r + 1] - round_starts[r], 1)
+        offsets.append(round_starts[r] + rng.integers(0, span, real.sum()))
+        # Rotate every slot but the first
+        circle = np.concatenate([circle[:1], np.roll(circle[1:], 1)])
+
+    home = np.concatenate(home)
+    away = np.concatenate(away)
+    n = len(home)
+    first_day = np.datetime64(date(season, month, day), 'D')
+    games = {
+        'League': np.full(n, league, dtype='<U3'),
+        'Season': np.full(n, season, dtype=np.int16),
+        'Date': first_day + np.concatenate(offsets),
+        'Home': home,
+        'Away': away,
+        'HomeScore': np.full(n, -1, dtype=np.int16),
+        'AwayScore': np.full(n, -1, dtype=np.int16),
+    }
+    if played:
+        strength = np.zeros(len(load_stadiums()['Team']))
+        strength[teams] = rng.normal(0, 0.5, len(teams))
+        games['HomeScore'], games['AwayScore'] = _synthetic_scores(league, rng, strength[home], strength[away])
+    return sort_games(games)
+
+
+def synthetic_archive(leagues=LEAGUES, seasons=range(1995, 2025), seed=0):
+    """Synthetic seasons for every league and season, as one store"""
+    return concat_games(synthetic_season(league, season, seed) for league in leagues for season in seasons)
+
+
+def demo_games(leagues=None, seasons=None):
+    """Schedules from Data/games for the module benchmarks, or synthetic ones when there are none"""
+    games = load_games(leagues, seasons)
+    if len(games['Date']):
+        return games
+    leagues = LEAGUES if leagues is None else list(leagues)
+    seasons = range(1995, 2025) if seasons is None else list(seasons)
+    print(f"No schedules in Data/games; using {len(seasons)} synthetic season(s) of {', '.join(leagues)}")
+    return synthetic_archive(leagues, seasons)
+
+
+def team_game_rows(games):
+    """One row per team per game, sorted by team, season and date
+
+    Returns columns 'Team', 'Opponent', 'Venue' (the home team's row, whose stadium
+    hosts the game), 'IsHome', 'Season', 'Date', 'For', 'Against' and 'Game' (the
+    index of the game in the input store).
+    """
+    n = len(games['Date'])
+    index = np.arange(n)
+    rows = {
+        'Team': np.concatenate([games['Home'], games['Away']]),
+        'Opponent': np.concatenate([games['Away'], games['Home']]),
+        'Venue': np.concatenate([games['Home'], games['Home']]),
+        'IsHome': np.concatenate([np.ones(n, bool), np.zeros(n, bool)]),
+        'Season': np.concatenate([games['Season'], games['Season']]),
+        'Date': np.concatenate([games['Date'], games['Date']]),
+        'For': np.concatenate([games['HomeScore'], games['AwayScore']]),
+        'Against': np.concatenate([games['AwayScore'], games['HomeScore']]),
+        'Game': np.concatenate([index, index]),
+    }
+    order = np.lexsort((rows['Game'], rows['Date'], rows['Season'], rows['Team']))
+    return {column: values[order] for column, values in rows.items()}
+
+
+def group_starts(*keys):
+    """Start offsets of runs of equal keys in sorted arrays, plus a boolean start mask"""
+    n = len(keys[0])
+    is_start = np.zeros(n, bool)
+    if n:
+        is_start[0] = True
+        for key in keys:
+            is_start[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(is_start), is_start
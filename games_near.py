@@ -0,0 +1,83 @@
+import time
+
+import numpy as np
+
+import games as game_store
+from stadiums import get_index, load_stadiums
+
+
+class GamesNearIndex:
+    """Games bucketed by venue, each bucket's dates sorted, for "games near me" queries
+
+    Games are ordered by (venue, date) and addressed through one combined integer
+    key, so after the stadium KD-tree finds the venues within range, a single
+    searchsorted call finds every bucket's date window at once.
+    """
+
+    def __init__(self, games):
+        self.games = games
+        self.n_venues = len(load_stadiums()['Team'])
+        days = games['Date'].astype('datetime64[D]').astype(np.int64)
+        self.day_offset = days.min() if len(days) else 0
+        self.span = int(days.max() - self.day_offset + 2) if len(days) else 1
+        keys = games['Home'].astype(np.int64) * self.span + (days - self.day_offset)
+        self.order = np.argsort(keys, kind='stable')
+        self.keys = keys[self.order]
+
+    def _day(self, value):
+        day = np.datetime64(value, 'D').astype(np.int64) - self.day_offset
+        return int(np.clip(day, -1, self.span - 1))
+
+    def query(self, lat, lon, radius_miles, start, end, leagues=None):
+        """Games within radius_miles of a point played between start and end (inclusive)
+
+        Returns (game indices into the store, distance in miles to each venue),
+        ordered by date and then distance.
+        """
+        venues, miles = get_index().within(lat, lon, radius_miles)
+        first, last = self._day(start), self._day(end)
+        if not len(venues) or last < first or last < 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        base = venues.astype(np.int64) * self.span
+        lo = np.searchsorted(self.keys, base + max(first, 0), 'left')
+        hi = np.searchsorted(self.keys, base + last, 'right')
+
+        counts = hi - lo
+        total = counts.sum()
+        # Expand each venue's [lo, hi) window into positions without a Python loop
+        positions = np.repeat(lo - np.cumsum(counts) + counts, counts) + np.arange(total)
+        found = self.order[positions]
+        distance = np.repeat(miles, counts)
+        if leagues is not None:
+            keep = np.isin(self.games['League'][found], leagues)
+            found, distance = found[keep], distance[keep]
+        order = np.lexsort((distance, self.games['Date'][found]))
+        return found[order], distance[order]
+
+
+if __name__ == '__main__':
+    archive = game_store.demo_games()
+
+    start = time.perf_counter()
+    index = GamesNearIndex(archive)
+    print(f"✓ Indexed {len(archive['Date'])} games in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    teams = load_stadiums()['Team']
+    lat, lon = 40.7580, -73.9855  # Times Square
+    found, miles = index.query(lat, lon, 60, '2024-04-01', '2024-04-14')
+    print(f"\nGames within 60 miles of Times Square, April 1-14 2024: {len(found)}")
+    for game, distance in list(zip(found, miles))[:8]:
+        print(f"  {archive['Date'][game]}  {archive['League'][game]:<4} "
+              f"{teams[archive['Away'][game]]} at {teams[archive['Home'][game]]} ({distance:.0f} mi)")
+
+    rng = np.random.default_rng(0)
+    n = 5000
+    lats = rng.uniform(26, 48, n)
+    lons = rng.uniform(-122, -71, n)
+    firsts = np.datetime64('1995-01-01') + rng.integers(0, 30 * 365, n)
+    start = time.perf_counter()
+    hits = 0
+    for lat, lon, first in zip(lats, lons, firsts):
+        hits += len(index.query(lat, lon, 150, first, first + 30)[0])
+    elapsed = (time.perf_counter() - start) / n
+    print(f"\n150-mile, 30-day query: {elapsed * 1e6:.1f} µs ({hits / n:.1f} games per query)")
@@ -0,0 +1,132 @@
+from functools import lru_cache
+
+import numpy as np
+
+from ingest import file_hash
+from stadiums import STADIUMS_CSV, load_stadiums
+
+
+LEVELS = ('league', 'conference', 'division')
+
+# NHL divisions do not name their conference; NBA and MLS list conferences as divisions
+NHL_CONFERENCES = {'Atlantic': 'Eastern', 'Metropolitan': 'Eastern', 'Central': 'Western', 'Pacific': 'Western'}
+
+
+def conference_of(sport, division):
+    """Conference name for a division: 'AL'/'NL', 'AFC'/'NFC', 'Eastern'/'Western', or the division itself"""
+    if sport in ('MLB', 'NFL'):
+        return division.split()[0]
+    if sport == 'NHL':
+        return NHL_CONFERENCES[division]
+    return division
+
+
+def _encode(labels):
+    """Integer codes for labels, numbered in order of first appearance"""
+    names, first, codes = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(names), dtype=np.intp)
+    rank[np.argsort(first)] = np.arange(len(names))
+    return rank[codes.ravel()], names[np.argsort(first)]
+
+
+class Hierarchy:
+    """Integer-coded league → conference → division → team tree over the stadium table
+
+    Teams keep their stadium row as their id. For each level, `codes[level]` gives
+    every team's group, `parents[level]` every group's parent group, and
+    `order[level]`/`starts[level]` list teams grouped together, so per-group
+    totals are one np.bincount or ufunc.reduceat call.
+    """
+
+    def __init__(self, path=STADIUMS_CSV):
+        stadiums = load_stadiums(path)
+        self.teams = stadiums['Team']
+        sport, division = stadiums['Sport'], stadiums['Division']
+        conference = np.array([conference_of(s, d) for s, d in zip(sport, division)])
+        labels = {
+            'league': sport,
+            # Qualified so that 'Central' (NHL) and 'AL Central' stay distinct across leagues
+            'conference': np.char.add(np.char.add(sport, ' '), conference),
+            'division': np.char.add(np.char.add(sport, ' '), division),
+        }
+        self.codes, self.names, self.order, self.starts = {}, {}, {}, {}
+        for level in LEVELS:
+            self.codes[level], self.names[level] = _encode(labels[level])
+            self.order[level] = np.argsort(self.codes[level], kind='stable')
+            counts = np.bincount(self.codes[level])
+            self.starts[level] = np.concatenate([[0], np.cumsum(counts)])
+        self.parents = {
+            level: self._parent_codes(level, parent)
+            for level, parent in zip(LEVELS[1:], LEVELS[:-1])
+        }
+        self.team_index = {team: row for row, team in enumerate(self.teams)}
+        self.group_index = {
+            level: {name: code for code, name in enumerate(self.names[level])} for level in LEVELS
+        }
+        self.display_names = {
+            'league': self.names['league'],
+            'conference': np.array([name.split(' ', 1)[1] for name in self.names['conference']]),
+            'division': np.array([name.split(' ', 1)[1] for name in self.names['division']]),
+        }
+
+    def _parent_codes(self, level, parent):
+        """Parent group of every group at a level, taken from any member team"""
+        first_team = self.order[level][self.starts[level][:-1]]
+        return self.codes[parent][first_team]
+
+    def size(self, level):
+        """Number of groups at a level"""
+        return len(self.names[level])
+
+    def group(self, level, name):
+        """Code of a group from its name, e.g. group('division', 'NFL NFC West')"""
+        return self.group_index[level][name]
+
+    def members(self, level, code):
+        """Team ids in one group, as a view into the level's sorted order"""
+        return self.order[level][self.starts[level][code]:self.starts[level][code + 1]]
+
+    def children(self, level, code):
+        """Codes of the groups one level below a group"""
+        child = LEVELS[LEVELS.index(level) + 1]
+        return np.flatnonzero(self.parents[child] == code)
+
+    def team_group(self, team, level):
+        """Group code of a team, given its name or id"""
+        if isinstance(team, str):
+            team = self.team_index[team]
+        return self.codes[level][team]
+
+    def same_group(self, team_a, team_b, level):
+        """Whether two teams (ids or arrays of ids) are in the same group at a level"""
+        return self.codes[level][team_a] == self.codes[level][team_b]
+
+    def group_sum(self, values, level, teams=None):
+        """Sum per-team values into their groups; values align with teams (default: all teams)"""
+        codes = self.codes[level] if teams is None else self.codes[level][teams]
+        return np.bincount(codes, weights=values, minlength=self.size(level))
+
+    def group_reduce(self, ufunc, values, level):
+        """Apply a ufunc's reduceat over per-team values (one per team id) within each group"""
+        return ufunc.reduceat(np.asarray(values)[self.order[level]], self.starts[level][:-1])
+
+
+def get_hierarchy(path=STADIUMS_CSV):
+    """Shared Hierarchy over the stadium table, rebuilt when the CSV changes"""
+    return _get_hierarchy(path, file_hash(path))
+
+
+@lru_cache(maxsize=8)
+def _get_hierarchy(path, csv_hash):
+    return Hierarchy(path)
+
+
+if __name__ == '__main__':
+    hierarchy = get_hierarchy()
+    for league in range(hierarchy.size('league')):
+        print(f"{hierarchy.names['league'][league]}")
+        for conference in hierarchy.children('league', league):
+            divisions = hierarchy.children('conference', conference)
+            sizes = ', '.join(f"{hierarchy.display_names['division'][d]} ({len(hierarchy.members('division', d))})"
+                              for d in divisions)
+            print(f"  {hierarchy.display_names['conference'][conference]}: {sizes}")
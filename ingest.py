@@ -0,0 +1,243 @@
+import argparse
+import contextlib
+import csv
+import glob
+import hashlib
+import inspect
+import os
+import re
+import time
+from collections import Counter, namedtuple
+
+import numpy as np
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(ROOT, 'Data')
+CACHE_DIR = os.path.join(DATA_DIR, 'cache')
+# Bump when parsing or the cached layout changes
+INGEST_VERSION = 2
+
+# Divisions (or conferences, for leagues without divisions) of every known league
+DIVISIONS = {
+    'MLB': {'AL East', 'AL Central', 'AL West', 'NL East', 'NL Central', 'NL West'},
+    'MLS': {'Eastern Conference', 'Western Conference'},
+    'NBA': {'East', 'West'},
+    'NFL': {'AFC East', 'AFC North', 'AFC South', 'AFC West', 'NFC East', 'NFC North', 'NFC South', 'NFC West'},
+    'NHL': {'Atlantic', 'Metropolitan', 'Central', 'Pacific'},
+}
+
+# A CSV schema: `columns` are (header, dtype) pairs, where 'str', 'float', 'int'
+# and 'date' are parsed and blank ints become -1; `ranges` bound numeric columns,
+# `allowed` lists the valid values of a column, `unique` columns may not repeat,
+# and each of `checks` takes the parsed columns and the CSV line number of every
+# row and returns a list of problems.
+Schema = namedtuple('Schema', ['columns', 'ranges', 'allowed', 'unique', 'checks'])
+
+
+def file_hash(path):
+    """Short content hash of a file, used to version derived caches"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def save_cache(target, stale, write):
+    """Write a cache file with write(binary file), then delete older versions matching the glob stale
+
+    The file is written under a temporary name and renamed into place, so
+    readers never see a partial file.
+    """
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f'{target}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        write(f)
+    os.replace(tmp, target)
+    for old in glob.glob(stale):
+        if old != target:
+            # Another process may be cleaning up the same files
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(old)
+    return target
+
+
+def _check_divisions(columns, lines):
+    return [
+        f"row {line}: '{division}' is not a {sport} division"
+        for line, sport, division in zip(lines, columns['Sport'], columns['Division'])
+        if division not in DIVISIONS.get(sport, ())
+    ]
+
+
+STADIUMS = Schema(
+    columns=[('Team', 'str'), ('Sport', 'str'), ('Division', 'str'), ('Latitude', 'float'), ('Longitude', 'float')],
+    # Every venue is in the US or Canada; this also catches swapped coordinates
+    ranges={'Latitude': (18.0, 72.0), 'Longitude': (-170.0, -50.0)},
+    allowed={'Sport': set(DIVISIONS)},
+    unique=['Team'],
+    checks=[_check_divisions],
+)
+
+GAMES = Schema(
+    columns=[('Date', 'date'), ('Home', 'str'), ('Away', 'str'), ('HomeScore', 'int'), ('AwayScore', 'int')],
+    ranges={'HomeScore': (-1, 300), 'AwayScore': (-1, 300)},
+    allowed={},
+    unique=[],
+    checks=[lambda columns, lines: [
+        f"row {line}: {home} plays itself"
+        for line, home, away in zip(lines, columns['Home'], columns['Away']) if home == away
+    ]],
+)
+
+NUMPY_TYPES = {'str': str, 'float': np.float64, 'int': np.int32, 'date': 'datetime64[D]'}
+
+
+def _parse(value, dtype):
+    value = value.strip()
+    if dtype == 'float':
+        number = float(value)
+        # float() accepts 'nan' and 'inf', which would slip past range checks
+        if not np.isfinite(number):
+            raise ValueError(value)
+        return number
+    if dtype == 'int':
+        return int(value) if value else -1
+    if dtype == 'date':
+        return np.datetime64(value, 'D')
+    return value
+
+
+def parse_csv(path, schema):
+    """Parse and validate a CSV against a schema, returning NumPy columns keyed by header
+
+    Raises ValueError listing every problem found, with CSV line numbers.
+    """
+    # utf-8-sig strips the byte order mark some editors put in front of the first header
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        # Number rows by the file line they start on, counting blank lines and quoted line breaks
+        rows = []
+        line = reader.line_num
+        for row in reader:
+            rows.append((line + 1, row))
+            line = reader.line_num
+
+    names = [name for name, _ in schema.columns]
+    missing = [name for name in names if name not in header]
+    if missing:
+        raise ValueError(f"{os.path.basename(path)}: missing column(s) {', '.join(missing)}")
+
+    problems = []
+    values = {name: [] for name in names}
+    lines = []
+    for line, row in rows:
+        if not any(cell.strip() for cell in row):
+            continue
+        lines.append(line)
+        if len(row) != len(header):
+            problems.append(f"row {line}: expected {len(header)} fields, found {len(row)}")
+            continue
+        for name, dtype in schema.columns:
+            cell = row[header.index(name)]
+            try:
+                values[name].append(_parse(cell, dtype))
+            except ValueError:
+                problems.append(f"row {line}: {name} '{cell}' is not a valid {dtype}")
+                values[name].append(None)
+    if not problems:
+        columns = {name: np.array(values[name], dtype=NUMPY_TYPES[dtype]) for name, dtype in schema.columns}
+        for name, (low, high) in schema.ranges.items():
+            for row in np.flatnonzero((columns[name] < low) | (columns[name] > high)):
+                problems.append(f"row {lines[row]}: {name} {columns[name][row]} is outside [{low}, {high}]")
+        for name, allowed in schema.allowed.items():
+            for line, value in zip(lines, columns[name]):
+                if value not in allowed:
+                    problems.append(f"row {line}: unknown {name} '{value}'")
+        for name in schema.unique:
+            for value, count in Counter(columns[name].tolist()).items():
+                if count > 1:
+                    problems.append(f"{name} '{value}' appears {count} times")
+        for check in schema.checks:
+            problems.extend(check(columns, lines))
+    if problems:
+        raise ValueError(f"{os.path.basename(path)} failed validation:\n  " + '\n  '.join(problems))
+    return columns
+
+
+def _stable_repr(value):
+    """repr with sets and dicts sorted, so it does not change between runs"""
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{k!r}: {_stable_repr(v)}' for k, v in sorted(value.items())) + '}'
+    if isinstance(value, (set, frozenset)):
+        return '{' + ', '.join(sorted(map(_stable_repr, value))) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(map(_stable_repr, value)) + ']'
+    return repr(value)
+
+
+# Digests by schema object; the schema is kept with its digest so its id is not reused
+_schema_digests = {}
+
+
+def schema_digest(schema):
+    """Short hash of a schema, including the source of its checks and the constants they read"""
+    known = _schema_digests.get(id(schema))
+    if known and known[0] is schema:
+        return known[1]
+    h = hashlib.sha256()
+    for field in ('columns', 'ranges', 'allowed', 'unique'):
+        h.update(_stable_repr(getattr(schema, field)).encode())
+    for check in schema.checks:
+        h.update(inspect.getsource(check).encode())
+        for name in check.__code__.co_names:
+            value = check.__globals__.get(name)
+            if isinstance(value, (dict, set, frozenset, list, tuple)):
+                h.update(_stable_repr(value).encode())
+    _schema_digests[id(schema)] = schema, h.hexdigest()[:8]
+    return _schema_digests[id(schema)][1]
+
+
+def _cache_name(path):
+    """Cache file prefix for a CSV, from its path relative to the repository so same-named files differ"""
+    return re.sub(r'[^0-9A-Za-z]+', '_', os.path.relpath(os.path.abspath(path), ROOT)).strip('_') + '-table'
+
+
+def load_table(path, schema):
+    """Load a validated CSV, reusing a binary .npz copy when the file has not changed
+
+    The cache is keyed by the CSV's content hash and the schema, so the first
+    load after either changes parses and validates it again; every other load
+    just reads the arrays.
+    """
+    name = _cache_name(path)
+    target = os.path.join(CACHE_DIR, f'{name}-v{INGEST_VERSION}-{schema_digest(schema)}-{file_hash(path)}.npz')
+    if os.path.exists(target):
+        with np.load(target) as cached:
+            return {name: cached[name] for name, _ in schema.columns}
+
+    columns = parse_csv(path, schema)
+    save_cache(target, os.path.join(CACHE_DIR, f'{name}-v*.npz'), lambda f: np.savez(f, **columns))
+    return columns
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Validate Data/ CSV files and refresh their binary caches')
+    parser.add_argument('paths', nargs='*', default=[os.path.join(DATA_DIR, 'stadiums.csv')])
+    args = parser.parse_args()
+
+    for path in args.paths:
+        schema = GAMES if os.path.basename(os.path.dirname(os.path.abspath(path))) == 'games' else STADIUMS
+        try:
+            start = time.perf_counter()
+            columns = parse_csv(path, schema)
+            parsed = time.perf_counter() - start
+        except ValueError as e:
+            print(f"✗ {e}")
+            continue
+        load_table(path, schema)
+        start = time.perf_counter()
+        load_table(path, schema)
+        cached = time.perf_counter() - start
+        rows = len(next(iter(columns.values())))
+        print(f"✓ {os.path.relpath(path)}: {rows} rows valid; "
+              f"parse {parsed * 1000:.2f} ms, cached load {cached * 1000:.2f} ms")
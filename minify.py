@@ -0,0 +1,124 @@
+import re
+
+
+# Rules for the part of the page visible before any scrolling: the header,
+# the navigation and the timeline container. These are inlined in the HTML.
+CRITICAL_SELECTORS = [
+    '*',
+    'body',
+    '.container',
+    'header',
+    'nav',
+    '.content',
+    '.section',
+    '.timeline-container',
+    '#timeline-plot',
+]
+
+
+def minify_css(css):
+    """Strip comments and whitespace from a CSS stylesheet"""
+    # Python-style '#' comment blocks are not CSS; browsers parse and discard them
+    css = '\n'.join(line for line in css.splitlines() if not line.lstrip().startswith('# '))
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = css.replace(';}', '}')
+    return css.strip()
+
+
+def minify_js(js):
+    """Strip comments, indentation and blank lines from JavaScript, keeping line breaks for ASI"""
+    out = []
+    i = 0
+    n = len(js)
+    quote = None
+    while i < n:
+        ch = js[i]
+        if quote:
+            out.append(ch)
+            if ch == '\\' and i + 1 < n:
+                out.append(js[i + 1])
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in '\'"`':
+            quote = ch
+            out.append(ch)
+        elif js.startswith('//', i):
+            i = js.find('\n', i)
+            if i == -1:
+                break
+            continue
+        elif js.startswith('/*', i):
+            end = js.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            continue
+        else:
+            out.append(ch)
+        i += 1
+    lines = (line.strip() for line in ''.join(out).splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def _split_rules(css):
+    """Split minified CSS into top-level (prelude, body) blocks"""
+    rules = []
+    depth = 0
+    start = 0
+    brace = None
+    for i, ch in enumerate(css):
+        if ch == '{':
+            if depth == 0:
+                brace = i
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                rules.append((css[start:brace], css[brace + 1:i]))
+                start = i + 1
+    return rules
+
+
+def _is_critical(prelude, selectors):
+    """True if every selector in a rule's prelude targets a critical element"""
+    for selector in prelude.split(','):
+        if not any(selector == s or selector.startswith(s + ' ') or selector.startswith(s + ':')
+                   or selector.startswith(s + '.') for s in selectors):
+            return False
+    return True
+
+
+def split_critical_css(css, selectors=CRITICAL_SELECTORS):
+    """Split minified CSS into (critical, rest), descending into @media blocks"""
+    critical = []
+    rest = []
+    for prelude, body in _split_rules(css):
+        if prelude.startswith('@media'):
+            inner_critical, inner_rest = split_critical_css(body, selectors)
+            if inner_critical:
+                critical.append(f'{prelude}{{{inner_critical}}}')
+            if inner_rest:
+                rest.append(f'{prelude}{{{inner_rest}}}')
+        elif _is_critical(prelude, selectors):
+            critical.append(f'{prelude}{{{body}}}')
+        else:
+            rest.append(f'{prelude}{{{body}}}')
+    return ''.join(critical), ''.join(rest)
+
+
+def size_report(artifacts):
+    """Print byte savings for a list of (name, original, minified) entries"""
+    total_before = total_after = 0
+    print(f"  {'File':<20}{'Original':>10}{'Minified':>10}{'Saved':>8}")
+    for name, original, minified in artifacts:
+        before = len(original.encode('utf-8'))
+        after = len(minified.encode('utf-8'))
+        total_before += before
+        total_after += after
+        saved = 100 * (before - after) / before if before else 0
+        print(f"  {name:<20}{before:>10}{after:>10}{saved:>7.1f}%")
+    saved = 100 * (total_before - total_after) / total_before if total_before else 0
+    print(f"  {'Total':<20}{total_before:>10}{total_after:>10}{saved:>7.1f}%")
+    return total_before, total_after
@@ -0,0 +1,285 @@
+import argparse
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+import minify
+import stadium_map
+import test5
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, '.build-cache')
+CALENDAR_DIR = os.path.join(ROOT, 'Calendar')
+# Where the static calendar images are published, relative to the site root
+CALENDAR_URL = 'images/calendar'
+
+# A build stage: `run` receives the outputs of `deps` as keyword arguments.
+# Its cache key hashes those outputs, the code of `run` and of the functions or
+# constants named in `code` ("name" in test5 or "module.name"), the contents of
+# `files` (templates, data, and modules only reached as `module.attribute`), and
+# today's date when the output depends on it. Code is hashed with everything it
+# reads from its module: constants, and the repository functions it calls.
+Stage = namedtuple('Stage', ['name', 'run', 'deps', 'code', 'files', 'daily'])
+
+
+def _resolve(name):
+    """Look up a function or constant by name, defaulting to the test5 module"""
+    module, _, attr = name.rpartition('.')
+    return getattr(importlib.import_module(module or 'test5'), attr)
+
+
+def _hash_value(value, h, seen):
+    """Hash a function together with the constants and functions it reads, or a constant by value
+
+    Functions outside the repository, modules and classes are skipped; modules
+    reached through attribute access belong in a stage's `files`.
+    """
+    if callable(value) and hasattr(value, '__wrapped__'):
+        value = inspect.unwrap(value)  # lru_cache and other decorators
+    if inspect.isfunction(value):
+        source = inspect.getsourcefile(value) or ''
+        if id(value) in seen or not os.path.abspath(source).startswith(ROOT + os.sep):
+            return
+        seen.add(id(value))
+        h.update(inspect.getsource(value).encode())
+        codes = [value.__code__]
+        while codes:
+            code = codes.pop()
+            codes.extend(const for const in code.co_consts if inspect.iscode(const))
+            for name in code.co_names:
+                # UPPER_CASE names are constants; lower-case data such as memo dicts is runtime state
+                reached = value.__globals__.get(name)
+                if name.isupper() or callable(reached):
+                    _hash_value(reached, h, seen)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            h.update(repr(key).encode())
+            _hash_value(value[key], h, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value:
+            _hash_value(item, h, seen)
+    elif isinstance(value, (str, bytes, int, float, bool, type(None))):
+        h.update(repr(value).encode())
+
+
+def _fetch():
+    return test5.fetch_MLB(datetime.now().year)
+
+
+def _normalize(fetch):
+    return test5.build_league_data(fetch)
+
+
+def _figure(normalize):
+    return test5.create_sports_timeline(normalize)
+
+
+def _serialize(figure):
+    now = datetime.now()
+    today_x = now.month + (now.day - 1) / 30 + 12
+    js = test5.generate_timeline_js(figure.to_json(), today_x)
+    return minify.minify_js(js), js
+
+
+def _svg(normalize):
+    return test5.render_timeline_svg(normalize)
+
+
+def _css():
+    css = test5.generate_css()
+    critical, deferred = minify.split_critical_css(minify.minify_css(css))
+    return critical, deferred, css
+
+
+def _js():
+    js = test5.generate_js()
+    return minify.minify_js(js), js
+
+
+def _calendar():
+    """Render the static calendar sizes, returning (manifest, {site path: image bytes})"""
+    if CALENDAR_DIR not in sys.path:
+        sys.path.append(CALENDAR_DIR)
+    import pyramid
+    with tempfile.TemporaryDirectory() as out_dir:
+        manifest = pyramid.render_pyramid(out_dir, base=CALENDAR_URL)
+        images = {}
+        for variant in manifest['variants']:
+            with open(os.path.join(out_dir, variant['file']), 'rb') as f:
+                images[f"{CALENDAR_URL}/{variant['file']}"] = f.read()
+    return manifest, images
+
+
+def _html(svg, css, calendar):
+    return test5.generate_html(datetime.now().year, svg, css[0], calendar[0])
+
+
+def _pages(normalize, css):
+    # Five small templates render faster in this thread than in a pool started for them
+    return test5.generate_league_pages(normalize, datetime.now().year, css[0], max_workers=1)
+
+
+def _markers():
+    return stadium_map.map_json(test5.LEAGUE_COLORS)
+
+
+def _write(serialize, css, js, html, pages, markers, calendar, out_dir=ROOT):
+    files = {
+        'index.html': html,
+        'styles.css': css[1],
+        'script.js': js[0],
+        'timeline-data.js': serialize[0],
+        stadium_map.MAP_FILE: markers,
+    }
+    files.update(pages)
+    files.update(calendar[1])
+    written = []
+    for path, content in files.items():
+        target = os.path.join(out_dir, path)
+        data = content if isinstance(content, bytes) else content.encode('utf-8')
+        # Leave unchanged files alone so their timestamps stay put
+        if os.path.exists(target):
+            with open(target, 'rb') as f:
+                if f.read() == data:
+                    continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(data)
+        written.append(path)
+    return written
+
+
+def _size_report(serialize, css, js):
+    return minify.size_report([
+        ('styles.css', css[2], css[0] + css[1]),
+        ('script.js', js[1], js[0]),
+        ('timeline-data.js', serialize[1], serialize[0]),
+    ])
+
+
+# The calendar renderer is imported inside its stage, so its modules are keyed as files
+CALENDAR_SOURCES = ('Calendar/pyramid.py', 'Calendar/dates.py', 'Calendar/render.py')
+
+STAGES = [
+    Stage('fetch', _fetch, (), ('fetch_MLB',), (), True),
+    Stage('normalize', _normalize, ('fetch',), ('build_league_data',), (), False),
+    Stage('figure', _figure, ('normalize',), ('create_sports_timeline',), (), True),
+    Stage('serialize', _serialize, ('figure',), ('generate_timeline_js',), ('minify.py',), True),
+    Stage('svg', _svg, ('normalize',), ('render_timeline_svg',), (), True),
+    Stage('css', _css, (), ('generate_css',), ('minify.py',), False),
+    Stage('js', _js, (), ('generate_js',), ('minify.py',), False),
+    Stage('calendar', _calendar, (), (), CALENDAR_SOURCES, True),
+    Stage('html', _html, ('svg', 'css', 'calendar'), ('generate_html',), ('templates/index.html',), True),
+    Stage('pages', _pages, ('normalize', 'css'), ('generate_league_pages',),
+          ('templates/league.html', 'Data/stadiums.csv'), True),
+    Stage('markers', _markers, (), ('LEAGUE_COLORS', 'stadium_map.map_json'), ('Data/stadiums.csv',), False),
+]
+
+# The write stage always runs; it only touches files whose content changed
+WRITE_DEPS = ('serialize', 'css', 'js', 'html', 'pages', 'markers', 'calendar')
+
+
+def _hash_file(path):
+    """Hash a file's contents; optional inputs that do not exist yet hash to ''"""
+    path = os.path.join(ROOT, path)
+    if not os.path.exists(path):
+        return ''
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def stage_key(stage, input_hashes):
+    """Compute the cache key of a stage from its code, files and input hashes"""
+    h = hashlib.sha256(stage.name.encode())
+    seen = set()
+    _hash_value(stage.run, h, seen)
+    for name in stage.code:
+        _hash_value(_resolve(name), h, seen)
+    for path in stage.files:
+        h.update(_hash_file(path).encode())
+    for dep in stage.deps:
+        h.update(input_hashes[dep].encode())
+    if stage.daily:
+        h.update(datetime.now().strftime('%Y-%m-%d').encode())
+    return h.hexdigest()[:16]
+
+
+def _run_stage(stage, outputs, hashes, force):
+    """Run one stage or load it from cache, returning (output, output_hash, cached)"""
+    key = stage_key(stage, hashes)
+    path = os.path.join(CACHE_DIR, f'{stage.name}-{key}.pkl')
+    if not force and os.path.exists(path):
+        with open(path, 'rb') as f:
+            output_hash, output = pickle.load(f)
+        return output, output_hash, True
+
+    output = stage.run(**{dep: outputs[dep] for dep in stage.deps})
+    blob = pickle.dumps(output)
+    output_hash = hashlib.sha256(blob).hexdigest()
+    if output is None:
+        # A failed fetch returns None; retry it on the next build instead of caching it
+        return output, output_hash, False
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Drop stale entries for this stage before writing the new one
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(f'{stage.name}-'):
+            os.remove(os.path.join(CACHE_DIR, name))
+    with open(path, 'wb') as f:
+        pickle.dump((output_hash, output), f)
+    return output, output_hash, False
+
+
+def build(force=False, max_workers=4, verbose=True, out_dir=ROOT):
+    """Run the build graph, running independent stages concurrently, writing into out_dir
+
+    Returns (rebuilt, written): the stages that were not loaded from cache and
+    the output files whose content changed.
+    """
+    pending = {stage.name: stage for stage in STAGES}
+    outputs = {}
+    hashes = {}
+    rebuilt = []
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running = {}
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if all(dep in hashes for dep in stage.deps):
+                    started = time.perf_counter()
+                    future = pool.submit(_run_stage, stage, dict(outputs), dict(hashes), force)
+                    running[future] = (stage, started)
+                    del pending[name]
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, started = running.pop(future)
+                outputs[stage.name], hashes[stage.name], cached = future.result()
+                if not cached:
+                    rebuilt.append(stage.name)
+                if verbose:
+                    status = 'cached' if cached else f'built in {time.perf_counter() - started:.2f}s'
+                    print(f"  {'✓' if cached else '⚙'} {stage.name:<10} {status}")
+
+    written = _write(**{dep: outputs[dep] for dep in WRITE_DEPS}, out_dir=out_dir)
+    if verbose:
+        _size_report(outputs['serialize'], outputs['css'], outputs['js'])
+        print(f"  ✓ write      {len(written)} file(s) changed")
+        print(f"Build finished in {time.perf_counter() - start:.2f}s")
+    return rebuilt, written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the Sports Hub site')
+    parser.add_argument('--force', action='store_true', help='ignore cached stage outputs')
+    parser.add_argument('--jobs', type=int, default=4, help='stages to run concurrently')
+    args = parser.parse_args()
+    build(force=args.force, max_workers=args.jobs)
@@ -0,0 +1,151 @@
+import hashlib
+import os
+import time
+
+import numpy as np
+
+import games as game_store
+from ingest import save_cache
+
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Data', 'cache')
+# Bump when the computed columns change
+REST_VERSION = 2
+
+# Consecutive home games that count as a long homestand in each league
+LONG_HOMESTAND = {'MLB': 9, 'MLS': 3, 'NBA': 5, 'NFL': 3, 'NHL': 5}
+
+COLUMNS = ['Team', 'Season', 'Date', 'Game', 'IsHome', 'RestDays', 'BackToBack', 'Doubleheader', 'ThreeInFour',
+           'HomestandLength', 'LongHomestand']
+
+
+def rest_analytics(games, league=None):
+    """Rest and schedule-density flags for every team's every game, in one vectorized pass
+
+    Returns one row per team per game, sorted by team, season and date, with
+    'RestDays' (full days off since the team's previous game, -1 for its first
+    game of the season, 0 for the second game of a doubleheader), 'BackToBack'
+    (previous game the day before), 'Doubleheader' (the team plays twice that
+    day; set on both games), 'ThreeInFour' (third game within four days),
+    'HomestandLength' (length of the run of home games the game belongs to, 0
+    when away) and 'LongHomestand'.
+    """
+    rows = game_store.team_game_rows(games)
+    n = len(rows['Team'])
+    starts, is_start = game_store.group_starts(rows['Team'], rows['Season'])
+    days = rows['Date'].astype(np.int64)
+
+    # Days since the team's previous game in the season; 0 within a doubleheader, -1 for the first game
+    gap = np.full(n, -1, dtype=np.int64)
+    gap[1:] = days[1:] - days[:-1]
+    gap[is_start] = -1
+    rest = np.where(gap > 0, gap - 1, gap)
+    same_day = gap == 0
+    doubleheader = same_day | np.append(same_day[1:], False)
+
+    # Two games back must be in the same team-season: no season start at i or i-1
+    three_in_four = np.zeros(n, bool)
+    same_group = ~is_start[2:] & ~is_start[1:-1]
+    three_in_four[2:] = same_group & (days[2:] - days[:-2] <= 3)
+
+    # Homestands: runs of home games, split at season starts
+    home = rows['IsHome']
+    run_start = home & (is_start | np.concatenate([[True], ~home[:-1]]))
+    run_id = np.cumsum(run_start) - 1
+    run_length = np.bincount(run_id[home], minlength=run_start.sum())
+    homestand = np.where(home, run_length[np.maximum(run_id, 0)] if n else 0, 0)
+
+    if league is None:
+        threshold = np.array([LONG_HOMESTAND[l] for l in games['League']])[rows['Game']] if n else 0
+    else:
+        threshold = LONG_HOMESTAND[league]
+
+    return {
+        'Team': rows['Team'],
+        'Season': rows['Season'],
+        'Date': rows['Date'],
+        'Game': rows['Game'],
+        'IsHome': home,
+        'RestDays': rest,
+        'BackToBack': gap == 1,
+        'Doubleheader': doubleheader,
+        'ThreeInFour': three_in_four,
+        'HomestandLength': homestand,
+        'LongHomestand': homestand >= threshold,
+    }
+
+
+def _season_digest(games):
+    h = hashlib.sha256()
+    for column in ('Date', 'Home', 'Away'):
+        h.update(np.ascontiguousarray(games[column]).tobytes())
+    return h.hexdigest()[:16]
+
+
+def _cache_path(league, season, digest):
+    return os.path.join(CACHE_DIR, f'rest-{league}_{season}-v{REST_VERSION}-{digest}.npz')
+
+
+# Season results already loaded in this process, by cache file
+_loaded = {}
+
+
+def season_rest(season_games):
+    """rest_analytics for one league's season, cached in Data/cache keyed by its schedule
+
+    'Game' indexes into season_games, so results for the same schedule from
+    different stores are interchangeable.
+    """
+    league, season = season_games['League'][0], int(season_games['Season'][0])
+    target = _cache_path(league, season, _season_digest(season_games))
+    if target in _loaded:
+        return _loaded[target]
+    if os.path.exists(target):
+        with np.load(target) as cached:
+            result = {column: cached[column] for column in COLUMNS}
+    else:
+        result = rest_analytics(season_games, league)
+        save_cache(target, _cache_path(league, season, '*'), lambda f: np.savez(f, **result))
+    _loaded[target] = result
+    return result
+
+
+def archive_rest(games):
+    """rest_analytics for a multi-season store, assembled from cached per-season results"""
+    order = np.lexsort((games['Season'], games['League']))
+    starts, _ = game_store.group_starts(games['League'][order], games['Season'][order])
+    parts = []
+    for lo, hi in zip(starts, np.append(starts[1:], len(order))):
+        rows = order[lo:hi]
+        result = dict(season_rest({column: values[rows] for column, values in games.items()}))
+        result['Game'] = rows[result['Game']]
+        parts.append(result)
+    if not parts:
+        # Nothing to cache; the one-pass version returns typed empty columns
+        return rest_analytics(games)
+    return {column: np.concatenate([part[column] for part in parts]) for column in COLUMNS}
+
+
+if __name__ == '__main__':
+    archive = game_store.demo_games(['NBA', 'NHL'])
+    seasons = sorted({(l, int(s)) for l, s in zip(archive['League'], archive['Season'])})
+
+    start = time.perf_counter()
+    everything = rest_analytics(archive)
+    print(f"✓ {len(everything['Team'])} team-games over {len(seasons)} league-seasons "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms (one pass)")
+
+    for label in ('first run', 'disk cache', 'memory cache'):
+        if label == 'disk cache':
+            _loaded.clear()
+        start = time.perf_counter()
+        archive_rest(archive)
+        print(f"✓ Per-season results ({label}) in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for league in ('NBA', 'NHL'):
+        mask = archive['League'][everything['Game']] == league
+        teams = np.unique(everything['Team'][mask]).size * len({s for l, s in seasons if l == league})
+        print(f"  {league}: {everything['BackToBack'][mask].sum() / teams:.1f} back-to-backs, "
+              f"{everything['ThreeInFour'][mask].sum() / teams:.1f} 3-in-4s and "
+              f"{everything['LongHomestand'][mask].sum() / teams:.1f} "
+              f"long-homestand games per team-season")
@@ -0,0 +1,319 @@
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import games as game_store
+from elo import EloEngine, win_probability
+from hierarchy import get_hierarchy
+from standings import POINTS, Standings
+
+
+# Playoff formats per conference. 'seeding' is 'division' (division winners take
+# the top seeds, then wild cards), 'conference' (best records) or 'nhl' (top
+# three per division plus two wild cards). 'play_in' fills the last bracket
+# seeds, 'bracket' lists seeds in bracket order (None is a bye), 'rounds' gives
+# each conference round's series length and 'final' the championship's.
+PLAYOFF_FORMATS = {
+    'MLB': {'seeding': 'division', 'seeds': 6, 'play_in': None, 'bracket': [1, None, 4, 5, 2, None, 3, 6],
+            'rounds': [3, 5, 7], 'reseed': False, 'final': 7, 'neutral_final': False},
+    'MLS': {'seeding': 'conference', 'seeds': 9, 'play_in': 'mls', 'bracket': [1, 8, 4, 5, 3, 6, 2, 7],
+            'rounds': [3, 1, 1], 'reseed': False, 'final': 1, 'neutral_final': False},
+    'NBA': {'seeding': 'conference', 'seeds': 10, 'play_in': 'nba', 'bracket': [1, 8, 4, 5, 3, 6, 2, 7],
+            'rounds': [7, 7, 7], 'reseed': False, 'final': 7, 'neutral_final': False},
+    'NFL': {'seeding': 'division', 'seeds': 7, 'play_in': None, 'bracket': [1, None, 4, 5, 3, 6, 2, 7],
+            'rounds': [1, 1, 1], 'reseed': True, 'final': 1, 'neutral_final': True},
+    'NHL': {'seeding': 'nhl', 'seeds': 8, 'play_in': None, 'bracket': [1, 8, 3, 5, 2, 7, 4, 6],
+            'rounds': [7, 7, 7], 'reseed': False, 'final': 7, 'neutral_final': False},
+}
+
+# Share of games drawn, for leagues that allow draws
+DRAW_RATES = {'MLS': 0.25}
+
+# Runs per independently seeded chunk; results do not depend on the worker count
+CHUNK_RUNS = 2500
+
+# Per-process simulation inputs, set by _init_sim_worker
+_sim_context = {}
+
+
+def series_probability(p, best_of):
+    """Chance of winning a best-of series given a per-game win probability"""
+    need = (best_of + 1) // 2
+    total = np.zeros_like(p)
+    for losses in range(need):
+        # Win `need` games while losing `losses`, the last game being a win
+        ways = np.prod(np.arange(need, need + losses)) / np.prod(np.arange(1, losses + 1)) if losses else 1
+        total += ways * p ** need * (1 - p) ** losses
+    return total
+
+
+def _init_sim_worker(context):
+    _sim_context.update(context)
+
+
+def _top(key, teams, n, taken=None):
+    """The n best of `teams` per run by key, best first, skipping teams already taken"""
+    k = key[:, teams].copy()
+    if taken is not None:
+        k[taken[:, teams]] = -np.inf
+    return teams[np.argsort(-k, axis=1, kind='stable')[:, :n]]
+
+
+def _mark(taken, picked):
+    taken[np.arange(len(taken))[:, None], picked] = True
+
+
+def _seed_conference(key, conference, fmt):
+    """Teams in seed order per run, shape (runs, seeds), for one conference"""
+    ctx = _sim_context
+    runs = len(key)
+    teams = ctx['conference_teams'][conference]
+    divisions = ctx['conference_divisions'][conference]
+    taken = np.zeros(key.shape, bool)
+    if fmt['seeding'] == 'conference':
+        return _top(key, teams, fmt['seeds'])
+    if fmt['seeding'] == 'division':
+        winners = np.stack([_top(key, division, 1)[:, 0] for division in divisions], axis=1)
+        winners = winners[np.arange(runs)[:, None], np.argsort(-key[np.arange(runs)[:, None], winners], axis=1)]
+        _mark(taken, winners)
+        return np.concatenate([winners, _top(key, teams, fmt['seeds'] - len(divisions), taken)], axis=1)
+    # NHL: top three of each division, the better division winner's division first, then two wild cards
+    tops = [_top(key, division, 3) for division in divisions]
+    first = key[np.arange(runs), tops[0][:, 0]] >= key[np.arange(runs), tops[1][:, 0]]
+    a = np.where(first[:, None], tops[0], tops[1])
+    b = np.where(first[:, None], tops[1], tops[0])
+    for top in tops:
+        _mark(taken, top)
+    wild = _top(key, teams, 2, taken)
+    return np.stack([a[:, 0], b[:, 0], a[:, 1], b[:, 1], a[:, 2], b[:, 2], wild[:, 0], wild[:, 1]], axis=1)
+
+
+def _play(a, b, best_of, rng, neutral=False):
+    """Winners of matchups where a is the higher seed (home side); b == -1 is a bye"""
+    ctx = _sim_context
+    rating, home_advantage = ctx['rating'], ctx['home_advantage']
+    safe_b = np.maximum(b, 0)
+    if neutral:
+        p = win_probability(rating[a] - rating[safe_b])
+    else:
+        p_home = win_probability(rating[a] + home_advantage[a] - rating[safe_b])
+        if best_of == 1:
+            p = p_home
+        else:
+            p_away = win_probability(rating[a] - rating[safe_b] - home_advantage[safe_b])
+            p = series_probability((p_home + p_away) / 2, best_of)
+    return np.where((b < 0) | (rng.random(len(a)) < p), a, b)
+
+
+def _play_in(seeded, kind, rng):
+    """Resolve play-in games, returning the eight bracket seeds"""
+    if kind == 'mls':
+        return np.concatenate([seeded[:, :7], _play(seeded[:, 7], seeded[:, 8], 1, rng)[:, None]], axis=1)
+    seven, eight, nine, ten = seeded[:, 6], seeded[:, 7], seeded[:, 8], seeded[:, 9]
+    first = _play(seven, eight, 1, rng)
+    first_loser = np.where(first == seven, eight, seven)
+    last = _play(first_loser, _play(nine, ten, 1, rng), 1, rng)
+    return np.concatenate([seeded[:, :6], first[:, None], last[:, None]], axis=1)
+
+
+def _bracket(seeds, fmt, rng):
+    """Play a conference bracket, returning each round's winners, shape (runs, teams left)"""
+    runs = len(seeds)
+    slots = np.array([-1 if s is None else s - 1 for s in fmt['bracket']])
+    teams = np.where(slots >= 0, seeds[:, np.maximum(slots, 0)], -1)
+    numbers = np.where(slots >= 0, slots + 1, 99) * np.ones((runs, 1), dtype=np.int64)
+    winners_by_round = []
+    for best_of in fmt['rounds']:
+        if fmt['reseed']:
+            order = np.argsort(numbers, axis=1, kind='stable')
+            n = order.shape[1]
+            pairing = np.ravel(np.column_stack([np.arange(n // 2), n - 1 - np.arange(n // 2)]))
+            order = order[:, pairing]
+            teams = np.take_along_axis(teams, order, axis=1)
+            numbers = np.take_along_axis(numbers, order, axis=1)
+        left, right = teams[:, ::2], teams[:, 1::2]
+        left_n, right_n = numbers[:, ::2], numbers[:, 1::2]
+        left_home = left_n <= right_n
+        home = np.where(left_home, left, right)
+        away = np.where(left_home, right, left)
+        winners = _play(home.ravel(), away.ravel(), best_of, rng).reshape(home.shape)
+        numbers = np.where(winners == left, left_n, right_n)
+        teams = winners
+        winners_by_round.append(winners)
+    return winners_by_round
+
+
+def _playoffs(seeded_by_conference, key, fmt, rng):
+    """Play every conference bracket and the final
+
+    Returns counts per team, shape (teams, rounds + 2): column 0 counts runs in
+    which the team made the bracket (after any play-in), column r runs in which
+    it won conference round r, and the last column championships.
+    """
+    runs, n_teams = key.shape
+    reach = np.zeros((n_teams, len(fmt['rounds']) + 2), dtype=np.int64)
+    finalists = []
+    for seeded in seeded_by_conference:
+        bracket_seeds = _play_in(seeded, fmt['play_in'], rng) if fmt['play_in'] else seeded
+        reach[:, 0] += np.bincount(bracket_seeds.ravel(), minlength=n_teams)
+        winners_by_round = _bracket(bracket_seeds, fmt, rng)
+        for r, winners in enumerate(winners_by_round, 1):
+            reach[:, r] += np.bincount(winners[winners >= 0], minlength=n_teams)
+        finalists.append(winners_by_round[-1][:, 0])
+
+    a, b = finalists
+    better = key[np.arange(runs), a] >= key[np.arange(runs), b]
+    home, away = np.where(better, a, b), np.where(better, b, a)
+    champion = _play(home, away, fmt['final'], rng, neutral=fmt['neutral_final'])
+    reach[:, -1] = np.bincount(champion, minlength=n_teams)
+    return reach
+
+
+def _simulate_chunk(job):
+    """Play out the rest of the season and the playoffs for one seeded chunk of runs"""
+    seed, runs = job
+    ctx = _sim_context
+    rng = np.random.default_rng(seed)
+    fmt = PLAYOFF_FORMATS[ctx['league']]
+    n_teams = len(ctx['rating'])
+
+    u = rng.random((runs, len(ctx['p_home'])))
+    draw = DRAW_RATES.get(ctx['league'], 0.0)
+    home_win = u < ctx['p_home'] * (1 - draw)
+    away_win = u >= 1 - (1 - ctx['p_home']) * (1 - draw)
+    tie = ~home_win & ~away_win
+    home_games, away_games = ctx['home_onehot'], ctx['away_onehot']
+    wins = ctx['wins'] + home_win.astype(np.float32) @ home_games + away_win.astype(np.float32) @ away_games
+    ties = ctx['ties'] + tie.astype(np.float32) @ (home_games + away_games)
+    if ctx['league'] in POINTS:
+        win_points, tie_points = POINTS[ctx['league']]
+        key = wins * win_points + ties * tie_points
+    else:
+        key = (wins + 0.5 * ties) / np.maximum(ctx['games_played'], 1)
+    # Random tiebreaker in place of each league's rulebook
+    key = key + rng.random(key.shape) * 1e-6
+
+    seed_counts = np.zeros((n_teams, fmt['seeds']), dtype=np.int64)
+    seeded_by_conference = [_seed_conference(key, c, fmt) for c in range(len(ctx['conference_teams']))]
+    for seeded in seeded_by_conference:
+        np.add.at(seed_counts, (seeded, np.arange(seeded.shape[1])), 1)
+    reach = _playoffs(seeded_by_conference, key, fmt, rng)
+    return {
+        'Wins': wins.sum(axis=0),
+        'Playoffs': reach[:, 0],
+        'Seeds': seed_counts,
+        'ConferenceTitle': reach[:, -2],
+        'Championship': reach[:, -1],
+    }
+
+
+def simulate_season(games, league, n_runs=20000, as_of=None, engine=None, seed=0, max_workers=None):
+    """Odds for every team in a league from simulating the rest of its season n_runs times
+
+    games holds the league's season, played and unplayed. Results up to as_of
+    (default: every game with a score) set the current standings and, unless an
+    EloEngine with history is passed in, the ratings used for win probabilities.
+    Returns columns 'Team', 'Wins' (mean final wins), 'Playoffs', 'Seeds' (one
+    column of odds per seed), 'ConferenceTitle' and 'Championship'.
+    """
+    hierarchy = get_hierarchy()
+    teams = hierarchy.members('league', hierarchy.group('league', league))
+    local = np.full(len(hierarchy.teams), -1)
+    local[teams] = np.arange(len(teams))
+
+    season = {column: values[games['League'] == league] for column, values in games.items()}
+    played = (season['HomeScore'] >= 0) & (season['AwayScore'] >= 0)
+    if as_of is not None:
+        played &= season['Date'] <= np.datetime64(as_of, 'D')
+    done = {column: values[played] for column, values in season.items()}
+    remaining = {column: values[~played] for column, values in season.items()}
+
+    standings = Standings()
+    standings.record(done)
+    if engine is None:
+        engine = EloEngine()
+        engine.process(done)
+    p_home = engine.predict(remaining['Home'], remaining['Away'])
+
+    def onehot(team_ids):
+        matrix = np.zeros((len(team_ids), len(teams)), dtype=np.float32)
+        matrix[np.arange(len(team_ids)), local[team_ids]] = 1
+        return matrix
+
+    conference_codes = hierarchy.children('league', hierarchy.group('league', league))
+    context = {
+        'league': league,
+        'rating': engine.ratings[0, teams],
+        'home_advantage': engine.home_advantage[0, teams],
+        'p_home': p_home,
+        'home_onehot': onehot(remaining['Home']),
+        'away_onehot': onehot(remaining['Away']),
+        'wins': standings.state['Wins'][teams].astype(np.float32),
+        'ties': standings.state['Ties'][teams].astype(np.float32),
+        'games_played': np.bincount(local[np.concatenate([season['Home'], season['Away']])], minlength=len(teams)),
+        'conference_teams': [local[hierarchy.members('conference', c)] for c in conference_codes],
+        'conference_divisions': [
+            [local[hierarchy.members('division', d)] for d in hierarchy.children('conference', c)]
+            for c in conference_codes
+        ],
+    }
+
+    chunks = [min(CHUNK_RUNS, n_runs - start) for start in range(0, n_runs, CHUNK_RUNS)]
+    jobs = list(zip(np.random.SeedSequence(seed).spawn(len(chunks)), chunks))
+    if max_workers == 1 or len(jobs) == 1:
+        _init_sim_worker(context)
+        results = list(map(_simulate_chunk, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sim_worker,
+                                 initargs=(context,)) as pool:
+            results = list(pool.map(_simulate_chunk, jobs))
+
+    totals = {name: sum(result[name] for result in results) for name in results[0]}
+    return {
+        'Team': hierarchy.teams[teams],
+        'Wins': totals['Wins'] / n_runs,
+        'Playoffs': totals['Playoffs'] / n_runs,
+        'Seeds': totals['Seeds'] / n_runs,
+        'ConferenceTitle': totals['ConferenceTitle'] / n_runs,
+        'Championship': totals['Championship'] / n_runs,
+    }
+
+
+def simulate_playoffs(league, seeded_by_conference, rating, home_advantage, record, n_runs=20000, seed=0):
+    """Monte Carlo playoff odds for fixed seedings, for checking against exact bracket results
+
+    seeded_by_conference lists each conference's teams in seed order as indices
+    into rating, home_advantage and record (the regular-season mark that decides
+    home advantage in the final). Returns the share of runs in which each team
+    reached each stage, in the layout of _playoffs.
+    """
+    _init_sim_worker({'league': league, 'rating': rating, 'home_advantage': home_advantage})
+    rng = np.random.default_rng(seed)
+    key = np.broadcast_to(np.asarray(record, dtype=float), (n_runs, len(rating)))
+    seeded = [np.tile(np.asarray(teams), (n_runs, 1)) for teams in seeded_by_conference]
+    return _playoffs(seeded, key, PLAYOFF_FORMATS[league], rng) / n_runs
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Simulate the rest of a season and its playoffs')
+    parser.add_argument('--league', default='NFL', choices=sorted(PLAYOFF_FORMATS))
+    parser.add_argument('--season', type=int, default=2024)
+    parser.add_argument('--as-of', default=None, help='date of the standings to simulate from')
+    parser.add_argument('--runs', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--jobs', type=int, default=None)
+    args = parser.parse_args()
+
+    games = game_store.demo_games([args.league], [args.season])
+    as_of = args.as_of or str(games['Date'][len(games['Date']) // 2])
+
+    start = time.perf_counter()
+    odds = simulate_season(games, args.league, args.runs, as_of=as_of, seed=args.seed, max_workers=args.jobs)
+    print(f"✓ Simulated {args.runs} {args.league} seasons from {as_of} in {time.perf_counter() - start:.2f}s")
+
+    print(f"\n{'Team':<26} {'Wins':>5} {'Playoffs':>9} {'Top seed':>9} {'Conf':>6} {'Title':>6}")
+    for i in np.argsort(-odds['Championship'])[:12]:
+        print(f"{odds['Team'][i]:<26} {odds['Wins'][i]:5.1f} {odds['Playoffs'][i]:9.1%} "
+              f"{odds['Seeds'][i, 0]:9.1%} {odds['ConferenceTitle'][i]:6.1%} {odds['Championship'][i]:6.1%}")
@@ -0,0 +1,82 @@
+import json
+import time
+
+import numpy as np
+
+from stadiums import STADIUMS_CSV, load_stadiums
+
+
+MAP_FILE = 'stadium-map.json'
+
+# Grid cell size in degrees for each zoom level; the browser uses level
+# floor(log2(projection scale)), so each level is twice as fine as the last
+ZOOM_CELLS = [8.0, 4.0, 2.0, 1.0, 0.25]
+
+
+def cluster_stadiums(lat, lon, cell):
+    """Group points into grid cells of `cell` degrees
+
+    Returns each cluster's centroid latitude and longitude, its member indices
+    (grouped by cluster) and the offset of each cluster's first member.
+    """
+    keys = np.stack([np.floor(lat / cell), np.floor(lon / cell)], axis=1)
+    _, cluster = np.unique(keys, axis=0, return_inverse=True)
+    cluster = cluster.ravel()
+    counts = np.bincount(cluster)
+    centroid_lat = np.bincount(cluster, weights=lat) / counts
+    centroid_lon = np.bincount(cluster, weights=lon) / counts
+    members = np.argsort(cluster, kind='stable')
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    return centroid_lat, centroid_lon, members, offsets
+
+
+def build_map_data(colors, path=STADIUMS_CSV):
+    """Marker data for the combined map and one map per league, clustered at every zoom level
+
+    Everything is stored as parallel arrays; cluster members are indices into
+    'teams', so each name is sent once however many levels show it.
+    """
+    stadiums = load_stadiums(path)
+    leagues = sorted(np.unique(stadiums['Sport']))
+    maps = {'all': np.arange(len(stadiums['Team']))}
+    for league in leagues:
+        maps[league.lower()] = np.flatnonzero(stadiums['Sport'] == league)
+
+    data = {
+        'cells': ZOOM_CELLS,
+        'leagues': leagues,
+        'colors': [colors.get(league, '#444444') for league in leagues],
+        'teams': stadiums['Team'].tolist(),
+        'league': np.searchsorted(leagues, stadiums['Sport']).tolist(),
+        'maps': {},
+    }
+    for name, rows in maps.items():
+        lat, lon = stadiums['Latitude'][rows], stadiums['Longitude'][rows]
+        levels = []
+        for cell in ZOOM_CELLS:
+            centroid_lat, centroid_lon, members, offsets = cluster_stadiums(lat, lon, cell)
+            levels.append({
+                'lat': np.round(centroid_lat, 3).tolist(),
+                'lon': np.round(centroid_lon, 3).tolist(),
+                'members': rows[members].tolist(),
+                'offsets': offsets.tolist(),
+            })
+        data['maps'][name] = levels
+    return data
+
+
+def map_json(colors, path=STADIUMS_CSV):
+    """Serialize the map data as compact JSON for the lazily fetched stadium-map.json"""
+    return json.dumps(build_map_data(colors, path), separators=(',', ':'), ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    from test5 import LEAGUE_COLORS
+
+    start = time.perf_counter()
+    data = map_json(LEAGUE_COLORS)
+    print(f"✓ Built {MAP_FILE} ({len(data.encode('utf-8')) / 1024:.1f} KB) "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+    for name, levels in json.loads(data)['maps'].items():
+        counts = ' → '.join(str(len(level['lat'])) for level in levels)
+        print(f"  {name:<4} markers per zoom level: {counts}")
@@ -0,0 +1,118 @@
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ingest import STADIUMS, file_hash, load_table
+
+
+STADIUMS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Data', 'stadiums.csv')
+EARTH_RADIUS_MILES = 3958.8
+
+
+def load_stadiums(path=STADIUMS_CSV):
+    """Load the validated stadiums table into read-only NumPy columns keyed by header
+
+    Parsed once per version of the file: editing the CSV is picked up on the
+    next call, even in a long-running process.
+    """
+    return _load_stadiums(path, file_hash(path))
+
+
+@lru_cache(maxsize=8)
+def _load_stadiums(path, csv_hash):
+    stadiums = load_table(path, STADIUMS)
+    # The result is shared by every caller, so guard it against accidental edits
+    for column in stadiums.values():
+        column.flags.writeable = False
+    return stadiums
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance in miles; arguments are degrees and broadcast like NumPy arrays"""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def unit_vectors(lat, lon):
+    """Points on the unit sphere for latitudes/longitudes in degrees"""
+    lat, lon = np.radians(lat), np.radians(lon)
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _chord_to_miles(chord):
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+def _miles_to_chord(miles):
+    return 2 * np.sin(np.minimum(miles / (2 * EARTH_RADIUS_MILES), np.pi / 2))
+
+
+class StadiumIndex:
+    """KD-tree over stadium positions on the unit sphere
+
+    Straight-line (chord) distance between unit vectors grows monotonically with
+    great-circle distance, so a Euclidean KD-tree answers haversine queries exactly.
+    """
+
+    def __init__(self, sport=None, path=STADIUMS_CSV):
+        stadiums = load_stadiums(path)
+        if sport is None:
+            self.rows = np.arange(len(stadiums['Team']))
+        else:
+            self.rows = np.flatnonzero(stadiums['Sport'] == sport)
+        self.stadiums = stadiums
+        self.tree = cKDTree(unit_vectors(stadiums['Latitude'][self.rows], stadiums['Longitude'][self.rows]))
+
+    def nearest(self, lat, lon, k=1):
+        """Rows of the k nearest stadiums to a point and their distances in miles, closest first"""
+        k = min(k, len(self.rows))
+        chord, idx = self.tree.query(unit_vectors(lat, lon), k=k)
+        idx = np.atleast_1d(idx)
+        return self.rows[idx], _chord_to_miles(np.atleast_1d(chord))
+
+    def within(self, lat, lon, radius_miles):
+        """Rows of all stadiums within radius_miles of a point and their distances, closest first"""
+        point = unit_vectors(lat, lon)
+        idx = np.asarray(self.tree.query_ball_point(point, _miles_to_chord(radius_miles)), dtype=np.intp)
+        miles = _chord_to_miles(np.linalg.norm(self.tree.data[idx] - point, axis=-1))
+        order = np.argsort(miles, kind='stable')
+        return self.rows[idx[order]], miles[order]
+
+
+def get_index(sport=None):
+    """Shared StadiumIndex for a sport (or all sports), rebuilt when the CSV changes"""
+    return _get_index(sport, file_hash(STADIUMS_CSV))
+
+
+@lru_cache(maxsize=16)
+def _get_index(sport, csv_hash):
+    return StadiumIndex(sport)
+
+
+if __name__ == '__main__':
+    stadiums = load_stadiums()
+    index = get_index()
+    lat, lon = 41.8781, -87.6298  # Chicago Loop
+
+    rows, miles = index.nearest(lat, lon, k=5)
+    print("Nearest venues to downtown Chicago:")
+    for row, distance in zip(rows, miles):
+        print(f"  {stadiums['Team'][row]:<28} {stadiums['Sport'][row]:<4} {distance:6.1f} mi")
+
+    rows, miles = get_index('NFL').within(lat, lon, 300)
+    print(f"\nNFL venues within 300 miles: {', '.join(stadiums['Team'][rows])}")
+
+    n = 10000
+    start = time.perf_counter()
+    for _ in range(n):
+        index.nearest(lat, lon, k=5)
+    print(f"\nk-nearest query: {(time.perf_counter() - start) / n * 1e6:.1f} µs")
+    start = time.perf_counter()
+    for _ in range(n):
+        index.within(lat, lon, 100)
+    print(f"Radius query:    {(time.perf_counter() - start) / n * 1e6:.1f} µs")
@@ -0,0 +1,214 @@
+import time
+
+import numpy as np
+
+import games as game_store
+from hierarchy import get_hierarchy
+
+
+# Per-team counters; Streak is +n for n straight wins, -n for losses, 0 after a tie
+FIELDS = ['Wins', 'Losses', 'Ties', 'PointsFor', 'PointsAgainst',
+          'HomeWins', 'HomeLosses', 'HomeTies', 'AwayWins', 'AwayLosses', 'AwayTies', 'Streak']
+
+# (points per win, points per tie) for leagues ranked by points; the rest rank by win percentage
+POINTS = {'MLS': (3, 1), 'NHL': (2, 1)}
+
+# Days between the checkpoints StandingsHistory keeps
+CHECKPOINT_DAYS = 7
+
+
+class Standings:
+    """Standings for every team, updated in place from batches of final results
+
+    Each team's counters cover its latest season seen; its first result of a new
+    season resets them, so a multi-season store yields the latest season's table.
+    """
+
+    def __init__(self, state=None):
+        self.hierarchy = get_hierarchy()
+        n = len(self.hierarchy.teams)
+        if state is None:
+            state = {field: np.zeros(n, dtype=np.int64) for field in FIELDS}
+            # The season each team's counters belong to, 0 before its first result
+            state['Season'] = np.zeros(n, dtype=np.int64)
+        self.state = state
+        leagues = self.hierarchy.names['league'][self.hierarchy.codes['league']]
+        self.win_points = np.array([POINTS.get(league, (0, 0))[0] for league in leagues])
+        self.tie_points = np.array([POINTS.get(league, (0, 0))[1] for league in leagues])
+        self.ranked_by_points = self.win_points > 0
+
+    def copy(self):
+        return Standings({field: values.copy() for field, values in self.state.items()})
+
+    def record(self, games):
+        """Apply a game store (or slice of one) of results; unplayed games are skipped"""
+        played = (games['HomeScore'] >= 0) & (games['AwayScore'] >= 0)
+        if not played.any():
+            return
+        games = {column: values[played] for column, values in games.items()}
+        rows = game_store.team_game_rows(games)
+        n = len(self.hierarchy.teams)
+        s = self.state
+
+        # Start over for teams whose latest season in the batch is new, then keep only that season
+        latest = s['Season'].copy()
+        np.maximum.at(latest, rows['Team'], rows['Season'].astype(np.int64))
+        new_season = latest > s['Season']
+        for field in FIELDS:
+            s[field][new_season] = 0
+        s['Season'] = latest
+        current = rows['Season'] == latest[rows['Team']]
+        rows = {column: values[current] for column, values in rows.items()}
+        if not len(rows['Team']):
+            return
+        team = rows['Team']
+        result = np.sign(rows['For'].astype(np.int64) - rows['Against'])
+
+        def count(mask):
+            return np.bincount(team[mask], minlength=n)
+
+        home = rows['IsHome']
+        for outcome, name in ((1, 'Wins'), (-1, 'Losses'), (0, 'Ties')):
+            s[name] += count(result == outcome)
+            s[f'Home{name}'] += count((result == outcome) & home)
+            s[f'Away{name}'] += count((result == outcome) & ~home)
+        s['PointsFor'] += np.bincount(team, weights=rows['For'], minlength=n).astype(np.int64)
+        s['PointsAgainst'] += np.bincount(team, weights=rows['Against'], minlength=n).astype(np.int64)
+
+        # Streaks: the last run of equal results per team, rows being in date order per team
+        starts, _ = game_store.group_starts(team)
+        ends = np.append(starts[1:], len(team))
+        run_start = np.ones(len(team), bool)
+        run_start[1:] = (team[1:] != team[:-1]) | (result[1:] != result[:-1])
+        last_run = np.maximum.accumulate(np.where(run_start, np.arange(len(team)), 0))[ends - 1]
+        last = result[ends - 1]
+        teams = team[starts]
+        previous = s['Streak'][teams]
+        carried = (last_run == starts) & (np.sign(previous) == last) & (last != 0)
+        s['Streak'][teams] = last * (ends - last_run) + np.where(carried, previous, 0)
+
+    def points(self):
+        """League points for point-ranked leagues, 0 elsewhere"""
+        return self.state['Wins'] * self.win_points + self.state['Ties'] * self.tie_points
+
+    def win_pct(self):
+        """Winning percentage with ties counted as half a win"""
+        s = self.state
+        played = s['Wins'] + s['Losses'] + s['Ties']
+        return np.divide(s['Wins'] + 0.5 * s['Ties'], played, out=np.zeros(len(played)), where=played > 0)
+
+    def division_ranks(self):
+        """1-based rank of every team within its division
+
+        Point-ranked leagues order by points, the rest by winning percentage; then
+        wins and point differential break ties.
+        """
+        s = self.state
+        key = np.where(self.ranked_by_points, self.points(), self.win_pct())
+        differential = s['PointsFor'] - s['PointsAgainst']
+        division = self.hierarchy.codes['division']
+        order = np.lexsort((-differential, -s['Wins'], -key, division))
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order)) - self.hierarchy.starts['division'][division[order]]
+        return ranks + 1
+
+    def table(self, league):
+        """A league's standings as columns, ordered by division then rank"""
+        h = self.hierarchy
+        teams = h.members('league', h.group('league', league))
+        ranks = self.division_ranks()
+        teams = teams[np.lexsort((ranks[teams], h.codes['division'][teams]))]
+        s = self.state
+        return {
+            'Team': h.teams[teams],
+            'Division': h.display_names['division'][h.codes['division'][teams]],
+            'Rank': ranks[teams],
+            'Wins': s['Wins'][teams],
+            'Losses': s['Losses'][teams],
+            'Ties': s['Ties'][teams],
+            'Pct': self.win_pct()[teams],
+            'Points': self.points()[teams],
+            'Differential': (s['PointsFor'] - s['PointsAgainst'])[teams],
+            'Home': np.char.add(np.char.add(s['HomeWins'][teams].astype(str), '-'), s['HomeLosses'][teams].astype(str)),
+            'Away': np.char.add(np.char.add(s['AwayWins'][teams].astype(str), '-'), s['AwayLosses'][teams].astype(str)),
+            'Streak': s['Streak'][teams],
+        }
+
+
+class StandingsHistory:
+    """Standings replayed from a date-sorted game store, with a checkpoint every few days
+
+    as_of copies the nearest earlier checkpoint and applies at most a few days
+    of results, instead of replaying the season from opening day.
+    """
+
+    def __init__(self, games, every=CHECKPOINT_DAYS):
+        self.games = game_store.sort_games(games)
+        self.every = every
+        self.current = Standings()
+        self.applied = 0
+        first = self.games['Date'][0] if len(self.games['Date']) else np.datetime64('today', 'D')
+        # Checkpoint k holds every result before checkpoint_days[k]
+        self.checkpoint_days = [first]
+        self.checkpoints = [self.current.copy()]
+        self._advance(len(self.games['Date']))
+
+    def _advance(self, upto):
+        """Apply stored games up to index upto, checkpointing at every boundary crossed"""
+        dates = self.games['Date']
+        while self.applied < upto:
+            boundary = self.checkpoint_days[-1] + self.every
+            stop = min(upto, np.searchsorted(dates, boundary))
+            self.current.record({column: values[self.applied:stop] for column, values in self.games.items()})
+            self.applied = stop
+            if stop < upto:
+                self.checkpoint_days.append(boundary)
+                self.checkpoints.append(self.current.copy())
+
+    def append(self, games):
+        """Record new final results, which must not predate what has already been applied"""
+        if len(games['Date']) and self.applied and games['Date'].min() < self.games['Date'][self.applied - 1]:
+            raise ValueError("New results predate games already in the standings")
+        # Appended after what is already applied, so earlier indices stay put
+        games = game_store.sort_games(games)
+        self.games = {column: np.concatenate([self.games[column], games[column]]) for column in game_store.COLUMNS}
+        self._advance(len(self.games['Date']))
+
+    def as_of(self, date):
+        """Standings including every result up to and including date"""
+        end = np.datetime64(date, 'D') + 1
+        k = np.searchsorted(np.array(self.checkpoint_days), end, 'right') - 1
+        if k < 0:
+            return Standings()
+        standings = self.checkpoints[k].copy()
+        dates = self.games['Date']
+        lo, hi = np.searchsorted(dates, [self.checkpoint_days[k], end])
+        standings.record({column: values[lo:hi] for column, values in self.games.items()})
+        return standings
+
+
+if __name__ == '__main__':
+    season = game_store.demo_games(seasons=[2024])
+
+    start = time.perf_counter()
+    history = StandingsHistory(season)
+    print(f"✓ Replayed {len(season['Date'])} results with {len(history.checkpoints)} checkpoints "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    dates = season['Date'][np.random.default_rng(0).integers(0, len(season['Date']), 200)]
+    start = time.perf_counter()
+    for date in dates:
+        history.as_of(date)
+    print(f"✓ Historical standings rebuilt in {(time.perf_counter() - start) / len(dates) * 1000:.2f} ms per date")
+
+    one_game = {column: values[-1:] for column, values in season.items()}
+    standings = history.current.copy()
+    start = time.perf_counter()
+    standings.record(one_game)
+    print(f"✓ One new result applied in {(time.perf_counter() - start) * 1e6:.0f} µs")
+
+    table = history.current.table('NHL')
+    print("\nNHL final standings (top of each division):")
+    for i in np.flatnonzero(table['Rank'] == 1):
+        print(f"  {table['Division'][i]:<14} {table['Team'][i]:<24} {table['Wins'][i]}-{table['Losses'][i]}  "
+              f"{table['Points'][i]} pts  streak {table['Streak'][i]:+d}")
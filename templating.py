@@ -0,0 +1,77 @@
+import functools
+import html
+import os
+import re
+
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+_TOKEN = re.compile(r'({{.*?}}|{%.*?%}|{#.*?#})', re.S)
+# Block tags on a line of their own do not leave blank lines in the output
+_BLOCK_LINE = re.compile(r'^[ \t]*({%.*?%}|{#.*?#})[ \t]*\n', re.M)
+
+
+def compile_template(source, name='<template>'):
+    """Compile template source into a Python code object
+
+    Supports {{ expr }} (HTML-escaped), {{ expr|safe }} (raw), {# comments #},
+    and {% for x in xs %}/{% endfor %}, {% if c %}/{% elif c %}/{% else %}/{% endif %}
+    blocks, where expressions are plain Python evaluated against the render context.
+    """
+    lines = []
+    depth = 0
+
+    def emit(line):
+        lines.append('    ' * depth + line)
+
+    for token in _TOKEN.split(_BLOCK_LINE.sub(r'\1', source)):
+        if token.startswith('{{'):
+            expr = token[2:-2].strip()
+            if expr.endswith('|safe'):
+                emit(f'_append(str({expr[:-5].strip()}))')
+            else:
+                emit(f'_append(_escape(str({expr})))')
+        elif token.startswith('{%'):
+            tag = token[2:-2].strip()
+            keyword = tag.split(None, 1)[0]
+            if keyword in ('for', 'if'):
+                emit(f'{tag}:')
+                depth += 1
+            elif keyword in ('elif', 'else'):
+                depth -= 1
+                emit(f'{tag}:')
+                depth += 1
+            elif keyword in ('endfor', 'endif'):
+                depth -= 1
+            else:
+                raise SyntaxError(f"Unknown template tag '{tag}' in {name}")
+            if depth < 0:
+                raise SyntaxError(f"Unbalanced '{tag}' in {name}")
+        elif token.startswith('{#'):
+            continue
+        elif token:
+            emit(f'_append({token!r})')
+    if depth:
+        raise SyntaxError(f"Unclosed block in {name}")
+    return compile('\n'.join(lines) or 'pass', name, 'exec')
+
+
+@functools.lru_cache(maxsize=None)
+def _load(path, mtime):
+    """Compile a template file, cached per path and modification time"""
+    with open(path, encoding='utf-8') as f:
+        return compile_template(f.read(), path)
+
+
+def get_template(name):
+    """Return the compiled code for a template in the templates directory"""
+    path = os.path.join(TEMPLATE_DIR, name)
+    return _load(path, os.path.getmtime(path))
+
+
+def render(name, **context):
+    """Render a template from the templates directory with the given context"""
+    out = []
+    namespace = dict(context, _append=out.append, _escape=html.escape)
+    exec(get_template(name), namespace)
+    return ''.join(out)
@@ -2,7 +2,75 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import calendar
 import requests
+import html
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from ingest import STADIUMS, load_table
+from templating import render
+
+
+LEAGUE_COLORS = {
+    'NBA': "#C98613", 
+    'NHL': "#A2AAAD", 
+    'NFL': "#82CD32", 
+    'MLB': "#217EE1",
+    'MLS': "#8E44AD"
+}
+
+# Project cards on the hub and the per-league pages, in display order
+LEAGUE_INFO = [
+    {
+        'name': 'MLB',
+        'icon': '⚾',
+        'description': 'Exploring baseball analytics, player statistics, and game predictions for Major League Baseball.',
+        'projects': ['📈 Player Performance Analytics', '🎯 Win Probability Calculator',
+                     '📊 Team Statistics Dashboard', '🔮 Season Predictions Model'],
+    },
+    {
+        'name': 'NBA',
+        'icon': '🏀',
+        'description': 'Basketball analytics covering player efficiency, shot analysis, and championship predictions.',
+        'projects': ['🎯 Shot Chart Visualization', '📊 Player Efficiency Rating',
+                     '🏆 Playoff Bracket Predictor', '📈 Real-time Game Analytics'],
+    },
+    {
+        'name': 'NFL',
+        'icon': '🏈',
+        'description': 'Football analytics including game simulations, fantasy predictions, and team performance metrics.',
+        'projects': ['🎮 Game Outcome Simulator', '👤 Fantasy Football Optimizer',
+                     '📊 Offensive vs Defensive Stats', '🏆 Super Bowl Predictions'],
+    },
+    {
+        'name': 'NHL',
+        'icon': '🏒',
+        'description': 'Hockey analytics with goalie performance tracking, team comparisons, and playoff forecasting.',
+        'projects': ['🥅 Goalie Performance Tracker', '📊 Team Power Rankings',
+                     '🔥 Hot Streak Analyzer', '🏆 Stanley Cup Predictor'],
+    },
+    {
+        'name': 'MLS',
+        'icon': '⚽',
+        'description': 'Soccer analytics following the MLS season, from conference standings to the MLS Cup playoffs.',
+        'projects': ['📊 Conference Standings Tracker', '✈️ Travel Distance Explorer',
+                     '🔥 Form Guide', '🏆 MLS Cup Predictor'],
+    },
+]
+for _league in LEAGUE_INFO:
+    _league['id'] = _league['name'].lower()
+    _league['page'] = f"leagues/{_league['id']}.html"
+
+STADIUMS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Data', 'stadiums.csv')
+
+# (month offset, bar opacity, legend name) for each season drawn on the timeline
+SEASONS = [
+    (0, 0.3, "Previous<br>Season"),
+    (12, 0.7, "Current<br>Season"),
+    (24, 0.5, "Next<br>Season"),
+]
+
+MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
 
 def fetch_MLB(year):
@@ -59,12 +127,15 @@ def fetch_MLB(year):
 
 def get_league_data(current_year):
     """Get schedule data for all leagues"""
+    return build_league_data(fetch_MLB(current_year))
+
+def build_league_data(mlb_phases):
+    """Combine fetched MLB phases with the fixed phases of the other leagues"""
     data = {
-        'League': ['NBA', 'NHL', 'NFL', 'MLB'],
+        'League': ['NBA', 'NHL', 'NFL', 'MLB', 'MLS'],
         'Phases': []
     }
     
-    mlb_phases = fetch_MLB(current_year)
     year = 12
     
     data['Phases'].append([
@@ -96,37 +167,48 @@ def get_league_data(current_year):
             ('World Series', 10.0, 11.25)
         ])
     
+    data['Phases'].append([
+        ('Pre Season', 1.5, 2.7), 
+        ('Regular Season', 2.7, 10.6), 
+        ('MLS Cup', 10.75, 12.25)
+    ])
+    
     return data
 
+def phase_span(start, end, season_offset=0):
+    """Convert a phase's start/end into timeline x positions and date labels"""
+    if isinstance(start, float) and isinstance(end, float):
+        start_adjusted = start + season_offset
+        end_adjusted = end + season_offset
+
+        start_day = int((start_adjusted - 1) % 1 * 30) + 1
+        end_day = int((end_adjusted - 1) % 1 * 30) + 1
+        start_month = int((start_adjusted - 1) % 12 + 1)
+        start_year = int((start_adjusted - 1) // 12 + (datetime.now().year - 1))
+        end_month = int((end_adjusted - 1) % 12 + 1)
+        end_year = int((end_adjusted - 1) // 12 + (datetime.now().year - 1))
+        start_label = f"{start_day} {calendar.month_abbr[start_month]} {start_year}"
+        end_label = f"{end_day} {calendar.month_abbr[end_month]} {end_year}"
+    else:
+        start_date = datetime.strptime(start, "%Y-%m-%d")
+        end_date = datetime.strptime(end, "%Y-%m-%d")
+        def add_months(dt, months):
+            year = dt.year + (dt.month - 1 + months) // 12
+            month = (dt.month - 1 + months) % 12 + 1
+            day = min(dt.day, calendar.monthrange(year, month)[1])
+            return datetime(year, month, day)
+        start_date_offset = add_months(start_date, season_offset-12)
+        end_date_offset = add_months(end_date, season_offset-12)
+        start_adjusted = start_date_offset.month + (start_date_offset.day - 1) / 30 + (start_date_offset.year - (datetime.now().year - 1)) * 12
+        end_adjusted = end_date_offset.month + (end_date_offset.day - 1) / 30 + (end_date_offset.year - (datetime.now().year - 1)) * 12
+        start_label = start_date_offset.strftime("%d %b")
+        end_label = end_date_offset.strftime("%d %b")
+    return start_adjusted, end_adjusted, start_label, end_label
+
 def plot_season(fig, league, phases, colors, season_offset=0, opacity=0.7, season_name=""):
     """Plot season phases as horizontal bars on a plotly figure."""
     for phase_name, start, end in phases:
-        if isinstance(start, float) and isinstance(end, float):
-            start_adjusted = start + season_offset
-            end_adjusted = end + season_offset
-
-            start_day = int((start_adjusted - 1) % 1 * 30) + 1
-            end_day = int((end_adjusted - 1) % 1 * 30) + 1
-            start_month = int((start_adjusted - 1) % 12 + 1)
-            start_year = int((start_adjusted - 1) // 12 + (datetime.now().year - 1))
-            end_month = int((end_adjusted - 1) % 12 + 1)
-            end_year = int((end_adjusted - 1) // 12 + (datetime.now().year - 1))
-            start_label = f"{start_day} {calendar.month_abbr[start_month]} {start_year}"
-            end_label = f"{end_day} {calendar.month_abbr[end_month]} {end_year}"
-        else:
-            start_date = datetime.strptime(start, "%Y-%m-%d")
-            end_date = datetime.strptime(end, "%Y-%m-%d")
-            def add_months(dt, months):
-                year = dt.year + (dt.month - 1 + months) // 12
-                month = (dt.month - 1 + months) % 12 + 1
-                day = min(dt.day, calendar.monthrange(year, month)[1])
-                return datetime(year, month, day)
-            start_date_offset = add_months(start_date, season_offset-12)
-            end_date_offset = add_months(end_date, season_offset-12)
-            start_adjusted = start_date_offset.month + (start_date_offset.day - 1) / 30 + (start_date_offset.year - (datetime.now().year - 1)) * 12
-            end_adjusted = end_date_offset.month + (end_date_offset.day - 1) / 30 + (end_date_offset.year - (datetime.now().year - 1)) * 12
-            start_label = start_date_offset.strftime("%d %b")
-            end_label = end_date_offset.strftime("%d %b")
+        start_adjusted, end_adjusted, start_label, end_label = phase_span(start, end, season_offset)
 
         fig.add_trace(go.Bar(
             x=[end_adjusted - start_adjusted],
@@ -148,7 +230,7 @@ def plot_season(fig, league, phases, colors, season_offset=0, opacity=0.7, seaso
             )
         ))
 
-def create_sports_timeline():
+def create_sports_timeline(data=None):
     """Create mobile-optimized interactive sports timeline visualization"""
     now = datetime.now()
     current_year = now.year
@@ -156,22 +238,15 @@ def create_sports_timeline():
     current_day = now.day
     current_month_str = calendar.month_name[current_month]
     
-    data = get_league_data(current_year)
-    
-    colors = {
-        'NBA': "#C98613", 
-        'NHL': "#A2AAAD", 
-        'NFL': "#82CD32", 
-        'MLB': "#217EE1"
-    }
+    if data is None:
+        data = get_league_data(current_year)
     
     fig = go.Figure()
 
     for i, league in enumerate(data['League']):
         phases = data['Phases'][i]
-        plot_season(fig, league, phases, colors, season_offset=0, opacity=0.3, season_name="Previous<br>Season")
-        plot_season(fig, league, phases, colors, season_offset=12, opacity=0.7, season_name="Current<br>Season")
-        plot_season(fig, league, phases, colors, season_offset=24, opacity=0.5, season_name="Next<br>Season")
+        for season_offset, opacity, season_name in SEASONS:
+            plot_season(fig, league, phases, LEAGUE_COLORS, season_offset=season_offset, opacity=opacity, season_name=season_name)
     
     today_x = now.month + (now.day - 1) / 30 + 12
     fig.add_shape(type="line",
@@ -203,7 +278,7 @@ def create_sports_timeline():
                   annotation_position="top",
                   annotation_font_size=10)
     
-    month_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'] * 3
+    month_labels = MONTH_LABELS * 3
     tick_positions = list(range(1, 37))
     
     fig.update_layout(
@@ -228,7 +303,7 @@ def create_sports_timeline():
         yaxis=dict(
             title='League',
             categoryorder='array',
-            categoryarray=['MLB', 'NFL', 'NHL', 'NBA'],
+            categoryarray=data['League'][::-1],
             title_font=dict(size=12),
             tickfont=dict(size=10)
         ),
@@ -254,6 +329,91 @@ def create_sports_timeline():
     
     return fig
 
+def render_timeline_svg(data, width=900, height=450, title='Sports League Timeline'):
+    """Render a static SVG of the timeline, used as first paint before Plotly loads"""
+    now = datetime.now()
+    current_year = now.year
+    # Same margins, axis range and bar thickness as the plotly layout
+    left, right, top, bottom = 80, 20, 60, 80
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+    x_min, x_max = 1, 36
+    leagues = list(data['League'])
+    slot = plot_h / len(leagues)
+    bar_h = slot * 0.8
+
+    def px(x):
+        return left + (x - x_min) / (x_max - x_min) * plot_w
+
+    def row_y(league):
+        # The y axis lists the first league at the top, like categoryarray reversed
+        return top + leagues.index(league) * slot + (slot - bar_h) / 2
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="Open Sans, verdana, arial, sans-serif" '
+        f'role="img" aria-label="{html.escape(title)}">',
+        f'<defs><clipPath id="timeline-clip"><rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}"/></clipPath></defs>',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{width / 2}" y="{top / 2}" text-anchor="middle" font-size="16">{html.escape(title)}</text>',
+    ]
+
+    # Month grid and axis labels
+    labels = MONTH_LABELS * 3
+    for tick in range(x_min, x_max + 1):
+        x = px(tick)
+        parts.append(f'<line x1="{x:.1f}" y1="{top}" x2="{x:.1f}" y2="{top + plot_h}" stroke="lightgray"/>')
+        parts.append(f'<text x="{x:.1f}" y="{top + plot_h + 16}" text-anchor="middle" font-size="10">{labels[tick - 1]}</text>')
+    parts.append(
+        f'<text x="{left + plot_w / 2}" y="{height - 24}" text-anchor="middle" font-size="12">'
+        f'Years {current_year-1}, {current_year}, {current_year + 1}</text>'
+    )
+    for league in leagues:
+        y = row_y(league) + bar_h / 2
+        parts.append(f'<text x="{left - 6}" y="{y:.1f}" text-anchor="end" dominant-baseline="middle" font-size="10">{league}</text>')
+    parts.append(
+        f'<text x="20" y="{top + plot_h / 2}" text-anchor="middle" font-size="12" '
+        f'transform="rotate(-90 20 {top + plot_h / 2})">League</text>'
+    )
+
+    # Season bars
+    parts.append('<g clip-path="url(#timeline-clip)" stroke="black" stroke-width="0.5">')
+    for i, league in enumerate(leagues):
+        y = row_y(league)
+        for season_offset, opacity, season_name in SEASONS:
+            for phase_name, start, end in data['Phases'][i]:
+                start_x, end_x, start_label, end_label = phase_span(start, end, season_offset)
+                x0, x1 = px(start_x), px(end_x)
+                name = html.escape(phase_name.replace('<br>', ' '))
+                parts.append(
+                    f'<rect x="{x0:.1f}" y="{y:.1f}" width="{x1 - x0:.1f}" height="{bar_h:.1f}" '
+                    f'fill="{LEAGUE_COLORS[league]}" fill-opacity="{opacity}">'
+                    f'<title>{league} {name}: {start_label} - {end_label}</title></rect>'
+                )
+                # Plotly hides inside text that does not fit, so do the same
+                if x1 - x0 > len(name) * 5:
+                    parts.append(
+                        f'<text x="{(x0 + x1) / 2:.1f}" y="{y + bar_h / 2:.1f}" text-anchor="middle" '
+                        f'dominant-baseline="middle" font-size="8" stroke="none">{name}</text>'
+                    )
+    parts.append('</g>')
+
+    # Year boundaries and today marker
+    for x, year in ((13, current_year), (25, current_year + 1)):
+        parts.append(f'<line x1="{px(x):.1f}" y1="{top}" x2="{px(x):.1f}" y2="{top + plot_h}" stroke="brown" stroke-width="2"/>')
+        parts.append(f'<text x="{px(x):.1f}" y="{top - 4}" text-anchor="middle" font-size="10">Start {year}</text>')
+    today_x = px(now.month + (now.day - 1) / 30 + 12)
+    parts.append(
+        f'<line x1="{today_x:.1f}" y1="{top - 0.05 * plot_h:.1f}" x2="{today_x:.1f}" y2="{top + plot_h}" '
+        'stroke="red" stroke-width="2" stroke-dasharray="6 4"/>'
+    )
+    parts.append(
+        f'<text x="{today_x:.1f}" y="{top - 0.05 * plot_h - 6:.1f}" text-anchor="middle" font-size="10">'
+        f'Today: {calendar.month_name[now.month]} {now.day}</text>'
+    )
+    parts.append('</svg>')
+    return ''.join(parts)
+
 def generate_css():
     """Generate CSS stylesheet"""
     return '''
@@ -417,6 +577,10 @@ nav a:hover {
     border-top-color: #A2AAAD;
 }
 
+.league-card.mls {
+    border-top-color: #8E44AD;
+}
+
 .league-card h3 {
     font-size: 1.4em;
     margin-bottom: 12px;
@@ -453,6 +617,10 @@ nav a:hover {
     background: #A2AAAD;
 }
 
+.mls .league-icon {
+    background: #8E44AD;
+}
+
 .league-card p {
     color: #666;
     line-height: 1.5;
@@ -502,6 +670,20 @@ footer {
     font-size: 0.9em;
 }
 
+.calendar-image img {
+    width: 100%;
+    height: auto;
+    margin-top: 15px;
+    border-radius: 10px;
+}
+
+.stadium-map {
+    width: 100%;
+    height: 480px;
+    background: white;
+    border-radius: 10px;
+}
+
 .stats-grid {
     display: grid;
     grid-template-columns: repeat(2, 1fr);
@@ -712,173 +894,209 @@ document.addEventListener('DOMContentLoaded', function() {
     updateScrollIndicators(); // Initial check
 });
 
+// Stadium maps: fetch the clustered marker data and Plotly only once a map scrolls into view
+const PLOTLY_SRC = 'https://cdn.plot.ly/plotly-latest.min.js';
+
+function loadPlotly() {
+    if (window.Plotly) {
+        return Promise.resolve(window.Plotly);
+    }
+    return new Promise((resolve, reject) => {
+        let script = document.querySelector(`script[src="${PLOTLY_SRC}"]`);
+        if (!script) {
+            script = document.createElement('script');
+            script.src = PLOTLY_SRC;
+            document.head.appendChild(script);
+        }
+        script.addEventListener('load', () => resolve(window.Plotly));
+        script.addEventListener('error', reject);
+    });
+}
+
+function mapLevelTrace(data, level) {
+    const lat = [], lon = [], sizes = [], colors = [], text = [];
+    level.offsets.forEach((start, i) => {
+        const end = i + 1 < level.offsets.length ? level.offsets[i + 1] : level.members.length;
+        const members = level.members.slice(start, end);
+        const leagues = new Set(members.map(m => data.league[m]));
+        lat.push(level.lat[i]);
+        lon.push(level.lon[i]);
+        sizes.push(8 + 5 * Math.sqrt(members.length - 1));
+        colors.push(leagues.size === 1 ? data.colors[data.league[members[0]]] : '#444444');
+        text.push(members.map(m => `${data.teams[m]} (${data.leagues[data.league[m]]})`).join('<br>'));
+    });
+    return {
+        type: 'scattergeo', mode: 'markers', lat, lon, text, hoverinfo: 'text',
+        marker: { size: sizes, color: colors, opacity: 0.85, line: { width: 1, color: 'white' } }
+    };
+}
+
+function drawStadiumMap(container, data) {
+    const levels = data.maps[container.dataset.map];
+    let current = 0;
+    const layout = {
+        geo: { scope: 'north america', projection: { type: 'conic equal area' },
+               lataxis: { range: [22, 56] }, lonaxis: { range: [-128, -62] },
+               showland: true, landcolor: '#f4f4f4', showcountries: true, subunitcolor: '#cccccc' },
+        margin: { l: 0, r: 0, t: 0, b: 0 },
+        showlegend: false
+    };
+    Plotly.newPlot(container, [mapLevelTrace(data, levels[0])], layout, { responsive: true });
+    container.on('plotly_relayout', (update) => {
+        const scale = update['geo.projection.scale'];
+        if (scale === undefined) {
+            return;
+        }
+        const level = Math.max(0, Math.min(levels.length - 1, Math.floor(Math.log2(scale))));
+        if (level !== current) {
+            current = level;
+            Plotly.react(container, [mapLevelTrace(data, levels[level])], container.layout);
+        }
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const maps = document.querySelectorAll('.stadium-map');
+    if (!maps.length || !('IntersectionObserver' in window)) {
+        return;
+    }
+    const observer = new IntersectionObserver((entries) => {
+        entries.filter(entry => entry.isIntersecting).forEach(entry => {
+            observer.unobserve(entry.target);
+            Promise.all([fetch(entry.target.dataset.src).then(r => r.json()), loadPlotly()])
+                .then(([data]) => drawStadiumMap(entry.target, data))
+                .catch(err => console.error('Stadium map failed to load', err));
+        });
+    }, { rootMargin: '200px' });
+    maps.forEach(map => observer.observe(map));
+});
+
 console.log('Sports Hub initialized! 🏆');
 
 '''
 
-def generate_html(current_year):
-    """Generate HTML file"""
-    return f'''
+def stylesheet_tags(critical_css=None, prefix=''):
+    """Build the <head> stylesheet tags, inlining critical CSS when given"""
+    href = f'{prefix}styles.css'
+    if critical_css:
+        # Above-the-fold rules are inlined, the rest of the stylesheet loads without blocking render
+        return (
+            f'<style>{critical_css}</style>\n'
+            f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'    <noscript><link rel="stylesheet" href="{href}"></noscript>'
+        )
+    return f'<link rel="stylesheet" href="{href}">'
+
+def calendar_image_tag(manifest, prefix=''):
+    """Build a lazily loaded, responsive <img> for the static calendar from its manifest"""
+    base = f"{prefix}{manifest['base']}/"
+    srcset = ', '.join(f"{base}{v['file']} {v['width']}w" for v in manifest['variants'])
+    default = next(v for v in manifest['variants'] if v['file'] == manifest['default'])
+    return (
+        f'<img src="{base}{default["file"]}" srcset="{srcset}" sizes="(min-width: 1400px) 1340px, 100vw" '
+        f'width="{default["width"]}" height="{default["height"]}" loading="lazy" '
+        'alt="Static calendar of the major sports league seasons">'
+    )
 
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Sports Analytics Hub</title>
-    <link rel="stylesheet" href="styles.css">
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>🏆 Sports Analytics Hub</h1>
-            <p>Your central dashboard for sports data, analytics, and insights</p>
-        </header>
-        
-        <nav>
-            <a href="#timeline">Timeline</a>
-            <a href="#projects">Projects</a>
-            <a href="#mlb">MLB</a>
-            <a href="#nba">NBA</a>
-            <a href="#nfl">NFL</a>
-            <a href="#nhl">NHL</a>
-        </nav>
-        
-        <div class="content">
-            <!-- Timeline Section -->
-            <section id="timeline" class="section">
-                <h2>📅 League Season Timeline</h2>
-                <div class="timeline-container">
-                    <div id="timeline-plot"></div>
-                </div>
-            </section>
-            
-            <!-- Quick Stats -->
-            <section class="section">
-                <h2>📊 Quick Stats</h2>
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <h4>4</h4>
-                        <p>Major Leagues Tracked</p>
-                    </div>
-                    <div class="stat-card">
-                        <h4>{current_year}</h4>
-                        <p>Current Season</p>
-                    </div>
-                    <div class="stat-card">
-                        <h4>Live</h4>
-                        <p>Real-time Updates</p>
-                    </div>
-                    <div class="stat-card">
-                        <h4>∞</h4>
-                        <p>Insights Generated</p>
-                    </div>
-                </div>
-            </section>
-            
-            <!-- League Projects Section -->
-            <section id="projects" class="section">
-                <h2>🚀 League Projects</h2>
-                <div class="league-grid">
-                    <!-- MLB Card -->
-                    <div class="league-card mlb" id="mlb">
-                        <h3>
-                            <span class="league-icon">⚾</span>
-                            MLB Projects
-                        </h3>
-                        <p>Exploring baseball analytics, player statistics, and game predictions for Major League Baseball.</p>
-                        <ul class="project-list">
-                            <li>📈 Player Performance Analytics</li>
-                            <li>🎯 Win Probability Calculator</li>
-                            <li>📊 Team Statistics Dashboard</li>
-                            <li>🔮 Season Predictions Model</li>
-                        </ul>
-                        <a href="#" class="btn">View MLB Projects →</a>
-                    </div>
-                    
-                    <!-- NBA Card -->
-                    <div class="league-card nba" id="nba">
-                        <h3>
-                            <span class="league-icon">🏀</span>
-                            NBA Projects
-                        </h3>
-                        <p>Basketball analytics covering player efficiency, shot analysis, and championship predictions.</p>
-                        <ul class="project-list">
-                            <li>🎯 Shot Chart Visualization</li>
-                            <li>📊 Player Efficiency Rating</li>
-                            <li>🏆 Playoff Bracket Predictor</li>
-                            <li>📈 Real-time Game Analytics</li>
-                        </ul>
-                        <a href="#" class="btn">View NBA Projects →</a>
-                    </div>
-                    
-                    <!-- NFL Card -->
-                    <div class="league-card nfl" id="nfl">
-                        <h3>
-                            <span class="league-icon">🏈</span>
-                            NFL Projects
-                        </h3>
-                        <p>Football analytics including game simulations, fantasy predictions, and team performance metrics.</p>
-                        <ul class="project-list">
-                            <li>🎮 Game Outcome Simulator</li>
-                            <li>👤 Fantasy Football Optimizer</li>
-                            <li>📊 Offensive vs Defensive Stats</li>
-                            <li>🏆 Super Bowl Predictions</li>
-                        </ul>
-                        <a href="#" class="btn">View NFL Projects →</a>
-                    </div>
-                    
-                    <!-- NHL Card -->
-                    <div class="league-card nhl" id="nhl">
-                        <h3>
-                            <span class="league-icon">🏒</span>
-                            NHL Projects
-                        </h3>
-                        <p>Hockey analytics with goalie performance tracking, team comparisons, and playoff forecasting.</p>
-                        <ul class="project-list">
-                            <li>🥅 Goalie Performance Tracker</li>
-                            <li>📊 Team Power Rankings</li>
-                            <li>🔥 Hot Streak Analyzer</li>
-                            <li>🏆 Stanley Cup Predictor</li>
-                        </ul>
-                        <a href="#" class="btn">View NHL Projects →</a>
-                    </div>
-                </div>
-            </section>
-        </div>
-        
-        <footer>
-            <p>&copy; {current_year} Sports Analytics Hub | Built with Python & Plotly</p>
-            <p style="margin-top: 10px; opacity: 0.8;">Data updated in real-time from official league APIs</p>
-        </footer>
-    </div>
-    
-    <script src="timeline-data.js"></script>
-    <script src="script.js"></script>
-</body>
-</html>
+def generate_html(current_year, timeline_svg='', critical_css=None, manifest=None):
+    """Generate HTML file; manifest describes the static calendar images (see Calendar/pyramid.py)"""
+    return render(
+        'index.html',
+        current_year=current_year,
+        timeline_svg=timeline_svg,
+        stylesheet=stylesheet_tags(critical_css),
+        leagues=LEAGUE_INFO,
+        calendar_image=calendar_image_tag(manifest) if manifest else None,
+        calendar_print=f"{manifest['base']}/{manifest['variants'][-1]['file']}" if manifest else None,
+    )
 
-'''
+def load_teams(path=STADIUMS_CSV):
+    """Read (team, sport, division) rows from the validated stadiums table"""
+    table = load_table(path, STADIUMS)
+    return list(zip(table['Team'].tolist(), table['Sport'].tolist(), table['Division'].tolist()))
 
-if __name__ == "__main__":
-    # Create the timeline visualization
-    print("Generating sports timeline...")
-    fig = create_sports_timeline()
-    current_year = datetime.now().year
-    
-    # Get plotly JSON data
-    plotly_json = fig.to_json()
-    
-    today_x = datetime.now().month + (datetime.now().day - 1) / 30 + 12
-    
-    # Create timeline-data.js with the plotly data
-    timeline_js = f'''
+def league_stats(league, phases, teams):
+    """Summarize a league's current season and teams for its page"""
+    now = datetime.now()
+    today_x = now.month + (now.day - 1) / 30 + 12
+    stats = {'phases': [], 'current_phase': 'Offseason'}
+    season_start = season_end = None
+    for phase_name, start, end in phases:
+        start_x, end_x, start_label, end_label = phase_span(start, end, 12)
+        stats['phases'].append({'name': phase_name.replace('<br>', ' '), 'start': start_label, 'end': end_label})
+        if start_x <= today_x <= end_x:
+            stats['current_phase'] = phase_name.replace('<br>', ' ')
+        season_start = start_x if season_start is None else min(season_start, start_x)
+        season_end = end_x if season_end is None else max(season_end, end_x)
+    # Timeline positions count 30-day months
+    stats['season_days'] = round((season_end - season_start) * 30)
+
+    divisions = {}
+    for team, sport, division in teams:
+        if sport == league:
+            divisions.setdefault(division, []).append(team)
+    stats['teams'] = sum(len(members) for members in divisions.values())
+    stats['divisions'] = len(divisions)
+    stats['teams_by_division'] = sorted(divisions.items())
+    return stats
+
+# Per-process state for page rendering, loaded once per worker
+_page_context = {}
+
+def _init_page_worker(data, teams, current_year, critical_css):
+    """Load the shared build data into a page rendering worker"""
+    _page_context.update(data=data, teams=teams, current_year=current_year, critical_css=critical_css)
+
+def _render_league_page(league):
+    """Render one league page from the worker's shared data"""
+    data = _page_context['data']
+    info = next(info for info in LEAGUE_INFO if info['name'] == league)
+    phases = data['Phases'][data['League'].index(league)]
+    timeline_svg = render_timeline_svg(
+        {'League': [league], 'Phases': [phases]},
+        height=220,
+        title=f'{league} Season Timeline',
+    )
+    page = render(
+        'league.html',
+        league=info,
+        leagues=LEAGUE_INFO,
+        current_year=_page_context['current_year'],
+        timeline_svg=timeline_svg,
+        stylesheet=stylesheet_tags(_page_context['critical_css'], prefix='../'),
+        stats=league_stats(league, phases, _page_context['teams']),
+    )
+    return info['page'], page
+
+def generate_league_pages(data, current_year, critical_css=None, max_workers=None):
+    """Render every league page, in parallel unless max_workers is 1, returning {path: html}
+
+    Workers are spawned rather than forked, since the build calls this from a
+    thread while other stages are running.
+    """
+    teams = load_teams()
+    leagues = [info['name'] for info in LEAGUE_INFO if info['name'] in data['League']]
+    initargs = (data, teams, current_year, critical_css)
+    if max_workers == 1 or len(leagues) == 1:
+        _init_page_worker(*initargs)
+        return dict(map(_render_league_page, leagues))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_page_worker,
+        initargs=initargs,
+    ) as pool:
+        return dict(pool.map(_render_league_page, leagues))
+
+def generate_timeline_js(plotly_json, today_x):
+    """Generate timeline-data.js, which renders the Plotly chart over the static SVG"""
+    return f'''
     
 // Timeline data generated from Python
 const timelineData = {plotly_json};
 
-// Render the plot with fixed dimensions for horizontal scrolling
+// Replace the static SVG first paint, then render the plot with fixed dimensions for horizontal scrolling
+document.getElementById('timeline-plot').replaceChildren();
 Plotly.newPlot('timeline-plot', timelineData.data, timelineData.layout, {{
     responsive: false,  // Disable responsive for fixed width
     scrollZoom: true,   // Allow zooming by scrolling
@@ -951,24 +1169,12 @@ setTimeout(() => {{
 }}, 1000);
 
 '''
-    # Create directories if needed
-    os.makedirs('.', exist_ok=True)
-    
-    # Write all files
-    print("Creating HTML file...")
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(generate_html(current_year))
-    
-    print("Creating CSS file...")
-    with open('styles.css', 'w', encoding='utf-8') as f:
-        f.write(generate_css())
-    
-    print("Creating JavaScript files...")
-    with open('script.js', 'w', encoding='utf-8') as f:
-        f.write(generate_js())
-    
-    with open('timeline-data.js', 'w', encoding='utf-8') as f:
-        f.write(timeline_js)
+
+if __name__ == "__main__":
+    from pipeline import build
+
+    # Run the cached build pipeline; only stages whose inputs changed are rebuilt
+    build()
     
     print("\n" + "="*60)
     print("✓ Sports Hub website created successfully!")
@@ -978,6 +1184,7 @@ setTimeout(() => {{
     print("  🎨 styles.css       - All styling")
     print("  ⚙️  script.js        - Interactive features")
     print("  📊 timeline-data.js - Plotly chart data")
+    print("  🗂️  leagues/*.html   - Per-league pages")
     print("\n" + "="*60)
     print("Open index.html in your browser to view your sports hub.")
     print("\nFeatures:")
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The modules live at the repository root rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def make_games():
+    """Build a game store from (league, date, home team, away team, home score, away score) tuples"""
+    import games as game_store
+
+    def make(rows):
+        ids = game_store.team_rows()
+        store = game_store.empty_games()
+        if not rows:
+            return store
+        league, day, home, away, home_score, away_score = zip(*rows)
+        return {
+            'League': np.array(league, dtype=store['League'].dtype),
+            'Season': np.array([int(d[:4]) for d in day], dtype=store['Season'].dtype),
+            'Date': np.array(day, dtype='datetime64[D]'),
+            'Home': np.array([ids[team] for team in home], dtype=store['Home'].dtype),
+            'Away': np.array([ids[team] for team in away], dtype=store['Away'].dtype),
+            'HomeScore': np.array(home_score, dtype=store['HomeScore'].dtype),
+            'AwayScore': np.array(away_score, dtype=store['AwayScore'].dtype),
+        }
+    return make
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the derived-table caches at a scratch directory"""
+    import distances
+    import ingest
+
+    cache = str(tmp_path / 'cache')
+    monkeypatch.setattr(ingest, 'CACHE_DIR', cache)
+    monkeypatch.setattr(distances, 'CACHE_DIR', cache)
+    return cache
+
+
+@pytest.fixture
+def write_stadiums(tmp_path):
+    """Write a stadiums CSV from (team, sport, division, latitude, longitude) tuples, returning its path"""
+    path = str(tmp_path / 'stadiums.csv')
+
+    def write(rows):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('Team,Sport,Division,Latitude,Longitude\n')
+            for row in rows:
+                f.write(','.join(map(str, row)) + '\n')
+        return path
+    return write
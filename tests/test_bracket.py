@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from bracket import BracketEngine
+from simulator import PLAYOFF_FORMATS, simulate_playoffs
+
+
+def seeded_field(league, rng):
+    """Random ratings for two conferences of seeded teams, numbered 0..n-1"""
+    seeds = PLAYOFF_FORMATS[league]['seeds']
+    rating = rng.normal(0, 100, 2 * seeds)
+    home_advantage = np.full(2 * seeds, 50.0)
+    conferences = [list(range(seeds)), list(range(seeds, 2 * seeds))]
+    seeded = [sorted(teams, key=lambda t: -rating[t]) for teams in conferences]
+    return seeded, rating, home_advantage
+
+
+@pytest.mark.parametrize('league', ['MLB', 'MLS', 'NBA', 'NFL', 'NHL'])
+def test_exact_odds_are_distributions(league):
+    seeded, rating, home_advantage = seeded_field(league, np.random.default_rng(1))
+    exact = BracketEngine(league, rating, home_advantage, rating).predict(seeded)
+    assert exact[:, -1].sum() == pytest.approx(1.0)
+    # Each conference sends exactly one team to the final, and reach never grows by round
+    for teams in seeded:
+        assert exact[teams, -2].sum() == pytest.approx(1.0)
+    assert (np.diff(exact, axis=1) <= 1e-12).all()
+
+
+@pytest.mark.parametrize('league', ['NBA', 'NFL'])
+def test_exact_odds_match_simulation(league):
+    seeded, rating, home_advantage = seeded_field(league, np.random.default_rng(2))
+    exact = BracketEngine(league, rating, home_advantage, rating).predict(seeded)
+    sampled = simulate_playoffs(league, seeded, rating, home_advantage, rating, n_runs=40000)
+    assert np.abs(exact - sampled).max() < 0.015
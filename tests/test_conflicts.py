@@ -0,0 +1,57 @@
+import numpy as np
+
+from conflicts import find_conflicts, metro_ids, venue_ids
+
+
+def test_doubleheader_alone_is_not_a_conflict(make_games):
+    games = make_games([
+        ('MLB', '2024-07-04', 'New York Yankees', 'Boston Red Sox', 3, 2),
+        ('MLB', '2024-07-04', 'New York Yankees', 'Boston Red Sox', 1, 5),
+    ])
+    conflicts, members = find_conflicts(games)
+    assert len(conflicts['Date']) == 0
+    assert len(members) == 0
+
+
+def test_same_metro_teams_conflict(make_games):
+    games = make_games([
+        ('MLB', '2024-07-04', 'New York Yankees', 'Boston Red Sox', 3, 2),
+        ('MLB', '2024-07-04', 'New York Yankees', 'Boston Red Sox', 1, 5),
+        ('MLB', '2024-07-04', 'New York Mets', 'Atlanta Braves', 4, 0),
+        ('MLB', '2024-07-05', 'New York Mets', 'Atlanta Braves', 4, 0),
+    ])
+    conflicts, members = find_conflicts(games)
+    assert list(conflicts['Date']) == [np.datetime64('2024-07-04')]
+    assert list(conflicts['Count']) == [3]
+    assert not conflicts['SharedVenue'][0]
+    assert sorted(members) == [0, 1, 2]
+
+
+def test_shared_building(make_games):
+    games = make_games([
+        ('NBA', '2024-01-10', 'Los Angeles Lakers', 'Denver Nuggets', 110, 100),
+        ('NHL', '2024-01-10', 'Los Angeles Kings', 'Vegas Golden Knights', 3, 2),
+        ('NBA', '2024-01-11', 'Los Angeles Lakers', 'Denver Nuggets', 110, 100),
+    ])
+    conflicts, members = find_conflicts(games)
+    assert list(conflicts['Count']) == [2]
+    assert conflicts['SharedVenue'][0]
+    assert list(members) == [0, 1]
+
+
+def test_no_games(make_games):
+    conflicts, members = find_conflicts(make_games([]))
+    assert len(conflicts['Date']) == 0 and len(members) == 0
+
+
+def test_metros_follow_csv_edits(cache_dir, write_stadiums):
+    csv = write_stadiums([('Giants', 'NFL', 'NFC East', 40.8135, -74.0745),
+                          ('Jets', 'NFL', 'AFC East', 40.8135, -74.0745)])
+    assert list(metro_ids(path=csv)) == [0, 0]
+    assert list(venue_ids(csv)) == [0, 0]
+    # Same process, edited file: a third team in another city gets its own metro and building
+    write_stadiums([('Giants', 'NFL', 'NFC East', 40.8135, -74.0745),
+                    ('Jets', 'NFL', 'AFC East', 40.8135, -74.0745),
+                    ('Bears', 'NFL', 'NFC North', 41.8623, -87.6167)])
+    assert len(metro_ids(path=csv)) == 3 and metro_ids(path=csv)[2] != metro_ids(path=csv)[0]
+    assert len(set(venue_ids(csv))) == 2
@@ -0,0 +1,24 @@
+import glob
+import os
+
+import pytest
+
+import distances
+import stadiums
+
+
+def test_distance_matrix_follows_csv_edits(cache_dir, write_stadiums):
+    csv = write_stadiums([('Giants', 'NFL', 'NFC East', 40.8135, -74.0745),
+                         ('Patriots', 'NFL', 'AFC East', 42.0909, -71.2643)])
+    assert distances.load_distance_matrix('miles', csv)[0, 1] == pytest.approx(180, abs=15)
+
+    # Same process, edited file: the stadiums and the matrices must both be recomputed
+    write_stadiums([('Giants', 'NFL', 'NFC East', 40.8135, -74.0745),
+                         ('Bears', 'NFL', 'NFC North', 41.8623, -87.6167)])
+    assert list(stadiums.load_stadiums(csv)['Team']) == ['Giants', 'Bears']
+    assert distances.load_distance_matrix('miles', csv)[0, 1] == pytest.approx(710, abs=15)
+    hours = distances.load_distance_matrix('driving', csv)[0, 1]
+    assert hours == pytest.approx(distances.driving_hours(710), rel=0.03)
+
+    # Matrices for the old contents are removed
+    assert len(glob.glob(os.path.join(cache_dir, 'miles-*.npy'))) == 1
@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import pytest
+
+import games as game_store
+from elo import DEFAULT_PARAMS, EloEngine, brier_score, independent_layers
+
+
+def test_one_game_update(make_games):
+    games = make_games([('NBA', '2024-11-01', 'Boston Celtics', 'New York Knicks', 110, 100)])
+    engine = EloEngine()
+    probability = engine.process(games)
+    # Both start at 1500; the home side gets 100 points of home advantage
+    expected = 1 / (1 + 10 ** (-100 / 400))
+    assert probability[0] == pytest.approx(expected)
+    multiplier = math.log(11) * 2.2 / (100 * 0.001 + 2.2)
+    delta = 20 * multiplier * (1 - expected)
+    assert engine.ratings[0, games['Home'][0]] == pytest.approx(1500 + delta)
+    assert engine.ratings[0, games['Away'][0]] == pytest.approx(1500 - delta)
+
+
+def test_new_season_reverts_toward_initial(make_games):
+    games = make_games([
+        ('NHL', '2023-04-10', 'Boston Bruins', 'Buffalo Sabres', 5, 1),
+        ('NHL', '2024-10-10', 'Boston Bruins', 'Buffalo Sabres', -1, -1),
+    ])
+    engine = EloEngine()
+    engine.process({column: values[:1] for column, values in games.items()})
+    before = engine.ratings[0, games['Home'][0]]
+    engine.process({column: values[1:] for column, values in games.items()})
+    # The unplayed game changes nothing but the new season's reversion
+    assert engine.ratings[0, games['Home'][0]] == pytest.approx(1500 + (before - 1500) * (1 - 1 / 3))
+
+
+def test_batches_and_sweeps_match_one_pass():
+    season = game_store.sort_games(game_store.synthetic_archive(['NBA', 'NHL'], [2023, 2024]))
+    whole = EloEngine()
+    probability = whole.process(season)
+    batched = EloEngine()
+    cuts = np.searchsorted(season['Date'], season['Date'].min() + np.arange(0, 800, 30))
+    parts = [batched.process({column: values[lo:hi] for column, values in season.items()})
+             for lo, hi in zip(cuts[:-1], cuts[1:])]
+    np.testing.assert_allclose(np.concatenate(parts), probability[:cuts[-1]])
+    np.testing.assert_allclose(batched.ratings, whole.ratings)
+
+    sweep = [DEFAULT_PARAMS, {**DEFAULT_PARAMS, 'NBA': DEFAULT_PARAMS['NBA']._replace(k=40)}]
+    swept = EloEngine(sweep).process(season)
+    np.testing.assert_allclose(swept[0], probability)
+    assert brier_score(swept, season).shape == (2,)
+
+
+def test_layers_never_repeat_a_team():
+    rng = np.random.default_rng(0)
+    home, away = rng.integers(0, 10, 200), rng.integers(0, 10, 200)
+    away = np.where(away == home, (away + 1) % 10, away)
+    layers = independent_layers(home, away, 10)
+    for layer in np.unique(layers):
+        teams = np.concatenate([home[layers == layer], away[layers == layer]])
+        assert len(np.unique(teams)) == len(teams)
+    # A team's games keep their order
+    for team in range(10):
+        assert (np.diff(layers[(home == team) | (away == team)]) > 0).all()
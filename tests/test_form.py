@@ -0,0 +1,41 @@
+import numpy as np
+
+import games as game_store
+from form import FormIndex, form_guide, rolling_form
+
+
+def test_rolling_form(make_games):
+    games = make_games([
+        ('NHL', '2024-10-10', 'Boston Bruins', 'Buffalo Sabres', 3, 1),
+        ('NHL', '2024-10-12', 'Buffalo Sabres', 'Boston Bruins', 4, 2),
+        ('NHL', '2024-10-14', 'Boston Bruins', 'Buffalo Sabres', 2, 2),
+        ('NHL', '2024-10-16', 'Boston Bruins', 'Buffalo Sabres', 5, 0),
+        ('NHL', '2024-10-18', 'Buffalo Sabres', 'Boston Bruins', 1, 3),
+        ('NHL', '2024-10-20', 'Boston Bruins', 'Buffalo Sabres', -1, -1),
+    ])
+    form = rolling_form(games, windows=(2,))
+    bruins = form['Team'] == game_store.team_rows()['Boston Bruins']
+    assert list(form['Result'][bruins]) == [1, -1, 0, 1, 1]
+    assert list(form['Streak'][bruins]) == [1, -1, 0, 1, 2]
+    assert list(form['PointStreak'][bruins]) == [1, 0, 1, 2, 3]
+    np.testing.assert_allclose(form['WinPct2'][bruins], [1, 0.5, 0.25, 0.75, 1])
+    assert list(form['GoalDiff2'][bruins]) == [2, 0, -2, 5, 7]
+    assert [form_guide(recent) for recent in form['Recent'][bruins]] == ['W', 'WL', 'WLT', 'WLTW', 'WLTWW']
+
+
+def test_form_index_lookup(make_games):
+    games = make_games([
+        ('NHL', '2023-04-10', 'Boston Bruins', 'Buffalo Sabres', 3, 1),
+        ('NHL', '2024-10-10', 'Boston Bruins', 'Buffalo Sabres', 1, 3),
+        ('NHL', '2024-10-12', 'Buffalo Sabres', 'Boston Bruins', 1, 3),
+    ])
+    bruins = game_store.team_rows()['Boston Bruins']
+    index = FormIndex(games)
+    assert len(index.curve(bruins)['Team']) == 3
+    curve = index.curve(bruins, 2024)
+    # Streaks and windows restart with the season
+    assert list(curve['Streak']) == [-1, 1]
+    assert form_guide(curve['Recent'][0]) == 'L'
+    assert index.as_of(bruins, 2024, '2024-10-11') == 0
+    assert index.as_of(bruins, 2024, '2024-10-01') == -1
+    assert len(index.curve(bruins, 1999)['Team']) == 0
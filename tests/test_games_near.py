@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+import games as game_store
+from games_near import GamesNearIndex
+from stadiums import haversine, load_stadiums
+
+
+@pytest.fixture(scope='module')
+def archive():
+    return game_store.synthetic_archive(seasons=[2023, 2024])
+
+
+@pytest.mark.parametrize('lat, lon, radius, start, end, leagues', [
+    (40.7128, -74.0060, 40, '2024-04-01', '2024-04-14', None),
+    (41.8781, -87.6298, 150, '2023-12-20', '2024-01-05', ('NBA', 'NHL')),
+    (34.0522, -118.2437, 500, '2024-10-01', '2024-10-03', ('MLB',)),
+    (39.7392, -104.9903, 5, '2024-01-01', '2023-12-01', None),
+])
+def test_query_matches_masked_filter(archive, lat, lon, radius, start, end, leagues):
+    stadiums = load_stadiums()
+    miles = haversine(lat, lon, stadiums['Latitude'][archive['Home']], stadiums['Longitude'][archive['Home']])
+    mask = (miles <= radius) & (archive['Date'] >= np.datetime64(start)) & (archive['Date'] <= np.datetime64(end))
+    if leagues is not None:
+        mask &= np.isin(archive['League'], leagues)
+
+    found, distance = GamesNearIndex(archive).query(lat, lon, radius, start, end, leagues)
+    assert sorted(found) == list(np.flatnonzero(mask))
+    np.testing.assert_allclose(distance, miles[found], atol=1e-6)
+    # Ordered by date, then distance
+    order = np.lexsort((distance, archive['Date'][found]))
+    assert (order == np.arange(len(found))).all()
+
+
+def test_query_outside_the_archive(archive):
+    found, distance = GamesNearIndex(archive).query(40.7128, -74.0060, 50, '1990-01-01', '1990-12-31')
+    assert len(found) == 0 and len(distance) == 0
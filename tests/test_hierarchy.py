@@ -0,0 +1,33 @@
+import numpy as np
+
+from hierarchy import get_hierarchy
+
+
+def test_league_tree():
+    h = get_hierarchy()
+    nfl = h.group('league', 'NFL')
+    assert len(h.members('league', nfl)) == 32
+    assert sorted(h.display_names['conference'][h.children('league', nfl)]) == ['AFC', 'NFC']
+    # NHL conferences come from the division name; 'Central' stays apart from 'AL Central'
+    bruins = h.team_index['Boston Bruins']
+    assert h.display_names['conference'][h.team_group(bruins, 'conference')] == 'Eastern'
+    assert h.group('division', 'NHL Central') != h.group('division', 'MLB AL Central')
+    assert h.same_group(bruins, h.team_index['Toronto Maple Leafs'], 'division')
+    sizes = h.group_sum(np.ones(len(h.teams)), 'league')
+    assert sizes[nfl] == 32 and sizes.sum() == len(h.teams)
+    np.testing.assert_array_equal(h.group_reduce(np.maximum, np.arange(len(h.teams)), 'league'),
+                                  [h.members('league', code).max() for code in range(h.size('league'))])
+
+
+def test_hierarchy_follows_csv_edits(cache_dir, write_stadiums):
+    csv = write_stadiums([('Giants', 'NFL', 'NFC East', 40.8135, -74.0745),
+                          ('Patriots', 'NFL', 'AFC East', 42.0909, -71.2643)])
+    assert get_hierarchy(csv).size('conference') == 2
+    # Same process, edited file: team counts and codes come from the new contents
+    write_stadiums([('Giants', 'NFL', 'NFC East', 40.8135, -74.0745),
+                    ('Bears', 'NFL', 'NFC North', 41.8623, -87.6167),
+                    ('Bruins', 'NHL', 'Atlantic', 42.3662, -71.0621)])
+    h = get_hierarchy(csv)
+    assert list(h.teams) == ['Giants', 'Bears', 'Bruins']
+    assert list(h.names['league']) == ['NFL', 'NHL']
+    assert h.size('division') == 3
@@ -0,0 +1,69 @@
+import glob
+import os
+
+import pytest
+
+import ingest
+
+
+HEADER = 'Team,Sport,Division,Latitude,Longitude\n'
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    cache = str(tmp_path / 'cache')
+    monkeypatch.setattr(ingest, 'CACHE_DIR', cache)
+    return cache
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def test_errors_report_file_line_numbers(tmp_path):
+    path = write(str(tmp_path / 'stadiums.csv'), HEADER + '\n'.join([
+        'Giants,NFL,NFC East,40.8,-74.1',
+        '',
+        '"Multi',
+        'line",NFL,Nowhere,40.8,-74.1',
+        'Bears,NFL,NFC North,95.0,-87.6',
+    ]) + '\n')
+    with pytest.raises(ValueError) as error:
+        ingest.parse_csv(path, ingest.STADIUMS)
+    assert "row 6: Latitude 95.0" in str(error.value)
+    assert "row 4: 'Nowhere' is not a NFL division" in str(error.value)
+
+
+def test_schema_change_revalidates_cached_table(tmp_path):
+    path = write(str(tmp_path / 'stadiums.csv'), HEADER + 'Giants,NFL,NFC East,40.8,-74.1\n')
+    assert list(ingest.load_table(path, ingest.STADIUMS)['Team']) == ['Giants']
+    stricter = ingest.STADIUMS._replace(ranges={'Latitude': (18.0, 40.0), 'Longitude': (-170.0, -50.0)})
+    with pytest.raises(ValueError, match='outside'):
+        ingest.load_table(path, stricter)
+
+
+def test_same_named_files_keep_separate_caches(tmp_path, cache_dir):
+    first = write(str(tmp_path / 'a' / 'stadiums.csv'), HEADER + 'Giants,NFL,NFC East,40.8,-74.1\n')
+    second = write(str(tmp_path / 'b' / 'stadiums.csv'), HEADER + 'Bears,NFL,NFC North,41.9,-87.6\n')
+    ingest.load_table(first, ingest.STADIUMS)
+    ingest.load_table(second, ingest.STADIUMS)
+    assert len(glob.glob(os.path.join(cache_dir, '*.npz'))) == 2
+    assert list(ingest.load_table(first, ingest.STADIUMS)['Team']) == ['Giants']
+
+
+def test_edit_replaces_cached_table(tmp_path, cache_dir):
+    path = write(str(tmp_path / 'stadiums.csv'), HEADER + 'Giants,NFL,NFC East,40.8,-74.1\n')
+    ingest.load_table(path, ingest.STADIUMS)
+    write(path, HEADER + 'Jets,NFL,AFC East,40.8,-74.1\n')
+    assert list(ingest.load_table(path, ingest.STADIUMS)['Team']) == ['Jets']
+    assert len(glob.glob(os.path.join(cache_dir, '*.npz'))) == 1
+
+
+@pytest.mark.parametrize('latitude', ['nan', 'NaN', 'inf', '-inf'])
+def test_non_finite_floats_are_rejected(tmp_path, latitude):
+    path = write(str(tmp_path / 'stadiums.csv'), HEADER + f'Giants,NFL,NFC East,{latitude},-74.1\n')
+    with pytest.raises(ValueError, match=f"row 2: Latitude '{latitude}' is not a valid float"):
+        ingest.parse_csv(path, ingest.STADIUMS)
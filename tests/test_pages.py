@@ -0,0 +1,9 @@
+import test5
+
+
+def test_league_pages_match_across_workers():
+    data = test5.build_league_data(None)
+    serial = test5.generate_league_pages(data, 2025, 'body{}', max_workers=1)
+    assert sorted(serial) == sorted(info['page'] for info in test5.LEAGUE_INFO)
+    assert all('body{}' in page for page in serial.values())
+    assert test5.generate_league_pages(data, 2025, 'body{}', max_workers=2) == serial
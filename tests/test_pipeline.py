@@ -0,0 +1,45 @@
+import pytest
+
+import pipeline
+import test5
+
+
+def offline_fetch(year):
+    return [('Spring Training', f'{year}-02-20', f'{year}-03-25')]
+
+
+@pytest.fixture
+def build(tmp_path, monkeypatch):
+    """Build into a scratch directory with its own stage cache and no network"""
+    monkeypatch.setattr(pipeline, 'CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(test5, 'fetch_MLB', offline_fetch)
+
+    def run():
+        return pipeline.build(verbose=False, out_dir=str(tmp_path / 'site'))
+    return run
+
+
+def test_unchanged_build_is_cached(build):
+    build()
+    assert build() == ([], [])
+
+
+def test_css_edit_rebuilds_only_css_stages(build, monkeypatch):
+    build()
+    generate_css = test5.generate_css
+
+    def recoloured_css():
+        return generate_css() + '.footer-note{color:#777}'
+
+    monkeypatch.setattr(test5, 'generate_css', recoloured_css)
+    rebuilt, written = build()
+    assert sorted(rebuilt) == ['css', 'html', 'pages']
+    assert 'styles.css' in written
+
+
+def test_league_colour_edit_replots(build, monkeypatch):
+    build()
+    monkeypatch.setitem(test5.LEAGUE_COLORS, 'NBA', '#000000')
+    rebuilt, _ = build()
+    assert {'figure', 'svg', 'markers'} <= set(rebuilt)
+    assert 'css' not in rebuilt and 'fetch' not in rebuilt
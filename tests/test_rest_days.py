@@ -0,0 +1,34 @@
+from rest_days import COLUMNS, archive_rest, rest_analytics
+
+
+def test_rest_days_with_doubleheader(make_games):
+    games = make_games([
+        ('MLB', '2024-07-01', 'New York Yankees', 'Boston Red Sox', 3, 2),
+        ('MLB', '2024-07-03', 'New York Yankees', 'Boston Red Sox', 1, 5),
+        ('MLB', '2024-07-03', 'New York Yankees', 'Boston Red Sox', 2, 0),
+        ('MLB', '2024-07-04', 'Baltimore Orioles', 'New York Yankees', 4, 0),
+        ('MLB', '2024-07-20', 'New York Yankees', 'Baltimore Orioles', 4, 0),
+    ])
+    rest = rest_analytics(games, 'MLB')
+    yankees = rest['Team'] == games['Home'][0]
+    assert list(rest['Game'][yankees]) == [0, 1, 2, 3, 4]
+    assert list(rest['RestDays'][yankees]) == [-1, 1, 0, 0, 15]
+    assert list(rest['Doubleheader'][yankees]) == [False, True, True, False, False]
+    assert list(rest['BackToBack'][yankees]) == [False, False, False, True, False]
+    assert list(rest['ThreeInFour'][yankees]) == [False, False, True, True, False]
+    assert list(rest['HomestandLength'][yankees]) == [3, 3, 3, 0, 1]
+
+
+def test_seasons_restart(make_games):
+    games = make_games([
+        ('NHL', '2023-04-10', 'Boston Bruins', 'Buffalo Sabres', 3, 2),
+        ('NHL', '2024-10-10', 'Boston Bruins', 'Buffalo Sabres', 3, 2),
+    ])
+    rest = rest_analytics(games, 'NHL')
+    assert list(rest['RestDays']) == [-1, -1, -1, -1]
+    assert not rest['Doubleheader'].any() and not rest['BackToBack'].any()
+
+
+def test_empty_store(make_games):
+    for rest in (rest_analytics(make_games([])), archive_rest(make_games([]))):
+        assert all(len(rest[column]) == 0 for column in COLUMNS)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import games as game_store
+from simulator import PLAYOFF_FORMATS, series_probability, simulate_season
+
+
+@pytest.fixture(scope='module')
+def season():
+    return game_store.synthetic_season('NHL', 2024, played=False)
+
+
+def test_series_probability():
+    p = np.array([0.0, 0.5, 0.6, 1.0])
+    np.testing.assert_allclose(series_probability(p, 1), p)
+    np.testing.assert_allclose(series_probability(p, 7), [0, 0.5, 0.710208, 1])
+    # Best of three: win two straight, or win two of the first three with the last a win
+    np.testing.assert_allclose(series_probability(p, 3), p ** 2 + 2 * p ** 2 * (1 - p))
+
+
+def test_results_do_not_depend_on_worker_count(season):
+    half = season['Date'] < np.sort(season['Date'])[len(season['Date']) // 2]
+    played = game_store.synthetic_season('NHL', 2024)
+    games = {column: np.where(half, played[column], values) for column, values in season.items()}
+    serial = simulate_season(games, 'NHL', n_runs=6000, seed=3, max_workers=1)
+    parallel = simulate_season(games, 'NHL', n_runs=6000, seed=3, max_workers=2)
+    for column, values in serial.items():
+        np.testing.assert_array_equal(parallel[column], values)
+
+    seeds = PLAYOFF_FORMATS['NHL']['seeds']
+    assert serial['Playoffs'].sum() == pytest.approx(2 * seeds)
+    assert serial['Championship'].sum() == pytest.approx(1)
+    # Each conference fills every seed once per run
+    np.testing.assert_allclose(serial['Seeds'].sum(axis=0), 2)
+    assert (serial['ConferenceTitle'] >= serial['Championship']).all()
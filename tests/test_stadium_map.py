@@ -0,0 +1,31 @@
+import json
+
+import numpy as np
+
+from stadium_map import ZOOM_CELLS, build_map_data, cluster_stadiums, map_json
+from stadiums import load_stadiums
+
+
+def test_clusters_follow_grid_cells():
+    lat = np.array([40.1, 40.9, 41.2, 40.5, -10.5])
+    lon = np.array([-74.2, -74.9, -74.5, -73.5, 20.0])
+    centroid_lat, centroid_lon, members, offsets = cluster_stadiums(lat, lon, 1.0)
+    groups = [sorted(members[lo:hi]) for lo, hi in zip(offsets, np.append(offsets[1:], len(members)))]
+    assert sorted(groups) == [[0, 1], [2], [3], [4]]
+    for group, c_lat, c_lon in zip(groups, centroid_lat, centroid_lon):
+        assert (c_lat, c_lon) == (lat[group].mean(), lon[group].mean())
+
+
+def test_map_data_covers_every_team():
+    stadiums = load_stadiums()
+    data = json.loads(map_json({'NFL': '#013369'}))
+    assert data == json.loads(json.dumps(build_map_data({'NFL': '#013369'})))
+    assert data['colors'][data['leagues'].index('NFL')] == '#013369'
+    assert data['colors'][data['leagues'].index('NHL')] == '#444444'
+    for name, levels in data['maps'].items():
+        rows = np.arange(len(stadiums['Team'])) if name == 'all' else np.flatnonzero(stadiums['Sport'] == name.upper())
+        assert len(levels) == len(ZOOM_CELLS)
+        counts = [len(level['lat']) for level in levels]
+        # Every level holds each team once, and finer cells never merge more teams together
+        assert all(sorted(level['members']) == list(rows) for level in levels)
+        assert counts == sorted(counts)
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from stadiums import get_index, haversine, load_stadiums
+
+
+POINTS = [(41.8781, -87.6298), (34.0522, -118.2437), (47.6062, -122.3321), (25.7617, -80.1918), (45.5017, -73.5673)]
+
+
+@pytest.mark.parametrize('sport', [None, 'NHL', 'MLB'])
+@pytest.mark.parametrize('lat, lon', POINTS)
+def test_within_matches_brute_force(sport, lat, lon):
+    stadiums = load_stadiums()
+    rows = np.arange(len(stadiums['Team'])) if sport is None else np.flatnonzero(stadiums['Sport'] == sport)
+    miles = haversine(lat, lon, stadiums['Latitude'][rows], stadiums['Longitude'][rows])
+    for radius in (25.0, 300.0, 1000.0):
+        found, distance = get_index(sport).within(lat, lon, radius)
+        expected = rows[miles <= radius]
+        assert sorted(found) == sorted(expected)
+        assert (np.diff(distance) >= 0).all()
+        np.testing.assert_allclose(distance, haversine(lat, lon, stadiums['Latitude'][found],
+                                                       stadiums['Longitude'][found]), atol=1e-6)
+
+
+@pytest.mark.parametrize('lat, lon', POINTS)
+def test_nearest_matches_brute_force(lat, lon):
+    stadiums = load_stadiums()
+    miles = haversine(lat, lon, stadiums['Latitude'], stadiums['Longitude'])
+    rows, distance = get_index().nearest(lat, lon, k=4)
+    np.testing.assert_allclose(distance, np.sort(miles)[:4], atol=1e-6)
+    np.testing.assert_allclose(miles[rows], distance, atol=1e-6)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import games as game_store
+from standings import Standings, StandingsHistory
+
+
+def bruins(standings, field):
+    return standings.state[field][game_store.team_rows()['Boston Bruins']]
+
+
+def test_new_season_resets_counters(make_games):
+    games = make_games([
+        ('NHL', '2023-04-10', 'Boston Bruins', 'Buffalo Sabres', 3, 1),
+        ('NHL', '2023-04-12', 'Buffalo Sabres', 'Boston Bruins', 1, 4),
+        ('NHL', '2024-10-10', 'Buffalo Sabres', 'Boston Bruins', 2, 1),
+    ])
+    together = Standings()
+    together.record(games)
+    # Across two batches the reset happens on the new season's first result
+    apart = Standings()
+    apart.record({column: values[:2] for column, values in games.items()})
+    assert (bruins(apart, 'Wins'), bruins(apart, 'Streak')) == (2, 2)
+    apart.record({column: values[2:] for column, values in games.items()})
+    for standings in (together, apart):
+        assert bruins(standings, 'Season') == 2024
+        assert (bruins(standings, 'Wins'), bruins(standings, 'Losses'), bruins(standings, 'Streak')) == (0, 1, -1)
+        assert bruins(standings, 'AwayLosses') == 1 and bruins(standings, 'HomeWins') == 0
+
+
+def test_streaks_carry_between_batches(make_games):
+    games = make_games([
+        ('NHL', '2024-10-10', 'Boston Bruins', 'Buffalo Sabres', 3, 1),
+        ('NHL', '2024-10-12', 'Boston Bruins', 'Buffalo Sabres', 1, 2),
+        ('NHL', '2024-10-14', 'Boston Bruins', 'Buffalo Sabres', 1, 2),
+        ('NHL', '2024-10-16', 'Boston Bruins', 'Buffalo Sabres', 0, 5),
+        ('NHL', '2024-10-18', 'Boston Bruins', 'Buffalo Sabres', 2, 2),
+    ])
+    standings = Standings()
+    streaks = []
+    for i in range(5):
+        standings.record({column: values[i:i + 1] for column, values in games.items()})
+        streaks.append(bruins(standings, 'Streak'))
+    assert streaks == [1, -1, -2, -3, 0]
+    sabres = game_store.team_rows()['Buffalo Sabres']
+    assert standings.state['Streak'][sabres] == 0
+    assert bruins(standings, 'Ties') == 1 and bruins(standings, 'Losses') == 3
+
+
+@pytest.mark.parametrize('every', [1, 3, 7])
+def test_as_of_matches_replay(every):
+    archive = game_store.synthetic_archive(['NHL', 'NBA'], [2023, 2024])
+    archive = game_store.sort_games(archive)
+    history = StandingsHistory(archive, every=every)
+    dates = archive['Date'][np.random.default_rng(every).integers(0, len(archive['Date']), 12)]
+    for date in list(dates) + [np.datetime64('2030-01-01')]:
+        replay = Standings()
+        replay.record({column: values[archive['Date'] <= date] for column, values in archive.items()})
+        result = history.as_of(date)
+        for field, values in replay.state.items():
+            np.testing.assert_array_equal(result.state[field], values, err_msg=f'{field} as of {date}')
+    table = history.current.table('NHL')
+    assert (table['Wins'] + table['Losses'] + table['Ties'] == 82).all()
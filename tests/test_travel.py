@@ -0,0 +1,51 @@
+import numpy as np
+
+import games as game_store
+from stadiums import haversine, load_stadiums
+from travel import season_travel
+
+
+def miles_between(*teams):
+    """Great-circle miles along a route of team venues"""
+    ids = game_store.team_rows()
+    stadiums = load_stadiums()
+    lat = stadiums['Latitude'][[ids[team] for team in teams]]
+    lon = stadiums['Longitude'][[ids[team] for team in teams]]
+    return haversine(lat[:-1], lon[:-1], lat[1:], lon[1:]).sum()
+
+
+def test_travel_totals(make_games):
+    games = make_games([
+        ('MLB', '2024-04-01', 'New York Yankees', 'Boston Red Sox', 3, 2),
+        ('MLB', '2024-04-03', 'Boston Red Sox', 'New York Yankees', 1, 5),
+        ('MLB', '2024-04-05', 'Toronto Blue Jays', 'New York Yankees', 2, 0),
+        ('MLB', '2024-04-07', 'New York Yankees', 'Toronto Blue Jays', 4, 0),
+    ])
+    travel = season_travel(games)
+    ids = game_store.team_rows()
+    yankees = travel['Team'] == ids['New York Yankees']
+    assert travel['Games'][yankees] == [4]
+    route = miles_between('New York Yankees', 'Boston Red Sox', 'Toronto Blue Jays', 'New York Yankees')
+    np.testing.assert_allclose(travel['Miles'][yankees], route, rtol=1e-5)
+    np.testing.assert_allclose(travel['LongestTripMiles'][yankees], route, rtol=1e-5)
+    assert travel['LongestTripGames'][yankees] == [2]
+    assert travel['TimeZonesCrossed'][yankees] == [0]
+
+    # Boston plays once at home and once away: out to New York and straight back
+    red_sox = travel['Team'] == ids['Boston Red Sox']
+    there_and_back = miles_between('Boston Red Sox', 'New York Yankees', 'Boston Red Sox')
+    np.testing.assert_allclose(travel['Miles'][red_sox], there_and_back, rtol=1e-5)
+    assert travel['LongestTripGames'][red_sox] == [1]
+
+
+def test_time_zones_and_seasons(make_games):
+    games = make_games([
+        ('NBA', '2023-03-01', 'Los Angeles Lakers', 'Boston Celtics', 110, 100),
+        ('NBA', '2024-03-01', 'Boston Celtics', 'Los Angeles Lakers', 110, 100),
+    ])
+    travel = season_travel(games)
+    celtics = travel['Team'] == game_store.team_rows()['Boston Celtics']
+    assert list(travel['Season'][celtics]) == [2023, 2024]
+    # Boston to Los Angeles and back crosses three zones each way; a home-only season crosses none
+    assert list(travel['TimeZonesCrossed'][celtics]) == [6, 0]
+    assert travel['Miles'][celtics][1] == 0
@@ -0,0 +1,61 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+import games as game_store
+from distances import driving_hours, load_distance_matrix
+from stadiums import haversine, load_stadiums
+from trip_planner import MAX_DRIVE_HOURS, plan_trips
+
+
+@pytest.fixture(scope='module')
+def season():
+    return game_store.sort_games(game_store.synthetic_season('NBA', 2024))
+
+
+def exhaustive(games, n_games, first_day, n_days, origin=None):
+    """Every feasible itinerary's miles, by brute force over game combinations"""
+    miles = np.asarray(load_distance_matrix()).astype(np.float64)
+    first = np.datetime64(first_day, 'D')
+    rows = np.flatnonzero((games['Date'] >= first) & (games['Date'] < first + n_days))
+    stadiums = load_stadiums()
+    totals = []
+    for trip in combinations(rows, n_games):
+        venue = games['Home'][list(trip)]
+        day = (games['Date'][list(trip)] - first).astype(np.int64)
+        gap = np.diff(day)
+        legs = miles[venue[:-1], venue[1:]]
+        if len(set(venue)) < n_games or (gap <= 0).any() or (driving_hours(legs) > MAX_DRIVE_HOURS * gap).any():
+            continue
+        total = legs.sum()
+        if origin is not None:
+            ends = venue[[0, -1]]
+            total += haversine(origin[0], origin[1], stadiums['Latitude'][ends], stadiums['Longitude'][ends]).sum()
+        totals.append(total)
+    return sorted(totals)
+
+
+@pytest.mark.parametrize('origin', [None, (40.7128, -74.0060)])
+def test_best_itineraries_match_exhaustive_search(season, origin):
+    trips = plan_trips(season, 3, 4, '2025-01-10', k=5, origin=origin)
+    expected = exhaustive(season, 3, '2025-01-10', 4, origin)
+    assert len(trips) == min(5, len(expected))
+    np.testing.assert_allclose([miles for miles, _ in trips], expected[:5], rtol=1e-9)
+    for miles, path in trips:
+        assert (np.diff(season['Date'][list(path)]) > np.timedelta64(0, 'D')).all()
+
+
+def test_windows_search_every_start_day(season):
+    merged = plan_trips(season, 3, 4, '2025-01-10', '2025-01-12', k=3)
+    single = [trip for day in ('2025-01-10', '2025-01-11', '2025-01-12')
+              for trip in plan_trips(season, 3, 4, day, k=3)]
+    # Overlapping windows find some itineraries twice; the merge keeps each once
+    distinct = {path: miles for miles, path in single}
+    assert [miles for miles, _ in merged] == sorted(distinct.values())[:3]
+    assert len({path for _, path in merged}) == len(merged)
+
+
+def test_window_without_games(season):
+    assert plan_trips(season, 3, 4, '2024-07-01') == []
+    assert plan_trips(season, 1, 4, '2024-07-01') == []
@@ -0,0 +1,104 @@
+import time
+
+import numpy as np
+
+import games as game_store
+from distances import load_distance_matrix
+from stadiums import load_stadiums
+
+
+# Longitudes where US/Canadian time zones change, west to east (Pacific, Mountain, Central, Eastern).
+# Zone lines follow state borders, but for the venues in Data/stadiums.csv these cuts agree.
+TIME_ZONE_EDGES = np.array([-114.5, -102.0, -86.5])
+
+
+def venue_time_zones():
+    """Time zone index of every venue: 0 Pacific, 1 Mountain, 2 Central, 3 Eastern"""
+    return np.searchsorted(TIME_ZONE_EDGES, load_stadiums()['Longitude'])
+
+
+def season_travel(games):
+    """Travel totals for every team and season in a game store, computed without per-game loops
+
+    Each team starts the season at home, travels directly between consecutive game
+    venues and returns home after its last game. Returns columns 'Team', 'Season',
+    'Games', 'Miles', 'LongestTripMiles', 'LongestTripGames' and 'TimeZonesCrossed',
+    one entry per (team, season).
+    """
+    miles = np.asarray(load_distance_matrix())
+    zones = venue_time_zones()
+    rows = game_store.team_game_rows(games)
+    team, venue, season = rows['Team'], rows['Venue'], rows['Season']
+    n = len(team)
+
+    starts, is_start = game_store.group_starts(team, season)
+    ends = np.append(starts[1:], n) - 1
+
+    # Where each team comes from before each game: home at a season start, else the last venue
+    previous = np.empty(n, dtype=venue.dtype)
+    previous[1:] = venue[:-1]
+    previous[is_start] = team[is_start]
+    legs = miles[previous, venue]
+    zone_changes = np.abs(zones[venue] - zones[previous])
+
+    # Closing leg home after the season's last game
+    return_miles = miles[venue[ends], team[ends]]
+    return_zones = np.abs(zones[team[ends]] - zones[venue[ends]])
+
+    total_miles = np.add.reduceat(legs, starts) + return_miles if n else np.zeros(0)
+    total_zones = np.add.reduceat(zone_changes, starts) + return_zones if n else np.zeros(0, int)
+
+    # Road trips are runs of consecutive away games within a team-season. A trip's
+    # miles are the legs into each of its games plus the leg back home afterwards.
+    away = ~rows['IsHome']
+    trip_start = away & (is_start | np.concatenate([[True], ~away[:-1]]))
+    trip_id = np.cumsum(trip_start) - 1
+    trip_rows = np.flatnonzero(away)
+    trip_of = trip_id[trip_rows]
+    n_trips = trip_start.sum()
+    trip_miles = np.bincount(trip_of, weights=legs[trip_rows], minlength=n_trips)
+    trip_games = np.bincount(trip_of, minlength=n_trips)
+    last_row = np.zeros(n_trips, dtype=np.intp)
+    last_row[trip_of] = trip_rows  # rows are increasing, so the last write per trip wins
+    trip_miles += miles[venue[last_row], team[last_row]]
+
+    # Longest trip per team-season: group of each trip from its first row
+    group_of_row = np.cumsum(is_start) - 1
+    trip_group = group_of_row[np.flatnonzero(trip_start)]
+    longest_miles = np.zeros(len(starts))
+    longest_games = np.zeros(len(starts), dtype=np.int64)
+    if n_trips:
+        # Sort trips by (group, miles) so the last trip of each group is its longest
+        order = np.lexsort((trip_miles, trip_group))
+        last_of_group = np.flatnonzero(np.append(trip_group[order][1:] != trip_group[order][:-1], True))
+        best = order[last_of_group]
+        longest_miles[trip_group[best]] = trip_miles[best]
+        longest_games[trip_group[best]] = trip_games[best]
+
+    return {
+        'Team': team[starts],
+        'Season': season[starts],
+        'Games': ends - starts + 1,
+        'Miles': total_miles,
+        'LongestTripMiles': longest_miles,
+        'LongestTripGames': longest_games,
+        'TimeZonesCrossed': total_zones,
+    }
+
+
+if __name__ == '__main__':
+    archive = game_store.demo_games()
+
+    start = time.perf_counter()
+    travel = season_travel(archive)
+    elapsed = time.perf_counter() - start
+    print(f"✓ {len(archive['Date'])} games, {len(travel['Team'])} team-seasons in {elapsed:.2f}s")
+
+    teams = load_stadiums()['Team']
+    latest = travel['Season'] == travel['Season'].max()
+    order = np.argsort(-travel['Miles'][latest])[:5]
+    print(f"\nMost miles traveled in {travel['Season'].max()}:")
+    for i in np.flatnonzero(latest)[order]:
+        print(f"  {teams[travel['Team'][i]]:<28} {travel['Miles'][i]:8.0f} mi  "
+              f"longest trip {travel['LongestTripMiles'][i]:6.0f} mi ({travel['LongestTripGames'][i]} games)  "
+              f"{travel['TimeZonesCrossed'][i]} zone changes")
@@ -0,0 +1,167 @@
+import argparse
+import heapq
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+import games as game_store
+from distances import driving_hours, load_distance_matrix
+from stadiums import haversine, load_stadiums
+
+
+# Default cap on driving between games: hours per day between them
+MAX_DRIVE_HOURS = 8.0
+
+# Game store shared by the search workers, set by _init_trip_worker
+_trip_context = {}
+
+
+def _init_trip_worker(games):
+    """Load the game store into a search worker"""
+    _trip_context['games'] = games
+    _window_tables.cache_clear()
+    _plan_window.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _window_tables(first, n_days, leagues, origin, max_drive_hours):
+    """Games in a window, the travel cost between them and the lower-bound table
+
+    cost[i, j] is the miles from game i's venue to game j's, or inf when j cannot
+    follow i: it is not on a later day, is the same team's venue again, or needs
+    more driving than max_drive_hours per day in between. bound[i, r] is the
+    cheapest way to see r games starting with game i when teams may repeat, which
+    is never more than the real best and so prunes the branch-and-bound search.
+    """
+    games = _trip_context['games']
+    first = np.datetime64(first, 'D')
+    lo, hi = np.searchsorted(games['Date'], [first, first + n_days])
+    rows = np.arange(lo, hi)
+    if leagues is not None:
+        rows = rows[np.isin(games['League'][rows], leagues)]
+    venue = games['Home'][rows]
+    day = (games['Date'][rows] - first).astype(np.int64)
+
+    miles = np.asarray(load_distance_matrix())[np.ix_(venue, venue)].astype(np.float64)
+    gap = day[None, :] - day[:, None]
+    reachable = (gap > 0) & (driving_hours(miles) <= max_drive_hours * gap) & (venue[:, None] != venue[None, :])
+    cost = np.where(reachable, miles, np.inf)
+
+    if origin is None:
+        start_cost = end_cost = np.zeros(len(rows))
+    else:
+        stadiums = load_stadiums()
+        start_cost = end_cost = haversine(origin[0], origin[1], stadiums['Latitude'][venue], stadiums['Longitude'][venue])
+
+    # At least one column past bound[:, 1], so a window without games just finds nothing
+    max_games = max(min(len(rows), n_days), 1)
+    bound = np.full((len(rows), max_games + 1), np.inf)
+    bound[:, 1] = end_cost
+    for r in range(2, max_games + 1):
+        bound[:, r] = (cost + bound[None, :, r - 1]).min(axis=1, initial=np.inf)
+    return rows, cost, start_cost, bound
+
+
+@lru_cache(maxsize=1024)
+def _plan_window(first, n_days, n_games, k, leagues, origin, max_drive_hours):
+    """Up to k cheapest itineraries of n_games games within one window, as (miles, game rows)"""
+    rows, cost, start_cost, bound = _window_tables(first, n_days, leagues, origin, max_drive_hours)
+    if n_games >= bound.shape[1]:
+        return ()
+    venue = _trip_context['games']['Home'][rows]
+    best = []  # max-heap of (-miles, path) holding the k best itineraries so far
+
+    def limit():
+        return -best[0][0] if len(best) == k else np.inf
+
+    def search(i, remaining, miles, path, visited):
+        if remaining == 1:
+            total = miles + bound[i, 1]
+            if total < limit():
+                heapq.heappush(best, (-total, path))
+                if len(best) > k:
+                    heapq.heappop(best)
+            return
+        estimate = miles + cost[i] + bound[:, remaining - 1]
+        for j in np.argsort(estimate):
+            if estimate[j] >= limit():
+                break  # sorted, so every later branch is pruned too
+            if venue[j] in visited:
+                continue
+            search(j, remaining - 1, miles + cost[i, j], path + (j,), visited | {venue[j]})
+
+    for i in np.argsort(start_cost + bound[:, n_games]):
+        if start_cost[i] + bound[i, n_games] >= limit():
+            break
+        search(i, n_games, start_cost[i], (i,), frozenset([venue[i]]))
+    return tuple((float(-miles), tuple(int(rows[j]) for j in path)) for miles, path in sorted(best, reverse=True))
+
+
+def _plan_window_job(args):
+    return _plan_window(*args)
+
+
+def plan_trips(games, n_games, n_days, first_day, last_day=None, k=5, leagues=None,
+               origin=None, max_drive_hours=MAX_DRIVE_HOURS, max_workers=1):
+    """Best itineraries for seeing n_games games within n_days days
+
+    Every window of n_days days starting between first_day and last_day is searched
+    (in parallel when max_workers > 1) and the k shortest itineraries overall are
+    returned as (miles, game indices) pairs. Itineraries see one game a day at
+    different teams' venues; with an origin (lat, lon) the miles include getting
+    there and back.
+    """
+    first_day = np.datetime64(first_day, 'D')
+    last_day = first_day if last_day is None else np.datetime64(last_day, 'D')
+    leagues = None if leagues is None else tuple(sorted(leagues))
+    origin = None if origin is None else tuple(map(float, origin))
+    jobs = [
+        (str(first_day + offset), n_days, n_games, k, leagues, origin, max_drive_hours)
+        for offset in range(int((last_day - first_day).astype(int)) + 1)
+    ]
+    if max_workers == 1 or len(jobs) == 1:
+        if _trip_context.get('games') is not games:
+            _init_trip_worker(games)
+        results = map(_plan_window_job, jobs)
+        return _merge(results, k)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_trip_worker, initargs=(games,)) as pool:
+        return _merge(pool.map(_plan_window_job, jobs, chunksize=max(1, len(jobs) // 16)), k)
+
+
+def _merge(results, k):
+    """k cheapest distinct itineraries across windows; overlapping windows can find the same one"""
+    seen = {}
+    for result in results:
+        for miles, path in result:
+            seen[path] = miles
+    return [(miles, path) for path, miles in heapq.nsmallest(k, seen.items(), key=lambda item: item[1])]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Plan the shortest trips to see N games in M days')
+    parser.add_argument('--games', type=int, default=5)
+    parser.add_argument('--days', type=int, default=10)
+    parser.add_argument('--from', dest='first_day', default='2024-04-01')
+    parser.add_argument('--to', dest='last_day', default='2024-04-30')
+    parser.add_argument('--leagues', nargs='*')
+    parser.add_argument('--near', type=float, nargs=2, metavar=('LAT', 'LON'))
+    parser.add_argument('--top', type=int, default=5)
+    parser.add_argument('--jobs', type=int, default=1)
+    args = parser.parse_args()
+
+    archive = game_store.demo_games()
+
+    start = time.perf_counter()
+    trips = plan_trips(archive, args.games, args.days, args.first_day, args.last_day, k=args.top,
+                       leagues=args.leagues, origin=args.near, max_workers=args.jobs)
+    print(f"✓ Searched {args.days}-day windows from {args.first_day} to {args.last_day} "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    teams = load_stadiums()['Team']
+    for rank, (miles, path) in enumerate(trips, 1):
+        print(f"\n{rank}. {miles:.0f} mi")
+        for game in path:
+            print(f"   {archive['Date'][game]}  {archive['League'][game]:<4} "
+                  f"{teams[archive['Away'][game]]} at {teams[archive['Home'][game]]}")